@@ -0,0 +1,43 @@
+"""Compare client key algorithms: key generation, signing and profile size.
+
+Run with: python benchmarks/bench_algorithms.py [count]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_issuance import build_native_pki
+from cryptography.hazmat.primitives import serialization
+
+from ovpn_portal.core.pki import KEY_ALGORITHMS, NativeBackend
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f"{'algorithm':<10} {'keygen ms':>10} {'sign ms':>10} {'cert+key bytes':>15}")
+    for algorithm in KEY_ALGORITHMS:
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = NativeBackend(build_native_pki(Path(tmp)), algorithm=algorithm)
+            backend.load_ca()
+
+            started = time.perf_counter()
+            keys = [backend.generate_key() for _ in range(count)]
+            keygen = (time.perf_counter() - started) / count
+
+            started = time.perf_counter()
+            certs = [backend.issue(f"{algorithm}-user{i}@example.com", key=key) for i, key in enumerate(keys)]
+            sign = (time.perf_counter() - started) / count
+
+            size = len(certs[0].public_bytes(serialization.Encoding.PEM)) + len(
+                keys[0].private_bytes(
+                    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+                )
+            )
+            print(f"{algorithm:<10} {keygen * 1000:10.2f} {sign * 1000:10.2f} {size:15d}")
+
+
+if __name__ == "__main__":
+    main()
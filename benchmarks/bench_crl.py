@@ -0,0 +1,48 @@
+"""Measure revoking a batch of certificates and republishing the CRL.
+
+Run with: python benchmarks/bench_crl.py [count]
+
+Certificates are registered without being signed, since only their serials
+and expiry matter to revocation.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_issuance import build_native_pki
+
+from ovpn_portal.core.crl import RevocationList
+from ovpn_portal.core.pki import NativeBackend, format_serial
+from ovpn_portal.core.registry import VALID, CertificateRegistry
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = NativeBackend(build_native_pki(Path(tmp)))
+        registry = CertificateRegistry(Path(tmp) / "portal.db")
+        serials = [format_serial(0x1000 + i) for i in range(count)]
+        with registry.db.transaction() as db:
+            db.executemany(
+                "INSERT INTO certificates (serial, email, not_after, status) VALUES (?, ?, ?, ?)",
+                [(serial, f"user{i}@example.com", time.time() + 86400, VALID) for i, serial in enumerate(serials)],
+            )
+
+        revocation = RevocationList(backend, registry, [Path(tmp) / "crl.pem"])
+
+        started = time.perf_counter()
+        revocation.revoke(serials)
+        elapsed = time.perf_counter() - started
+        print(f"revoke {count} certs + publish CRL: {elapsed * 1000:8.1f} ms")
+
+        started = time.perf_counter()
+        revocation.publish()
+        elapsed = time.perf_counter() - started
+        print(f"republish CRL with {count} entries:  {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
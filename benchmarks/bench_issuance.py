@@ -0,0 +1,87 @@
+"""Compare client certificate issuance through easy-rsa and in-process signing.
+
+Run with: python benchmarks/bench_issuance.py [count]
+
+The easy-rsa half only runs when an ``easyrsa`` executable is on PATH.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ovpn_portal.core.pki import EasyRSABackend, NativeBackend
+
+
+def build_pki(root: Path) -> Path:
+    """Create an easy-rsa directory with a passphrase-less CA."""
+    easy_rsa_dir = root / "easy-rsa"
+    easy_rsa_dir.mkdir()
+    env = dict(os.environ, EASYRSA_BATCH="1", EASYRSA_REQ_CN="Benchmark CA")
+    subprocess.run(["easyrsa", "init-pki"], cwd=easy_rsa_dir, env=env, check=True, capture_output=True)
+    subprocess.run(["easyrsa", "build-ca", "nopass"], cwd=easy_rsa_dir, env=env, check=True, capture_output=True)
+    (easy_rsa_dir / "easyrsa").symlink_to(shutil.which("easyrsa"))
+    return easy_rsa_dir
+
+
+def build_native_pki(root: Path) -> Path:
+    """Create the same layout without easy-rsa, signing the CA with cryptography."""
+    import datetime
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    easy_rsa_dir = root / "easy-rsa"
+    (easy_rsa_dir / "pki" / "private").mkdir(parents=True)
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Benchmark CA")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=3650))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    (easy_rsa_dir / "pki" / "ca.crt").write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    (easy_rsa_dir / "pki" / "private" / "ca.key").write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    (easy_rsa_dir / "pki" / "index.txt").touch()
+    return easy_rsa_dir
+
+
+def run(label, backend, count):
+    started = time.perf_counter()
+    for i in range(count):
+        backend.issue(f"{label}-user{i}@example.com")
+    elapsed = time.perf_counter() - started
+    print(f"{label:<10} {count} certs in {elapsed:7.2f}s  ({elapsed / count * 1000:8.1f} ms/cert)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if shutil.which("easyrsa"):
+            easy_rsa_dir = build_pki(Path(tmp))
+            os.environ["EASYRSA_BATCH"] = "1"
+            run("easyrsa", EasyRSABackend(easy_rsa_dir), count)
+        else:
+            easy_rsa_dir = build_native_pki(Path(tmp))
+            print("easyrsa    not found on PATH, skipped")
+
+        run("native", NativeBackend(easy_rsa_dir), count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare the old five-pass str.replace rendering with the compiled template.
+
+Run with: python benchmarks/bench_template.py
+"""
+
+import timeit
+import tracemalloc
+from pathlib import Path
+
+from ovpn_portal.core.template import CompiledTemplate
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "src" / "ovpn_portal" / "core" / "templates" / "client.ovpn"
+
+PEM = "-----BEGIN CERTIFICATE-----\n" + ("A" * 64 + "\n") * 28 + "-----END CERTIFICATE-----"
+VALUES = {
+    "EXTERNAL_IP": "203.0.113.1",
+    "CA_CERT": PEM,
+    "CLIENT_CERT": PEM,
+    "CLIENT_KEY": PEM.replace("CERTIFICATE", "PRIVATE KEY"),
+    "TLS_AUTH": "-----BEGIN OpenVPN Static key V1-----\n"
+    + ("f" * 32 + "\n") * 16
+    + "-----END OpenVPN Static key V1-----",
+}
+
+
+def render_replace(text):
+    config = text
+    for key, value in VALUES.items():
+        config = config.replace("{{" + key + "}}", value)
+    return config
+
+
+def measure(label, func, number=20000):
+    seconds = timeit.timeit(func, number=number)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {seconds / number * 1e6:8.2f} us/render  peak {peak / 1024:7.1f} KiB")
+
+
+def main():
+    text = TEMPLATE_PATH.read_text()
+    compiled = CompiledTemplate(text)
+    assert render_replace(text) == compiled.render(VALUES)
+
+    measure("read + str.replace x5", lambda: render_replace(TEMPLATE_PATH.read_text()))
+    measure("str.replace x5", lambda: render_replace(text))
+    measure("compiled single join", lambda: compiled.render(VALUES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import click
+
+from ...core.vpn import VPNManager
+
+
+@click.command("migrate-layout")
+@click.option("--dry-run", is_flag=True, help="Only list the users that would be moved")
+@click.pass_context
+def migrate_layout(ctx, dry_run):
+    """Move client certificates from OPENVPN_DIR into the sharded key store"""
+    keys = VPNManager(ctx.obj["config"]).keys
+
+    if dry_run:
+        for name in keys.legacy_names():
+            click.echo(name)
+        return
+
+    moved = keys.migrate()
+    click.echo(f"Moved {moved} users to {keys.root}")
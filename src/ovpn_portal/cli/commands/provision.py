@@ -0,0 +1,117 @@
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import click
+
+from ...core.vpn import VPNManager
+
+_vpn_manager = None
+
+
+def read_emails(path) -> list:
+    """Read emails from a plain list (one per line) or a CSV with an ``email`` column.
+
+    Blank lines and ``#`` comments are ignored, and duplicates are dropped
+    while keeping the original order.
+    """
+    with open(path, newline="") as f:
+        lines = [line for line in f.read().splitlines() if line.strip() and not line.lstrip().startswith("#")]
+
+    if lines and "," in lines[0]:
+        rows = list(csv.reader(lines))
+        header = [column.strip().lower() for column in rows[0]]
+        if "email" in header:
+            column = header.index("email")
+            rows = rows[1:]
+        else:
+            column = 0
+        emails = [row[column].strip() for row in rows if len(row) > column]
+    else:
+        emails = [line.strip() for line in lines]
+
+    return list(dict.fromkeys(email for email in emails if email))
+
+
+def _init_worker(config):
+    global _vpn_manager
+    _vpn_manager = VPNManager(config)
+
+
+def provision_user(email: str, render: bool = True) -> tuple:
+    """Issue (and optionally render) one user's profile; return ``(email, status, detail)``.
+
+    Runs in a pool process. Users who already have valid certificates are
+    skipped, so an interrupted run can simply be started again; expired or
+    revoked ones are reissued, as a download would.
+    """
+    vpn_manager = _vpn_manager
+    try:
+        if vpn_manager.has_client_certificates(email):
+            status = "skipped"
+        else:
+            status = "reissued" if vpn_manager.registry.known(email) else "issued"
+            vpn_manager.ensure_client_certificates(email)
+
+        if render:
+            vpn_manager.generate_config(email)
+        return email, status, None
+    except Exception as e:
+        return email, "failed", str(e)
+
+
+@click.command()
+@click.argument("emails", nargs=-1)
+@click.option(
+    "--file",
+    "email_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File with one email per line, or a CSV with an 'email' column",
+)
+@click.option("--workers", default=os.cpu_count() or 1, show_default=True, help="Number of issuing processes")
+@click.option(
+    "--render/--no-render",
+    default=True,
+    help="Render each profile after issuance to check it (and fill PROFILE_CACHE_DIR when set)",
+)
+@click.pass_context
+def provision(ctx, emails, email_file, workers, render):
+    """Issue client certificates for many users in parallel"""
+    config = ctx.obj["config"]
+
+    users = list(emails)
+    if email_file:
+        users += read_emails(email_file)
+    users = list(dict.fromkeys(users))
+    if not users:
+        raise click.UsageError("Give emails as arguments or with --file.")
+
+    if not (Path(config.OPENVPN_DIR) / "easy-rsa").exists():
+        raise click.ClickException("easy-rsa directory not found. Run setup first.")
+
+    counts = {"issued": 0, "reissued": 0, "skipped": 0, "failed": 0}
+    failures = []
+    started = time.monotonic()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as executor:
+        futures = [executor.submit(provision_user, email, render) for email in users]
+        with click.progressbar(as_completed(futures), length=len(futures), label="Provisioning") as results:
+            for future in results:
+                email, status, detail = future.result()
+                counts[status] += 1
+                if detail:
+                    failures.append((email, status, detail))
+
+    elapsed = time.monotonic() - started
+    rate = (counts["issued"] + counts["reissued"]) / elapsed if elapsed else 0.0
+    click.echo(
+        f"{len(users)} users in {elapsed:.1f}s: {counts['issued']} issued ({rate:.1f}/s), "
+        f"{counts['reissued']} reissued, {counts['skipped']} already provisioned, {counts['failed']} failed"
+    )
+    for email, status, detail in failures:
+        click.echo(f"  {email}: {status}: {detail}", err=True)
+
+    if counts["failed"]:
+        ctx.exit(1)
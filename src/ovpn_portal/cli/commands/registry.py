@@ -0,0 +1,123 @@
+import time
+from pathlib import Path
+
+import click
+
+from ...core.db import portal_db_path
+from ...core.registry import CertificateRegistry
+from ...core.renewal import RenewalScheduler
+from ...core.vpn import VPNManager
+from .provision import read_emails
+
+
+@click.command("rebuild-registry")
+@click.pass_context
+def rebuild_registry(ctx):
+    """Rebuild the certificate registry from easy-rsa's index.txt"""
+    config = ctx.obj["config"]
+    pki_dir = Path(config.OPENVPN_DIR) / "easy-rsa" / "pki"
+
+    if not (pki_dir / "index.txt").exists():
+        raise click.ClickException(f"{pki_dir / 'index.txt'} not found. Run setup first.")
+
+    registry = CertificateRegistry(portal_db_path(config))
+    count = registry.rebuild(pki_dir)
+    stats = registry.stats()
+    click.echo(
+        f"Imported {count} certificates: {stats['valid']} valid, {stats['revoked']} revoked, {stats['expired']} expired"
+    )
+
+
+@click.command()
+@click.argument("emails", nargs=-1)
+@click.option(
+    "--file",
+    "email_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File with one email per line, or a CSV with an 'email' column",
+)
+@click.option("--serial", "serials", multiple=True, help="Only revoke these serials (hex)")
+@click.option("--keep-access", is_flag=True, help="Let the users download new certificates instead of disabling them")
+@click.pass_context
+def revoke(ctx, emails, email_file, serials, keep_access):
+    """Revoke users' certificates, disable them and publish a new CRL"""
+    config = ctx.obj["config"]
+
+    users = list(emails)
+    if email_file:
+        users += read_emails(email_file)
+    if not users:
+        raise click.UsageError("Give emails as arguments or with --file.")
+
+    started = time.monotonic()
+    revoked = VPNManager(config).revoke_certificates(users, serials=serials or None, disable=not keep_access)
+
+    elapsed = time.monotonic() - started
+    click.echo(f"Revoked {len(revoked)} certificates for {len(users)} users in {elapsed:.2f}s; CRL updated")
+
+
+@click.command()
+@click.argument("emails", nargs=-1, required=True)
+@click.pass_context
+def enable(ctx, emails):
+    """Let users disabled by revoke sign in and get certificates again"""
+    vpn = VPNManager(ctx.obj["config"])
+    for email in emails:
+        if vpn.enable_user(email):
+            click.echo(f"Enabled {email}")
+        else:
+            click.echo(f"{email} was not disabled")
+
+
+@click.command("publish-crl")
+@click.option("--if-due", is_flag=True, help="Only publish when the current CRL is close to its next update")
+@click.pass_context
+def publish_crl(ctx, if_due):
+    """Republish the CRL so it does not expire"""
+    config = ctx.obj["config"]
+    revocation = VPNManager(config).revocation
+
+    crl = revocation.refresh() if if_due else revocation.publish()
+    if crl is None:
+        click.echo("CRL is up to date")
+        return
+    click.echo(f"Published CRL with {len(crl)} revoked certificates, next update {crl.next_update_utc:%Y-%m-%d}")
+
+
+@click.command()
+@click.option("--days", type=float, default=None, help="Renew certificates expiring within this many days")
+@click.option("--rate", type=float, default=None, help="Maximum renewals per second")
+@click.option("--dry-run", is_flag=True, help="Only list the certificates that would be renewed")
+@click.pass_context
+def renew(ctx, days, rate, dry_run):
+    """Renew client certificates that are about to expire"""
+    config = ctx.obj["config"]
+    scheduler = RenewalScheduler(
+        VPNManager(config),
+        window_days=config.RENEWAL_WINDOW_DAYS if days is None else days,
+        batch_size=config.RENEWAL_BATCH_SIZE,
+        rate=config.RENEWAL_RATE if rate is None else rate,
+    )
+
+    if dry_run:
+        for row in scheduler.due(limit=-1):
+            expires = time.strftime("%Y-%m-%d", time.gmtime(row["not_after"]))
+            click.echo(f"{row['email']}\t{row['serial']}\texpires {expires}")
+        return
+
+    totals = {"renewed": 0, "superseded": 0, "failed": 0}
+    started = time.monotonic()
+    while True:
+        result = scheduler.run_once()
+        if result is None:
+            raise click.ClickException("A renewal pass is already running in another process.")
+        for key in totals:
+            totals[key] += result[key]
+        # Stop once a batch makes no progress, e.g. only failures are left
+        if not result["renewed"] and not result["superseded"]:
+            break
+
+    elapsed = time.monotonic() - started
+    click.echo(f"Renewed {totals['renewed']} certificates in {elapsed:.1f}s, {totals['failed']} failed")
+    if totals["failed"]:
+        ctx.exit(1)
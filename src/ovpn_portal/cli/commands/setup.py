@@ -3,13 +3,22 @@ import subprocess
 
 import click
 
+from ...core.pki import KEY_ALGORITHMS, easyrsa_env
+
 
 @click.command()
 @click.option("--force", is_flag=True, help="Force setup even if already configured")
+@click.option(
+    "--algorithm",
+    type=click.Choice(KEY_ALGORITHMS),
+    default=None,
+    help="Key algorithm for the CA and server certificates (default: CA_KEY_ALGORITHM)",
+)
 @click.pass_context
-def setup(ctx, force):
+def setup(ctx, force, algorithm):
     """Initialize OpenVPN configuration"""
     config = ctx.obj["config"]
+    env = easyrsa_env(algorithm or config.CA_KEY_ALGORITHM)
 
     if not os.path.exists(config.OPENVPN_DIR) or force:
         click.echo("Setting up OpenVPN configuration...")
@@ -27,7 +36,7 @@ def setup(ctx, force):
         # Generate CA if it doesn't exist
         if not os.path.exists(os.path.join(config.OPENVPN_DIR, "ca.crt")) or force:
             click.echo("Generating CA certificate...")
-            subprocess.run(["easyrsa", "build-ca"], cwd=easy_rsa_dir, check=True)
+            subprocess.run(["easyrsa", "build-ca"], cwd=easy_rsa_dir, check=True, env=env)
 
         # Generate server certificates
         if not os.path.exists(os.path.join(config.OPENVPN_DIR, "server.crt")) or force:
@@ -36,6 +45,7 @@ def setup(ctx, force):
                 ["easyrsa", "build-server-full", "server"],
                 cwd=easy_rsa_dir,
                 check=True,
+                env=env,
             )
 
         # Generate ta.key if it doesn't exist
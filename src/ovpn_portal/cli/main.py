@@ -2,6 +2,9 @@ import click
 
 from ..core.config import Config
 from .commands.dev import run_dev
+from .commands.migrate import migrate_layout
+from .commands.provision import provision
+from .commands.registry import enable, publish_crl, rebuild_registry, renew, revoke
 from .commands.serve import serve
 from .commands.setup import setup
 from .commands.version import version
@@ -16,6 +19,13 @@ def cli(ctx):
 
 
 cli.add_command(run_dev)
+cli.add_command(enable)
+cli.add_command(migrate_layout)
+cli.add_command(provision)
+cli.add_command(rebuild_registry)
+cli.add_command(publish_crl)
+cli.add_command(renew)
+cli.add_command(revoke)
 cli.add_command(serve)
 cli.add_command(setup)
 cli.add_command(version)
@@ -1,23 +1,181 @@
-from google.auth.transport import requests
+import hashlib
+import threading
+import time
+
+from google.auth.exceptions import TransportError
 from google.oauth2 import id_token
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+
+from .cache import TTLCache
+from .oidc import OIDCProvider
+from .transport import get_certs_request
+
+SESSION_TOKEN_SALT = "ovpn-portal-session"
+
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def profile_claims(idinfo: dict) -> dict:
+    """Keep the ID token claims that select a user's profile template."""
+    groups = idinfo.get("groups") or []
+    if isinstance(groups, str):
+        groups = [groups]
+    claims = {"email": idinfo.get("email", "")}
+    if idinfo.get("hd"):
+        claims["hd"] = idinfo["hd"]
+    if groups:
+        claims["groups"] = [str(group) for group in groups]
+    return claims
+
+
+def shared_token_cache(config) -> TTLCache:
+    """Return the process-wide cache of verified tokens."""
+    global _token_cache
+
+    with _token_cache_lock:
+        if _token_cache is None:
+            _token_cache = TTLCache(maxsize=config.TOKEN_CACHE_SIZE, ttl=config.TOKEN_CACHE_TTL)
+        return _token_cache
 
 
 class AuthManager:
     """Manages authentication operations."""
 
-    def __init__(self, config):
+    def __init__(self, config, token_cache=None, registry=None):
         self.config = config
+        # Certificate registry holding the users an administrator disabled
+        self.registry = registry
+        self.request = get_certs_request()
+        self.token_cache = token_cache if token_cache is not None else shared_token_cache(config)
+        self.failed_tokens = TTLCache(maxsize=config.NEGATIVE_CACHE_SIZE, ttl=config.NEGATIVE_CACHE_TTL)
+        self.provider = None
+        if config.OIDC_ISSUER:
+            self.provider = OIDCProvider(config.OIDC_ISSUER, config.CLIENT_ID, ttl=config.OIDC_CACHE_TTL)
+
+    def _session_serializer(self) -> URLSafeTimedSerializer:
+        return URLSafeTimedSerializer(
+            self.config.SECRET_KEY,
+            salt=SESSION_TOKEN_SALT,
+            signer_kwargs={"digest_method": hashlib.sha256},
+        )
+
+    def issue_session_token(self, email: str, claims: dict = None) -> str:
+        """Mint a short-lived portal token for an already verified email.
+
+        ``claims`` (see ``profile_claims``) are carried along so later
+        requests can pick the user's profile template.
+        """
+        if claims and set(claims) - {"email"}:
+            return self._session_serializer().dumps(dict(claims, email=email))
+        return self._session_serializer().dumps(email)
+
+    def _load_session_claims(self, token: str) -> dict:
+        try:
+            payload = self._session_serializer().loads(token, max_age=self.config.SESSION_TOKEN_TTL)
+        except SignatureExpired:
+            raise ValueError("Session token expired")
+
+        claims = payload if isinstance(payload, dict) else {"email": payload}
+        if not claims.get("email", "").endswith("@" + self.config.ALLOWED_DOMAIN):
+            raise ValueError("Invalid email domain")
+
+        return claims
+
+    def _load_session_token(self, token: str) -> str:
+        return self._load_session_claims(token)["email"]
+
+    def verify_session_token(self, token: str) -> str:
+        """Validate a portal token with a local HMAC check and return its email."""
+        try:
+            return self._load_session_token(token)
+        except BadSignature:
+            raise ValueError("Invalid session token")
+
+    def check_enabled(self, email: str) -> str:
+        """Return ``email`` unless an administrator has disabled the user."""
+        if self.registry is not None and self.registry.is_disabled(email):
+            raise ValueError("User has been disabled")
+        return email
+
+    def authenticate(self, token: str) -> str:
+        """Return the email for a portal session token or, failing that, an ID token.
+
+        Users an administrator disabled are rejected even with a token that
+        is otherwise valid. Tokens that fail are remembered briefly so repeats
+        are rejected without parsing or signature work. Failures caused by a
+        transport error while fetching signing keys are not remembered.
+        """
+        digest = token_digest(token)
+        error = self.failed_tokens.get(digest)
+        if error is not None:
+            raise ValueError(error)
+
+        try:
+            try:
+                email = self._load_session_token(token)
+            except BadSignature:
+                email = self.verify_token(token)
+            return self.check_enabled(email)
+        except Exception as e:
+            if not isinstance(e.__cause__, TransportError):
+                self.failed_tokens.set(digest, str(e))
+            raise
+
+    def verify_id_token(self, token: str) -> dict:
+        """Verify an ID token's signature and audience and return its claims.
+
+        Tokens come from the configured OIDC issuer, or from Google when
+        OIDC_ISSUER is not set.
+        """
+        if self.provider is not None:
+            return self.provider.verify(token)
+        return id_token.verify_oauth2_token(token, self.request, self.config.CLIENT_ID)
 
     def verify_token(self, token: str) -> str:
-        """Verify Google OAuth token and return email if valid."""
+        """Verify an ID token and return email if valid."""
         try:
-            idinfo = id_token.verify_oauth2_token(token, requests.Request(), self.config.CLIENT_ID)
+            digest = token_digest(token)
+            claims = self.token_cache.get(digest)
+
+            if claims is None:
+                idinfo = self.verify_id_token(token)
+                claims = profile_claims(idinfo)
+
+                # Never trust a cached result past the token's own expiry
+                if "exp" in idinfo:
+                    self.token_cache.set(digest, claims, ttl=idinfo["exp"] - time.time())
+
+            email = claims["email"]
 
-            email = idinfo.get("email", "")
             if not email.endswith("@" + self.config.ALLOWED_DOMAIN):
                 raise ValueError("Invalid email domain")
 
             return email
 
         except Exception as e:
-            raise ValueError(f"Token verification failed: {str(e)}")
+            raise ValueError(f"Token verification failed: {str(e)}") from e
+
+    def claims(self, token: str) -> dict:
+        """Return the profile claims of a token that ``authenticate`` accepted.
+
+        Portal session tokens carry them; ID tokens have them in the
+        verified token cache. Tokens with neither yield only the email.
+        """
+        try:
+            return self._load_session_claims(token)
+        except BadSignature:
+            pass
+        claims = self.token_cache.get(token_digest(token))
+        return claims if claims is not None else {"email": self.verify_token(token)}
+
+    def stats(self) -> dict:
+        return {
+            "signing_certs": self.request.stats(),
+            "token_cache": self.token_cache.stats(),
+            "failed_tokens": self.failed_tokens.stats(),
+        }
@@ -0,0 +1,258 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from .keystore import write_atomic
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire individually.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is reached,
+    and are dropped on lookup once their time-to-live has passed.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Return size and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CachedFile:
+    """File contents together with the stat signature they were read at."""
+
+    def __init__(self, signature, text: str):
+        self.signature = signature
+        self.text = text
+        self.fingerprint = hashlib.sha256(text.encode()).hexdigest()
+
+
+class FileCache:
+    """Keeps small, rarely changing files in memory.
+
+    Every lookup costs one stat(); the file is only read again when its
+    mtime, size or inode differ from the cached copy, so a replaced file is
+    picked up without restarting the workers. With ``maxsize`` set, the least
+    recently used files are dropped first.
+    """
+
+    def __init__(self, maxsize: int = None):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path) -> CachedFile:
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry.signature == signature:
+            self.hits += 1
+            if self.maxsize is not None:
+                with self._lock:
+                    if path in self._entries:
+                        self._entries.move_to_end(path)
+            return entry
+
+        self.misses += 1
+        entry = CachedFile(signature, Path(path).read_text())
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def read(self, path) -> str:
+        return self.get(path).text
+
+    def invalidate(self, path) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def stats(self) -> dict:
+        return {"files": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class ProfileCache:
+    """Rendered client profiles, each kept with the version it was rendered at.
+
+    A lookup only hits when the caller's version matches (see
+    ``VPNManager.profile_etag``), so a reissued certificate, a new CA or
+    tls-auth key, a changed remote or template all miss without any worker
+    having to be told. ``invalidate`` drops a profile whose certificate was
+    replaced or revoked. At most ``maxsize`` profiles are kept, least
+    recently used first out.
+
+    With ``spill_dir`` set, profiles are written there instead (mode 0600,
+    since they embed the client key) and read back on every hit, so workers
+    share one page-cache copy without holding a descriptor per profile, a
+    profile rendered by one worker, or by ``ovpn-portal provision``, is
+    served by all of them, and one invalidated anywhere is gone everywhere.
+    In memory only its version is kept.
+    """
+
+    def __init__(self, maxsize: int = 1024, spill_dir=None):
+        self.maxsize = maxsize
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _spill_dir(self, name: str) -> Path:
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return self.spill_dir / digest[:2] / digest[2:]
+
+    def __contains__(self, name: str) -> bool:
+        if name in self._entries:
+            return True
+        return self.spill_dir is not None and self._spill_dir(name).exists()
+
+    def _store(self, name: str, version: str, value) -> None:
+        with self._lock:
+            self._entries[name] = (version, value)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, name: str, version: str):
+        """Return the profile rendered at ``version``, or None."""
+        if self.maxsize <= 0:
+            return None
+
+        if self.spill_dir is not None:
+            try:
+                with open(self._spill_dir(name) / f"{version}.ovpn", "rb") as f:
+                    profile = f.read().decode()
+            except (OSError, ValueError):
+                pass
+            else:
+                self._store(name, version, None)
+                self.hits += 1
+                return profile
+        else:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                with self._lock:
+                    if name in self._entries:
+                        self._entries.move_to_end(name)
+                self.hits += 1
+                return entry[1]
+
+        self.misses += 1
+        return None
+
+    def set(self, name: str, version: str, profile: str) -> None:
+        if self.maxsize <= 0:
+            return
+        if self.spill_dir is None:
+            self._store(name, version, profile)
+            return
+
+        directory = self._spill_dir(name)
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = directory / f"{version}.ovpn"
+        write_atomic(path, profile.encode())
+        # Only finished profiles: another worker may be writing its own temporary file here
+        for stale in directory.glob("*.ovpn"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        self._store(name, version, None)
+
+    def invalidate(self, name: str) -> None:
+        """Forget a profile, including its spilled copy."""
+        with self._lock:
+            self._entries.pop(name, None)
+        if self.spill_dir is not None:
+            directory = self._spill_dir(name)
+            try:
+                for path in directory.glob("*.ovpn"):
+                    path.unlink(missing_ok=True)
+                directory.rmdir()
+            except OSError:
+                # Already gone, or another worker is writing a fresh copy
+                pass
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "shared": self.spill_dir is not None,
+        }
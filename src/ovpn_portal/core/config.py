@@ -16,6 +16,76 @@ class Config:
     VPN_NETWORK = os.environ.get("VPN_NETWORK", "10.8.0.0/24")
     LOG_DIR = os.environ.get("LOG_DIR", "/var/log/ovpn-portal")  # Add this line
 
+    # OpenID Connect issuer used instead of Google when set, e.g. a Keycloak realm URL
+    OIDC_ISSUER = os.environ.get("OIDC_ISSUER")
+    OIDC_CACHE_TTL = int(os.environ.get("OIDC_CACHE_TTL", 3600))
+
+    # Client certificate issuance: "auto", "native" (in-process) or "easyrsa"
+    CERT_BACKEND = os.environ.get("CERT_BACKEND", "auto")
+    CERT_DAYS = int(os.environ.get("CERT_DAYS", 825))
+    CA_KEY_PASSPHRASE = os.environ.get("CA_KEY_PASSPHRASE")
+
+    # Lifetime of the CRL published on revocation, in days
+    CRL_DAYS = int(os.environ.get("CRL_DAYS", 180))
+    # Comma-separated emails allowed to revoke other users' certificates
+    ADMIN_EMAILS = [email.strip() for email in os.environ.get("ADMIN_EMAILS", "").split(",") if email.strip()]
+
+    # Per-device certificates each user may hold besides their default profile
+    MAX_DEVICES = int(os.environ.get("MAX_DEVICES", 5))
+
+    # Background renewal of certificates expiring within RENEWAL_WINDOW_DAYS, checked every
+    # RENEWAL_INTERVAL seconds (0 disables it), at most RENEWAL_BATCH_SIZE per pass and
+    # RENEWAL_RATE per second
+    RENEWAL_INTERVAL = int(os.environ.get("RENEWAL_INTERVAL", 0))
+    RENEWAL_WINDOW_DAYS = float(os.environ.get("RENEWAL_WINDOW_DAYS", 30))
+    RENEWAL_BATCH_SIZE = int(os.environ.get("RENEWAL_BATCH_SIZE", 50))
+    RENEWAL_RATE = float(os.environ.get("RENEWAL_RATE", 5))
+
+    # Key algorithm for client certificates ("rsa", "ecdsa" or "ed25519") and for the
+    # CA/server certificates created by `ovpn-portal setup`
+    CERT_KEY_ALGORITHM = os.environ.get("CERT_KEY_ALGORITHM", "rsa")
+    CA_KEY_ALGORITHM = os.environ.get("CA_KEY_ALGORITHM", "rsa")
+
+    # "sync" issues missing certificates during the download request; "async" queues a
+    # background job and answers 202 with a job URL to poll
+    ISSUANCE_MODE = os.environ.get("ISSUANCE_MODE", "sync")
+    ISSUANCE_WORKERS = int(os.environ.get("ISSUANCE_WORKERS", 2))
+    # SQLite database shared by all workers (defaults to OPENVPN_DIR/portal.db)
+    PORTAL_DB = os.environ.get("PORTAL_DB")
+
+    # JSON rules choosing a client template per user from token claims (hd, groups, email)
+    PROFILE_TEMPLATES = os.environ.get("PROFILE_TEMPLATES")
+
+    # Rendered profiles kept per worker (0 disables the cache); with PROFILE_CACHE_DIR set
+    # they are written there and read through the page cache so all workers share one copy
+    PROFILE_CACHE_SIZE = int(os.environ.get("PROFILE_CACHE_SIZE", 1024))
+    PROFILE_CACHE_DIR = os.environ.get("PROFILE_CACHE_DIR")
+
+    # Pre-generated client keys for the native backend (0 disables the pool)
+    KEY_POOL_SIZE = int(os.environ.get("KEY_POOL_SIZE", 0))
+    KEY_POOL_LOW_WATER = int(os.environ.get("KEY_POOL_LOW_WATER", 2))
+    KEY_POOL_CONCURRENCY = int(os.environ.get("KEY_POOL_CONCURRENCY", 1))
+
+    # Verified token cache
+    TOKEN_CACHE_SIZE = int(os.environ.get("TOKEN_CACHE_SIZE", 1024))
+    TOKEN_CACHE_TTL = int(os.environ.get("TOKEN_CACHE_TTL", 600))
+
+    # Lifetime of portal-issued session tokens, in seconds
+    SESSION_TOKEN_TTL = int(os.environ.get("SESSION_TOKEN_TTL", 3600))
+
+    # Rejected bearer tokens and per-address throttling of failed attempts
+    NEGATIVE_CACHE_SIZE = int(os.environ.get("NEGATIVE_CACHE_SIZE", 4096))
+    NEGATIVE_CACHE_TTL = int(os.environ.get("NEGATIVE_CACHE_TTL", 60))
+    AUTH_FAILURE_RATE = float(os.environ.get("AUTH_FAILURE_RATE", 0.5))
+    AUTH_FAILURE_BURST = int(os.environ.get("AUTH_FAILURE_BURST", 10))
+    # Memory-mapped throttling table shared by all workers (defaults to OPENVPN_DIR/ratelimit)
+    RATE_LIMIT_FILE = os.environ.get("RATE_LIMIT_FILE")
+    # Reverse proxies in front of the portal whose X-Forwarded-For/-Proto are trusted (0 trusts none)
+    PROXY_HOPS = int(os.environ.get("PROXY_HOPS", 0))
+
+    # Bearer token required by /metrics; the endpoint is disabled while unset
+    METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
     # Frontend build directory
     FRONTEND_DIR = os.path.join(Path(__file__).parent.parent, "static", "dist")
 
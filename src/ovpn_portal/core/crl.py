@@ -0,0 +1,153 @@
+import datetime
+import threading
+import time
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+
+from .keystore import write_atomic
+from .pki import pki_lock, signature_hash
+
+# easy-rsa 3 default CRL lifetime
+DEFAULT_CRL_DAYS = 180
+DAY = 86400
+
+
+def _utc(timestamp: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+
+class RevocationList:
+    """Revokes client certificates and keeps the CRL up to date.
+
+    Revoked entries are held in memory as ready-built
+    ``x509.RevokedCertificate`` objects and topped up from the registry's
+    revocation log with only the entries committed since the last sync
+    (possibly by another worker), so regenerating the CRL costs one signature rather than a pass
+    over ``index.txt``. Revocations are also flagged in ``index.txt`` so the
+    easy-rsa scripts agree, and the CRL is written atomically to every path
+    in ``crl_paths`` for OpenVPN's ``crl-verify``.
+    """
+
+    def __init__(self, backend, registry, crl_paths, days: int = DEFAULT_CRL_DAYS):
+        self.backend = backend
+        self.registry = registry
+        self.crl_paths = [Path(path) for path in crl_paths]
+        self.days = days
+        self._entries = {}
+        # Sequence number of the last revocation log entry pulled in
+        self._synced = 0
+        self._lock = threading.Lock()
+        self.last_build_seconds = 0.0
+
+    def _sync(self) -> None:
+        """Pull revocations logged since the last sync into the in-memory set."""
+        for seq, serial, revoked in self.registry.revocations_after(self._synced):
+            if serial not in self._entries:
+                self._entries[serial] = (
+                    x509.RevokedCertificateBuilder()
+                    .serial_number(int(serial, 16))
+                    .revocation_date(_utc(revoked))
+                    .build()
+                )
+            self._synced = seq
+
+    def _mark_index(self, serials, revoked_at: float) -> None:
+        index_path = self.backend.pki_dir / "index.txt"
+        try:
+            with open(index_path) as index:
+                lines = index.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        revoked_date = _utc(revoked_at).strftime("%y%m%d%H%M%SZ")
+        changed = False
+        for i, line in enumerate(lines):
+            fields = line.split("\t")
+            if len(fields) >= 4 and fields[0] == "V" and fields[3].upper() in serials:
+                fields[0] = "R"
+                fields[2] = revoked_date
+                lines[i] = "\t".join(fields)
+                changed = True
+
+        if changed:
+            write_atomic(index_path, ("\n".join(lines) + "\n").encode(), mode=0o644)
+
+    def _next_crl_number(self) -> int:
+        path = self.backend.pki_dir / "crlnumber"
+        try:
+            number = int(path.read_text().strip(), 16)
+        except (FileNotFoundError, ValueError):
+            number = 1
+        path.write_text(format(number + 1, "X").zfill(2) + "\n")
+        return number
+
+    def _build(self) -> x509.CertificateRevocationList:
+        ca_cert, ca_key = self.backend.load_ca()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(ca_cert.subject)
+            .last_update(now)
+            .next_update(now + datetime.timedelta(days=self.days))
+            .add_extension(x509.CRLNumber(self._next_crl_number()), critical=False)
+            .add_extension(x509.AuthorityKeyIdentifier.from_issuer_public_key(ca_key.public_key()), critical=False)
+        )
+        for entry in self._entries.values():
+            builder = builder.add_revoked_certificate(entry)
+        return builder.sign(ca_key, signature_hash(ca_key))
+
+    def revoke(self, serials) -> list:
+        """Revoke certificates by serial and publish a new CRL; return the serials newly revoked."""
+        with self._lock, pki_lock(self.backend.pki_dir):
+            revoked_at = time.time()
+            changed = self.registry.revoke_many(serials, revoked_at)
+            if changed:
+                self._mark_index(set(changed), revoked_at)
+            self._publish()
+        return changed
+
+    def publish(self) -> x509.CertificateRevocationList:
+        """Regenerate the CRL, e.g. before the current one reaches its next update."""
+        with self._lock, pki_lock(self.backend.pki_dir):
+            return self._publish()
+
+    def next_update(self):
+        """Return when the published CRL stops being accepted, or ``None`` if none was published."""
+        try:
+            with open(self.crl_paths[0], "rb") as f:
+                crl = x509.load_pem_x509_crl(f.read())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Unreadable, so as good as expired
+            return 0.0
+        return crl.next_update_utc.timestamp()
+
+    def refresh(self, margin_days: float = None):
+        """Republish the CRL if it expires within ``margin_days``; return the new CRL or ``None``.
+
+        OpenVPN rejects every client once the CRL is past its next update,
+        so it has to be reissued even when nothing was revoked. The default
+        margin is a quarter of the CRL's lifetime. A CRL that was never
+        published is left alone.
+        """
+        margin = self.days / 4 if margin_days is None else margin_days
+        next_update = self.next_update()
+        if next_update is None or next_update - time.time() > margin * DAY:
+            return None
+        return self.publish()
+
+    def _publish(self) -> x509.CertificateRevocationList:
+        started = time.monotonic()
+        self._sync()
+        crl = self._build()
+        pem = crl.public_bytes(serialization.Encoding.PEM)
+        for path in self.crl_paths:
+            write_atomic(path, pem, mode=0o644)
+        self.last_build_seconds = time.monotonic() - started
+        return crl
+
+    def stats(self) -> dict:
+        return {"revoked": len(self._entries), "last_build_seconds": self.last_build_seconds}
@@ -0,0 +1,71 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+
+def portal_db_path(config) -> str:
+    """Return the path of the SQLite database shared by all workers."""
+    return config.PORTAL_DB or os.path.join(config.OPENVPN_DIR, "portal.db")
+
+
+class Database:
+    """A SQLite file shared by every worker process.
+
+    WAL mode lets readers proceed while another worker writes, and each
+    thread of each process gets its own connection: sqlite3 connections must
+    not cross threads, and must not survive a fork.
+    """
+
+    def __init__(self, path, schema: str = "", timeout: float = 30.0):
+        self.path = Path(path)
+        self.schema = schema
+        self.timeout = timeout
+        self._local = threading.local()
+        self._initialized_pid = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def connection(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            self._local.connection = self._connect()
+            self._local.pid = pid
+
+        with self._lock:
+            if self._initialized_pid != pid:
+                if self.schema:
+                    self._local.connection.executescript(self.schema)
+                self._initialized_pid = pid
+        return self._local.connection
+
+    def execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        return self.connection().execute(sql, params)
+
+    def transaction(self):
+        """Return a context manager running its block in a write transaction.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front, so a read followed
+        by an update cannot be interleaved with another worker's.
+        """
+        return _Transaction(self.connection())
+
+
+class _Transaction:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc, tb):
+        self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
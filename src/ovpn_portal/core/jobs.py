@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+import uuid
+
+from .db import Database
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created);
+CREATE INDEX IF NOT EXISTS jobs_email ON jobs (email, status);
+"""
+
+
+class JobQueue:
+    """Certificate issuance jobs kept in SQLite and run by background threads.
+
+    The queue lives in a database file, so every gunicorn worker sees the
+    same jobs and queued work survives restarts. Workers claim jobs inside a
+    write transaction; a job left ``running`` for longer than ``lease``
+    seconds (its worker died) is queued again, up to ``max_attempts`` times.
+    Finished jobs are deleted after ``retention`` seconds.
+    """
+
+    def __init__(
+        self,
+        path,
+        handler,
+        workers: int = 2,
+        lease: float = 300,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        retention: float = 86400,
+    ):
+        self.db = Database(path, _SCHEMA)
+        self.handler = handler
+        self.workers = workers
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retention = retention
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, email: str) -> dict:
+        """Queue issuance for ``email``, or return the job already pending for it."""
+        now = time.time()
+        with self.db.transaction() as db:
+            row = db.execute(
+                "SELECT * FROM jobs WHERE email = ? AND status IN (?, ?) ORDER BY created LIMIT 1",
+                (email, QUEUED, RUNNING),
+            ).fetchone()
+            if row is None:
+                job_id = uuid.uuid4().hex
+                db.execute(
+                    "INSERT INTO jobs (id, email, status, created, updated) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, email, QUEUED, now, now),
+                )
+                row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+        self.start()
+        self._wake.set()
+        return dict(row)
+
+    def get(self, job_id: str):
+        row = self.db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def claim(self):
+        """Mark the oldest queued job as running and return it, or None if there is none."""
+        now = time.time()
+        with self.db.transaction() as db:
+            db.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,"
+                " error = CASE WHEN attempts >= ? THEN 'Worker lost while running job' ELSE error END,"
+                " updated = ? WHERE status = ? AND updated < ?",
+                (self.max_attempts, FAILED, QUEUED, self.max_attempts, now, RUNNING, now - self.lease),
+            )
+            db.execute("DELETE FROM jobs WHERE status IN (?, ?) AND updated < ?", (DONE, FAILED, now - self.retention))
+
+            row = db.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created LIMIT 1",
+                (QUEUED,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated = ? WHERE id = ?",
+                (RUNNING, now, row["id"]),
+            )
+        return dict(row, status=RUNNING, attempts=row["attempts"] + 1)
+
+    def _finish(self, job_id: str, error: str = None) -> None:
+        self.db.execute(
+            "UPDATE jobs SET status = ?, error = ?, updated = ? WHERE id = ?",
+            (FAILED if error else DONE, error, time.time(), job_id),
+        )
+
+    def run_pending(self) -> int:
+        """Run queued jobs in the calling thread until none are left; return how many ran."""
+        count = 0
+        while True:
+            job = self.claim()
+            if job is None:
+                return count
+            try:
+                self.handler(job["email"])
+            except Exception as e:
+                self._finish(job["id"], error=str(e))
+            else:
+                self._finish(job["id"])
+            count += 1
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_pending()
+            except Exception:
+                # The database was briefly unavailable; try again on the next poll
+                ran = 0
+            if not ran:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def start(self) -> None:
+        """Start this process's worker threads, once per process."""
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+            self._stop.clear()
+            self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(self.workers)]
+            for thread in self._threads:
+                thread.start()
+            self._started_pid = os.getpid()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join()
+        with self._lock:
+            self._threads = []
+            self._started_pid = None
+
+    def stats(self) -> dict:
+        rows = self.db.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
@@ -0,0 +1,155 @@
+import fcntl
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+
+
+class KeyPool:
+    """A directory of pre-generated client private keys.
+
+    Key generation does not depend on the user, so it is done ahead of time
+    in background threads and first-time issuance only has to sign. Keys
+    are claimed with an atomic rename, which makes the pool safe to share
+    between gunicorn workers; a non-blocking flock ensures only one process
+    refills it at a time.
+    """
+
+    SUFFIX = ".pem"
+
+    def __init__(self, directory, generate, size: int = 8, low_water: int = 2, concurrency: int = 1):
+        self.directory = Path(directory)
+        self.generate = generate
+        self.size = size
+        self.low_water = low_water
+        self.concurrency = concurrency
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        # Pid of the process whose refill thread is running; a forked child inherits the value but not the thread
+        self._refilling_pid = None
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_directory(self) -> None:
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.endswith(self.SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    def available(self) -> int:
+        return len(self._entries())
+
+    def take(self):
+        """Claim a pooled key, or return None if the pool is empty. Triggers a refill when low."""
+        key = None
+        for entry in self._entries():
+            claimed = f"{entry.path}.{os.getpid()}.claimed"
+            try:
+                os.rename(entry.path, claimed)
+            except FileNotFoundError:
+                # Another worker got there first
+                continue
+
+            try:
+                with open(claimed, "rb") as f:
+                    key = serialization.load_pem_private_key(f.read(), password=None)
+            finally:
+                os.unlink(claimed)
+            break
+
+        if key is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        self.maybe_refill()
+        return key
+
+    def _add(self) -> None:
+        key = self.generate()
+        pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+        tmp_path = self.directory / f".{uuid.uuid4().hex}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pem)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(tmp_path, self.directory / f"{uuid.uuid4().hex}{self.SUFFIX}")
+        self.generated += 1
+
+    def fill(self) -> int:
+        """Generate keys until the pool is full; return how many were added.
+
+        Returns 0 without doing anything if another process is already
+        refilling.
+        """
+        self._ensure_directory()
+        lock_fd = os.open(self.directory / ".refill.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+
+            missing = self.size - self.available()
+            if missing <= 0:
+                return 0
+
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                list(executor.map(lambda _: self._add(), range(missing)))
+            return missing
+        finally:
+            os.close(lock_fd)
+
+    def _refill(self) -> None:
+        try:
+            self.fill()
+        finally:
+            with self._lock:
+                self._refilling_pid = None
+
+    def maybe_refill(self, force: bool = False) -> bool:
+        """Start a background refill if the pool is at or below its low-water mark (or ``force``)."""
+        if not force and self.available() > self.low_water:
+            return False
+
+        with self._lock:
+            if self._refilling_pid == os.getpid():
+                return False
+            self._refilling_pid = os.getpid()
+
+        threading.Thread(target=self._refill, daemon=True).start()
+        return True
+
+    def start(self) -> None:
+        """Top the pool up in the background, once per process.
+
+        Called from each worker rather than before forking: a refill started
+        in the gunicorn master would leave every worker holding a copy of its
+        lock file descriptor, and the flock with it.
+        """
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+            self._started_pid = os.getpid()
+        self.maybe_refill(force=True)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "low_water": self.low_water,
+            "concurrency": self.concurrency,
+            "available": self.available(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "generated": self.generated,
+        }
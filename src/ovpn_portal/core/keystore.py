@@ -0,0 +1,109 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+# Server material that lives next to legacy client files in OPENVPN_DIR
+_SERVER_NAMES = {"ca", "server", "ta", "dh", "crl"}
+
+
+def _fsync_directory(path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path, data: bytes, mode: int = 0o600) -> None:
+    """Replace ``path`` with ``data`` durably; readers see either the old or the new file."""
+    path = Path(path)
+    # A name of its own per call: threads of one worker may write the same path at once
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    tmp = Path(tmp)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+
+
+class KeyStore:
+    """Per-user certificates and keys in a hashed, two-level directory tree.
+
+    ``<root>/ab/cd/<name>.crt`` where ``abcd`` starts the SHA-256 of the
+    name, so no directory grows past a few entries however many users there
+    are. Files are written to a temporary name, fsynced and renamed into
+    place with mode 0600. Users still in the old flat layout, with files
+    directly in ``legacy_dir``, are found until ``migrate()`` moves them.
+    """
+
+    def __init__(self, root, legacy_dir=None):
+        self.root = Path(root)
+        self.legacy_dir = Path(legacy_dir) if legacy_dir is not None else None
+
+    def shard(self, name: str) -> Path:
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return self.root / digest[:2] / digest[2:4]
+
+    def paths(self, name: str):
+        """Return ``(cert_path, key_path)`` in the sharded layout."""
+        shard = self.shard(name)
+        return shard / f"{name}.crt", shard / f"{name}.key"
+
+    def legacy_paths(self, name: str):
+        return self.legacy_dir / f"{name}.crt", self.legacy_dir / f"{name}.key"
+
+    def locate(self, name: str):
+        """Return the ``(cert_path, key_path)`` holding a user's files, or None if there are none."""
+        candidates = [self.paths(name)]
+        if self.legacy_dir is not None:
+            candidates.append(self.legacy_paths(name))
+        for cert_path, key_path in candidates:
+            if cert_path.exists() and key_path.exists():
+                return cert_path, key_path
+        return None
+
+    def write(self, name: str, cert: bytes, key: bytes):
+        """Store a user's certificate and key; the key lands first, so a visible certificate has its key."""
+        cert_path, key_path = self.paths(name)
+        cert_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        write_atomic(key_path, key)
+        write_atomic(cert_path, cert)
+        return cert_path, key_path
+
+    def legacy_names(self) -> list:
+        """Return the users whose certificate and key are still in the flat layout."""
+        if self.legacy_dir is None:
+            return []
+        names = []
+        for entry in os.scandir(self.legacy_dir):
+            name, ext = os.path.splitext(entry.name)
+            if ext != ".crt" or not entry.is_file() or name in _SERVER_NAMES or "@" not in name:
+                continue
+            if (self.legacy_dir / f"{name}.key").exists():
+                names.append(name)
+        return sorted(names)
+
+    def migrate(self) -> int:
+        """Move every flat-layout user into the sharded tree; return how many were moved.
+
+        Safe to interrupt and run again: the flat files are removed only
+        after the sharded copies are durable.
+        """
+        moved = 0
+        for name in self.legacy_names():
+            cert_path, key_path = self.legacy_paths(name)
+            # A sharded copy is never older than the flat one it replaced
+            if not all(path.exists() for path in self.paths(name)):
+                self.write(name, cert_path.read_bytes(), key_path.read_bytes())
+            cert_path.unlink()
+            key_path.unlink()
+            moved += 1
+        return moved
@@ -0,0 +1,58 @@
+import fcntl
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class LockStats:
+    """Counts lock acquisitions and the time spent waiting for them."""
+
+    def __init__(self):
+        self.acquired = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, waited: float, contended: bool) -> None:
+        with self._lock:
+            self.acquired += 1
+            self.contended += contended
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def stats(self) -> dict:
+        return {
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "wait_seconds": self.wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+@contextmanager
+def file_lock(path, stats: LockStats = None):
+    """Hold an exclusive flock on ``path`` for the duration of the block.
+
+    flock() locks belong to the open file description, so the lock excludes
+    other threads as well as other processes. Lock files are left in place;
+    removing them would let a waiter lock an unlinked file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        started = time.monotonic()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            contended = False
+        except BlockingIOError:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            contended = True
+        if stats is not None:
+            stats.record(time.monotonic() - started, contended)
+        yield
+    finally:
+        os.close(fd)
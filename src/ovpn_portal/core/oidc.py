@@ -0,0 +1,126 @@
+import base64
+import threading
+import time
+
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from google.auth import jwt
+from google.auth.exceptions import TransportError
+
+from .transport import parse_max_age
+
+# google-auth verifies ES256 only; keys on other curves could never verify a token
+_CURVES = {"P-256": ec.SECP256R1()}
+
+
+def _b64_int(value: str) -> int:
+    return int.from_bytes(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)), "big")
+
+
+def jwk_to_pem(jwk: dict) -> bytes:
+    """Convert an RSA or EC JSON Web Key to a PEM public key."""
+    if jwk["kty"] == "RSA":
+        key = rsa.RSAPublicNumbers(_b64_int(jwk["e"]), _b64_int(jwk["n"])).public_key()
+    elif jwk["kty"] == "EC":
+        if jwk.get("crv") not in _CURVES:
+            raise ValueError(f"Unsupported curve: {jwk.get('crv')}")
+        key = ec.EllipticCurvePublicNumbers(_b64_int(jwk["x"]), _b64_int(jwk["y"]), _CURVES[jwk["crv"]]).public_key()
+    else:
+        raise ValueError(f"Unsupported key type: {jwk.get('kty')}")
+
+    return key.public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+
+
+class OIDCProvider:
+    """Verifies ID tokens from any OpenID Connect issuer.
+
+    The discovery document and JWKS are fetched once and cached for their
+    Cache-Control lifetime (``ttl`` when none is given). Keys are looked up by
+    ``kid``; an unknown ``kid`` triggers at most one JWKS refresh per
+    ``min_refresh_interval`` so key rotation is picked up without letting
+    junk tokens hammer the issuer. Signatures are verified locally.
+    """
+
+    def __init__(self, issuer, audience, session=None, ttl=3600, min_refresh_interval=60, clock_skew=30):
+        self.issuer = issuer.rstrip("/")
+        self.audience = audience
+        self.session = session or requests.Session()
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.clock_skew = clock_skew
+        self._lock = threading.Lock()
+        self._discovery = None
+        self._discovery_expires = 0.0
+        self._keys = {}
+        self._keys_expires = 0.0
+        self._keys_fetched = 0.0
+
+    def _get_json(self, url):
+        # Raised as TransportError so callers can tell an issuer outage from a bad token
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.json(), parse_max_age(response.headers, default=self.ttl)
+        except (requests.RequestException, ValueError) as e:
+            raise TransportError(f"Could not fetch {url}: {e}") from e
+
+    def discovery(self) -> dict:
+        """Return the issuer's openid-configuration document."""
+        with self._lock:
+            if self._discovery is None or time.monotonic() >= self._discovery_expires:
+                document, max_age = self._get_json(f"{self.issuer}/.well-known/openid-configuration")
+                if document.get("issuer", "").rstrip("/") != self.issuer:
+                    raise ValueError("Discovery document issuer does not match")
+                self._discovery = document
+                self._discovery_expires = time.monotonic() + max_age
+            return self._discovery
+
+    def _refresh_keys(self) -> None:
+        jwks, max_age = self._get_json(self.discovery()["jwks_uri"])
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[jwk.get("kid")] = jwk_to_pem(jwk)
+            except (KeyError, ValueError):
+                continue
+
+        now = time.monotonic()
+        with self._lock:
+            self._keys = keys
+            self._keys_fetched = now
+            self._keys_expires = now + max_age
+
+    def key_for(self, kid) -> bytes:
+        """Return the PEM public key for ``kid``, refreshing the JWKS if it is stale or unknown."""
+        now = time.monotonic()
+        stale = now >= self._keys_expires
+        unknown = kid not in self._keys and now - self._keys_fetched >= self.min_refresh_interval
+
+        if stale or unknown:
+            self._refresh_keys()
+
+        try:
+            return self._keys[kid]
+        except KeyError:
+            raise ValueError(f"No signing key found for kid {kid!r}")
+
+    def verify(self, token: str) -> dict:
+        """Verify a token's signature, audience, issuer and lifetime and return its claims.
+
+        The email must be marked verified: with a self-service provider
+        anyone could otherwise register an address in ALLOWED_DOMAIN.
+        """
+        header = jwt.decode_header(token)
+        key = self.key_for(header.get("kid"))
+        claims = jwt.decode(token, certs=key, audience=self.audience, clock_skew_in_seconds=self.clock_skew)
+
+        if claims.get("iss", "").rstrip("/") != self.issuer:
+            raise ValueError(f"Wrong issuer: {claims.get('iss')}")
+        # Some providers send the flag as a string
+        if claims.get("email_verified") not in (True, "true"):
+            raise ValueError("Email address not verified by the issuer")
+
+        return claims
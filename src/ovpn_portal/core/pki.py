@@ -0,0 +1,218 @@
+import datetime
+import os
+import subprocess
+import threading
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+
+from .locks import file_lock
+
+# easy-rsa 3 default client certificate lifetime
+DEFAULT_CERT_DAYS = 825
+
+KEY_ALGORITHMS = ("rsa", "ecdsa", "ed25519")
+
+# easy-rsa settings for each key algorithm
+_EASYRSA_ALGORITHMS = {
+    "rsa": {"EASYRSA_ALGO": "rsa"},
+    "ecdsa": {"EASYRSA_ALGO": "ec", "EASYRSA_CURVE": "prime256v1"},
+    "ed25519": {"EASYRSA_ALGO": "ed", "EASYRSA_CURVE": "ed25519"},
+}
+
+
+def format_serial(serial_number: int) -> str:
+    """Format a serial the way index.txt and certs_by_serial/ do: even-length uppercase hex."""
+    serial = format(serial_number, "X")
+    return serial if len(serial) % 2 == 0 else "0" + serial
+
+
+def pki_lock(pki_dir):
+    """Lock serialising updates to a PKI's ``index.txt`` and ``serial`` across workers."""
+    return file_lock(Path(pki_dir) / ".ovpn-portal.lock")
+
+
+def easyrsa_env(algorithm: str) -> dict:
+    """Return the environment for running easy-rsa with the given key algorithm."""
+    if algorithm not in _EASYRSA_ALGORITHMS:
+        raise ValueError(f"Unsupported key algorithm: {algorithm}")
+    return dict(os.environ, **_EASYRSA_ALGORITHMS[algorithm])
+
+
+def generate_private_key(algorithm: str):
+    """Generate a private key: RSA-2048, ECDSA P-256 or Ed25519."""
+    if algorithm == "rsa":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    if algorithm == "ecdsa":
+        return ec.generate_private_key(ec.SECP256R1())
+    if algorithm == "ed25519":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Unsupported key algorithm: {algorithm}")
+
+
+def signature_hash(key):
+    """Return the digest to sign with ``key``; EdDSA keys take none."""
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed448.Ed448PrivateKey)):
+        return None
+    return hashes.SHA256()
+
+
+class EasyRSABackend:
+    """Issues client certificates by running the easy-rsa scripts."""
+
+    name = "easyrsa"
+
+    def __init__(self, easy_rsa_dir, algorithm: str = "rsa"):
+        self.easy_rsa_dir = Path(easy_rsa_dir)
+        self.algorithm = algorithm
+
+    def issue(self, name: str) -> None:
+        env = easyrsa_env(self.algorithm)
+        try:
+            subprocess.run(
+                ["./easyrsa", "gen-req", name, "nopass"],
+                cwd=self.easy_rsa_dir,
+                check=True,
+                capture_output=True,
+                text=True,
+                input=f"{name}\n",
+                env=env,
+            )
+
+            # Signing updates the CA database, so only one worker may do it at a time
+            with pki_lock(self.easy_rsa_dir / "pki"):
+                subprocess.run(
+                    ["./easyrsa", "sign-req", "client", name],
+                    cwd=self.easy_rsa_dir,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    input="yes\n",
+                    env=env,
+                )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Certificate generation failed: {e.stdout} {e.stderr}")
+
+
+class NativeBackend:
+    """Issues client certificates in-process with the ``cryptography`` library.
+
+    The CA certificate and key are loaded once (and again only if the files
+    change) and every request is signed without forking. Output follows
+    easy-rsa's PKI layout: ``reqs/``, ``private/``, ``issued/``,
+    ``certs_by_serial/``, ``index.txt`` and ``serial``, so the easy-rsa
+    scripts keep working on the same PKI.
+    """
+
+    name = "native"
+
+    def __init__(self, easy_rsa_dir, days: int = DEFAULT_CERT_DAYS, passphrase: str = None, algorithm: str = "rsa"):
+        self.pki_dir = Path(easy_rsa_dir) / "pki"
+        self.days = days
+        self.algorithm = algorithm
+        self.passphrase = passphrase.encode() if passphrase else None
+        self._ca = None
+        self._ca_signature = None
+        self._lock = threading.Lock()
+
+    @property
+    def ca_cert_path(self) -> Path:
+        return self.pki_dir / "ca.crt"
+
+    @property
+    def ca_key_path(self) -> Path:
+        return self.pki_dir / "private" / "ca.key"
+
+    def available(self) -> bool:
+        """Return whether the CA can be loaded without prompting for a passphrase."""
+        try:
+            self.load_ca()
+            return True
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def load_ca(self):
+        """Return ``(ca_cert, ca_key)``, reloading them only when the files change."""
+        signature = (os.stat(self.ca_cert_path).st_mtime_ns, os.stat(self.ca_key_path).st_mtime_ns)
+        with self._lock:
+            if self._ca is None or signature != self._ca_signature:
+                ca_cert = x509.load_pem_x509_certificate(self.ca_cert_path.read_bytes())
+                ca_key = serialization.load_pem_private_key(self.ca_key_path.read_bytes(), password=self.passphrase)
+                self._ca = (ca_cert, ca_key)
+                self._ca_signature = signature
+            return self._ca
+
+    def generate_key(self):
+        return generate_private_key(self.algorithm)
+
+    def issue(self, name: str, key=None) -> x509.Certificate:
+        ca_cert, ca_key = self.load_ca()
+        key = key or self.generate_key()
+
+        subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+        csr = x509.CertificateSigningRequestBuilder().subject_name(subject).sign(key, signature_hash(key))
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(csr.subject)
+            .issuer_name(ca_cert.subject)
+            .public_key(csr.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(minutes=5))
+            .not_valid_after(now + datetime.timedelta(days=self.days))
+            .add_extension(x509.BasicConstraints(ca=False, path_length=None), critical=False)
+            .add_extension(x509.SubjectKeyIdentifier.from_public_key(csr.public_key()), critical=False)
+            .add_extension(
+                x509.AuthorityKeyIdentifier.from_issuer_public_key(ca_key.public_key()),
+                critical=False,
+            )
+            .add_extension(x509.ExtendedKeyUsage([ExtendedKeyUsageOID.CLIENT_AUTH]), critical=False)
+            .add_extension(
+                x509.KeyUsage(
+                    digital_signature=True,
+                    content_commitment=False,
+                    key_encipherment=False,
+                    data_encipherment=False,
+                    key_agreement=False,
+                    key_cert_sign=False,
+                    crl_sign=False,
+                    encipher_only=False,
+                    decipher_only=False,
+                ),
+                critical=False,
+            )
+            .sign(ca_key, signature_hash(ca_key))
+        )
+
+        self._write(name, key, csr, cert)
+        return cert
+
+    def _write(self, name, key, csr, cert) -> None:
+        for directory in ["reqs", "private", "issued", "certs_by_serial"]:
+            (self.pki_dir / directory).mkdir(parents=True, exist_ok=True)
+
+        key_pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+        cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+        serial = format_serial(cert.serial_number)
+
+        key_path = self.pki_dir / "private" / f"{name}.key"
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key_pem)
+
+        (self.pki_dir / "reqs" / f"{name}.req").write_bytes(csr.public_bytes(serialization.Encoding.PEM))
+        (self.pki_dir / "issued" / f"{name}.crt").write_bytes(cert_pem)
+        (self.pki_dir / "certs_by_serial" / f"{serial}.pem").write_bytes(cert_pem)
+
+        # Same line format and serial bookkeeping as `openssl ca`
+        expires = cert.not_valid_after_utc.strftime("%y%m%d%H%M%SZ")
+        with pki_lock(self.pki_dir):
+            with open(self.pki_dir / "index.txt", "a") as index:
+                index.write(f"V\t{expires}\t\t{serial}\tunknown\t/CN={name}\n")
+            (self.pki_dir / "serial").write_text(format_serial(cert.serial_number + 1) + "\n")
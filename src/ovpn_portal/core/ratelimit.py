@@ -0,0 +1,111 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+
+# key hash, available tokens, last update (epoch seconds)
+_SLOT = struct.Struct("=Qdd")
+
+
+class SharedRateLimiter:
+    """Token-bucket limiter whose buckets live in an mmap-backed file.
+
+    Every gunicorn worker maps the same file, so a client is throttled no
+    matter which worker it reaches. The table has a fixed number of slots
+    addressed by key hash; when a probe window is full the least recently
+    updated bucket is recycled.
+    """
+
+    def __init__(self, path, rate: float, burst: int, slots: int = 4096, probe: int = 8):
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        self.slots = slots
+        self.probe = probe
+        self._fd = None
+        self._map = None
+        self._pid = None
+
+    def _open(self):
+        # Mappings and flock()s inherited across fork() are shared with the
+        # parent, so each worker opens the table itself.
+        if self._pid == os.getpid():
+            return
+
+        size = self.slots * _SLOT.size
+        # Never follow a symlink planted where the table should be
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        if os.fstat(fd).st_size != size:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                os.ftruncate(fd, size)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+        self._fd = fd
+        self._map = mmap.mmap(fd, size)
+        self._pid = os.getpid()
+
+    @contextmanager
+    def _locked(self):
+        self._open()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _find(self, key_hash: int):
+        """Return (offset, tokens, updated) for a key, or the slot to recycle for it."""
+        start = key_hash % self.slots
+        victim = None
+
+        for i in range(self.probe):
+            offset = ((start + i) % self.slots) * _SLOT.size
+            slot_hash, tokens, updated = _SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash:
+                return offset, tokens, updated
+            if slot_hash == 0:
+                return offset, None, None
+            if victim is None or updated < victim[1]:
+                victim = (offset, updated)
+
+        return victim[0], None, None
+
+    def _refill(self, tokens, updated, now) -> float:
+        if tokens is None:
+            return float(self.burst)
+        return min(float(self.burst), tokens + max(now - updated, 0) * self.rate)
+
+    def allowed(self, key: str, cost: float = 1) -> bool:
+        """Return whether ``key`` currently has ``cost`` tokens, without consuming them."""
+        with self._locked():
+            _, tokens, updated = self._find(self._hash(key))
+            return self._refill(tokens, updated, time.time()) >= cost
+
+    def consume(self, key: str, cost: float = 1) -> bool:
+        """Take ``cost`` tokens from the bucket for ``key``; return False if it was empty."""
+        key_hash = self._hash(key)
+        with self._locked():
+            now = time.time()
+            offset, tokens, updated = self._find(key_hash)
+            tokens = self._refill(tokens, updated, now)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            _SLOT.pack_into(self._map, offset, key_hash, tokens, now)
+            return allowed
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            os.close(self._fd)
+        self._fd = self._map = self._pid = None
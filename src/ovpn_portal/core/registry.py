@@ -0,0 +1,304 @@
+import datetime
+import re
+import time
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+
+from .db import Database
+from .pki import format_serial
+
+VALID = "valid"
+REVOKED = "revoked"
+EXPIRED = "expired"
+# Replaced by a renewed certificate; still usable until it expires
+SUPERSEDED = "superseded"
+
+# easy-rsa / `openssl ca` index.txt status flags
+_INDEX_STATUS = {"V": VALID, "R": REVOKED, "E": EXPIRED}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS certificates (
+    serial TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    device TEXT NOT NULL DEFAULT '',
+    fingerprint TEXT,
+    not_after REAL NOT NULL,
+    status TEXT NOT NULL,
+    issued REAL,
+    revoked REAL
+);
+CREATE INDEX IF NOT EXISTS certificates_email ON certificates (email, device, status, not_after);
+CREATE INDEX IF NOT EXISTS certificates_expiry ON certificates (status, not_after);
+CREATE INDEX IF NOT EXISTS certificates_revoked ON certificates (status, revoked);
+-- Revocations in commit order, so workers can pick up each other's by sequence number
+CREATE TABLE IF NOT EXISTS revocations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    serial TEXT NOT NULL,
+    revoked REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS revocations_serial ON revocations (serial);
+CREATE TABLE IF NOT EXISTS renewal_failures (
+    serial TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    retry_after REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS disabled_users (
+    email TEXT PRIMARY KEY,
+    disabled REAL NOT NULL
+);
+"""
+
+# Log revoked certificates missing from ``revocations``, e.g. after a rebuild
+_LOG_REVOCATIONS = (
+    "INSERT INTO revocations (serial, revoked)"
+    " SELECT serial, COALESCE(revoked, 0) FROM certificates"
+    " WHERE status = 'revoked' AND serial NOT IN (SELECT serial FROM revocations)"
+)
+
+
+_DEVICE_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,31}$")
+
+
+def normalize_device(device: str) -> str:
+    """Return a device id in canonical form, or raise ValueError if it is not a valid one."""
+    device = (device or "").strip().lower()
+    if device and not _DEVICE_RE.match(device):
+        raise ValueError("Device id must be 1-32 letters, digits, '-' or '_'")
+    return device
+
+
+def client_name(email: str, device: str = "") -> str:
+    """Return the certificate CN (and file name) for a user's device: ``email+device``."""
+    return f"{email}+{device}" if device else email
+
+
+def split_client_name(name: str):
+    """Split a CN into ``(email, device)``.
+
+    A ``+`` tag only names a device when what follows it contains no ``@``,
+    so plus-addressed emails such as ``jane+vpn@example.com`` stay whole.
+    """
+    email, plus, device = name.rpartition("+")
+    if plus and "@" not in device and _DEVICE_RE.match(device):
+        return email, device
+    return name, ""
+
+
+def fingerprint(cert: x509.Certificate) -> str:
+    return cert.fingerprint(hashes.SHA256()).hex()
+
+
+def parse_index_time(value: str) -> float:
+    """Parse an index.txt UTCTime (YYMMDDHHMMSSZ) or GeneralizedTime (YYYYMMDDHHMMSSZ)."""
+    value = value.split(",")[0]
+    fmt = "%y%m%d%H%M%SZ" if len(value) == 13 else "%Y%m%d%H%M%SZ"
+    return datetime.datetime.strptime(value, fmt).replace(tzinfo=datetime.timezone.utc).timestamp()
+
+
+class CertificateRegistry:
+    """Index of issued client certificates in the shared portal database.
+
+    Answers "does this user have a usable certificate?" with one indexed
+    query instead of probing files, and knows each certificate's serial,
+    expiry and revocation status. It can be rebuilt from easy-rsa's
+    ``index.txt`` at any time.
+    """
+
+    def __init__(self, path):
+        self.db = Database(path, _SCHEMA + _LOG_REVOCATIONS + ";\n")
+
+    def record(self, email: str, cert: x509.Certificate, device: str = "") -> dict:
+        """Register a newly issued certificate."""
+        row = {
+            "serial": format_serial(cert.serial_number),
+            "email": email,
+            "device": device,
+            "fingerprint": fingerprint(cert),
+            "not_after": cert.not_valid_after_utc.timestamp(),
+            "status": VALID,
+            "issued": time.time(),
+            "revoked": None,
+        }
+        self.db.execute(
+            "INSERT OR REPLACE INTO certificates"
+            " (serial, email, device, fingerprint, not_after, status, issued, revoked)"
+            " VALUES (:serial, :email, :device, :fingerprint, :not_after, :status, :issued, :revoked)",
+            row,
+        )
+        return row
+
+    def get(self, serial: str):
+        row = self.db.execute("SELECT * FROM certificates WHERE serial = ?", (serial.upper(),)).fetchone()
+        return dict(row) if row is not None else None
+
+    def active(self, email: str, device: str = ""):
+        """Return the newest valid, unexpired certificate for a user's device, or None."""
+        row = self.db.execute(
+            "SELECT * FROM certificates WHERE email = ? AND device = ? AND status = ? AND not_after > ?"
+            " ORDER BY not_after DESC LIMIT 1",
+            (email, device, VALID, time.time()),
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def known(self, email: str, device: str = "") -> bool:
+        """Return whether any certificate, in any state, was ever registered for a user's device."""
+        row = self.db.execute(
+            "SELECT 1 FROM certificates WHERE email = ? AND device = ? LIMIT 1", (email, device)
+        ).fetchone()
+        return row is not None
+
+    def devices(self, email: str) -> list:
+        """Return the newest valid certificate of each of a user's devices, ordered by device id."""
+        rows = self.db.execute(
+            "SELECT device, serial, fingerprint, MAX(not_after) AS not_after, issued FROM certificates"
+            " WHERE email = ? AND status = ? AND not_after > ? GROUP BY device ORDER BY device",
+            (email, VALID, time.time()),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def for_email(self, email: str) -> list:
+        rows = self.db.execute(
+            "SELECT * FROM certificates WHERE email = ? ORDER BY not_after DESC", (email,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def revoke(self, serial: str, revoked_at: float = None) -> bool:
+        """Mark a certificate revoked; return False if it is unknown or already revoked."""
+        return bool(self.revoke_many([serial], revoked_at))
+
+    def expiring(self, before: float, limit: int = 100) -> list:
+        """Return still-valid certificates expiring before ``before``, soonest first.
+
+        Certificates whose renewal failed are left out until their
+        ``defer_renewal`` time; ``renewal_attempts`` counts those failures.
+        """
+        now = time.time()
+        rows = self.db.execute(
+            "SELECT certificates.*, COALESCE(renewal_failures.attempts, 0) AS renewal_attempts FROM certificates"
+            " LEFT JOIN renewal_failures ON renewal_failures.serial = certificates.serial"
+            " WHERE status = ? AND not_after > ? AND not_after < ?"
+            " AND (renewal_failures.retry_after IS NULL OR renewal_failures.retry_after <= ?)"
+            " ORDER BY not_after LIMIT ?",
+            (VALID, now, before, now, limit),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def defer_renewal(self, serial: str, retry_after: float) -> None:
+        """Record a failed renewal and keep the certificate out of ``expiring`` until ``retry_after``."""
+        self.db.execute(
+            "INSERT INTO renewal_failures (serial, attempts, retry_after) VALUES (?, 1, ?)"
+            " ON CONFLICT (serial) DO UPDATE SET attempts = attempts + 1, retry_after = excluded.retry_after",
+            (serial.upper(), retry_after),
+        )
+
+    def supersede(self, serial: str) -> None:
+        self.db.execute(
+            "UPDATE certificates SET status = ? WHERE serial = ? AND status = ?", (SUPERSEDED, serial.upper(), VALID)
+        )
+
+    def revoke_many(self, serials, revoked_at: float = None) -> list:
+        """Revoke several certificates in one transaction; return the serials that changed."""
+        revoked_at = revoked_at or time.time()
+        changed = []
+        with self.db.transaction() as db:
+            for serial in serials:
+                cursor = db.execute(
+                    "UPDATE certificates SET status = ?, revoked = ? WHERE serial = ? AND status != ?",
+                    (REVOKED, revoked_at, serial.upper(), REVOKED),
+                )
+                if cursor.rowcount:
+                    db.execute("INSERT INTO revocations (serial, revoked) VALUES (?, ?)", (serial.upper(), revoked_at))
+                    changed.append(serial.upper())
+        return changed
+
+    def revocations_after(self, seq: int = 0) -> list:
+        """Return ``(seq, serial, revoked)`` for revocations logged after ``seq``, in commit order.
+
+        Sequence numbers follow the order in which writers committed, unlike
+        revocation times, which a slower worker may have taken earlier.
+        """
+        rows = self.db.execute(
+            "SELECT seq, serial, revoked FROM revocations WHERE seq > ? ORDER BY seq", (seq,)
+        ).fetchall()
+        return [(row["seq"], row["serial"], row["revoked"]) for row in rows]
+
+    def disable(self, email: str) -> None:
+        """Deny a user new certificates and portal access until ``enable`` is called."""
+        self.db.execute("INSERT OR IGNORE INTO disabled_users (email, disabled) VALUES (?, ?)", (email, time.time()))
+
+    def enable(self, email: str) -> bool:
+        """Lift ``disable``; return False if the user was not disabled."""
+        return bool(self.db.execute("DELETE FROM disabled_users WHERE email = ?", (email,)).rowcount)
+
+    def is_disabled(self, email: str) -> bool:
+        return self.db.execute("SELECT 1 FROM disabled_users WHERE email = ?", (email,)).fetchone() is not None
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM certificates").fetchone()[0]
+
+    def rebuild(self, pki_dir) -> int:
+        """Replace the registry with the contents of a PKI's ``index.txt``; return the row count.
+
+        The CA's own server certificate and anything that is not a client
+        are included too; they simply never match a user lookup.
+        """
+        pki_dir = Path(pki_dir)
+        rows = []
+        try:
+            with open(pki_dir / "index.txt") as index:
+                lines = index.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+
+        for line in lines:
+            fields = line.split("\t")
+            if len(fields) < 6 or fields[0] not in _INDEX_STATUS:
+                continue
+            status, expires, revoked, serial, _, subject = fields[:6]
+            name = next((part[3:] for part in subject.split("/") if part.startswith("CN=")), None)
+            if not name:
+                continue
+
+            email, device = split_client_name(name)
+            rows.append(
+                {
+                    "serial": serial.upper(),
+                    "email": email,
+                    "device": device,
+                    "fingerprint": self._fingerprint_from_pki(pki_dir, serial, name),
+                    "not_after": parse_index_time(expires),
+                    "status": _INDEX_STATUS[status],
+                    "issued": None,
+                    "revoked": parse_index_time(revoked) if revoked else None,
+                }
+            )
+
+        with self.db.transaction() as db:
+            db.execute("DELETE FROM certificates")
+            db.executemany(
+                "INSERT OR REPLACE INTO certificates"
+                " (serial, email, device, fingerprint, not_after, status, issued, revoked)"
+                " VALUES (:serial, :email, :device, :fingerprint, :not_after, :status, :issued, :revoked)",
+                rows,
+            )
+            db.execute(_LOG_REVOCATIONS)
+        return len(rows)
+
+    @staticmethod
+    def _fingerprint_from_pki(pki_dir, serial, name):
+        for path in [pki_dir / "certs_by_serial" / f"{serial}.pem", pki_dir / "issued" / f"{name}.crt"]:
+            try:
+                cert = x509.load_pem_x509_certificate(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            if format_serial(cert.serial_number) == serial.upper():
+                return fingerprint(cert)
+        return None
+
+    def stats(self) -> dict:
+        rows = self.db.execute("SELECT status, COUNT(*) AS count FROM certificates GROUP BY status").fetchall()
+        counts = {status: 0 for status in (VALID, REVOKED, EXPIRED, SUPERSEDED)}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
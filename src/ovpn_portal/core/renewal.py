@@ -0,0 +1,124 @@
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+
+DAY = 86400
+# Wait before retrying a failed renewal; doubles with each failure, up to a day
+RETRY_DELAY = 3600
+
+
+class RenewalScheduler:
+    """Renews client certificates before they expire, off the request path.
+
+    Each pass asks the registry for valid certificates expiring within
+    ``window_days`` (an indexed, expiry-ordered query; no PEM is parsed),
+    renews at most ``batch_size`` of them at no more than ``rate`` per
+    second, and leaves the rest for the next pass. A certificate whose
+    renewal fails is retried with exponential backoff, so a few broken ones
+    cannot fill every batch. The pass also republishes the CRL before it
+    expires. Only one worker runs a pass at a time: the others skip it
+    while the lock file is held.
+    """
+
+    def __init__(self, vpn_manager, window_days: float = 30, interval: float = 3600, batch_size: int = 50, rate=5.0):
+        self.vpn_manager = vpn_manager
+        self.window_days = window_days
+        self.interval = interval
+        self.batch_size = batch_size
+        self.rate = rate
+        self.lock_path = Path(vpn_manager.config.OPENVPN_DIR) / "locks" / "renewal.lock"
+        self.renewed = 0
+        self.failed = 0
+        self.crl_published = 0
+        self.passes = 0
+        self.last_pass = None
+        self._stop = threading.Event()
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def due(self, limit: int = None) -> list:
+        """Return registry entries that should be renewed now, soonest expiry first."""
+        before = time.time() + self.window_days * DAY
+        return self.vpn_manager.registry.expiring(before, limit=limit or self.batch_size)
+
+    def run_once(self) -> dict:
+        """Run one rate-limited batch; return counts, or ``None`` if another worker holds the pass."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None
+            return self._run_batch()
+        finally:
+            os.close(fd)
+
+    def _run_batch(self) -> dict:
+        registry = self.vpn_manager.registry
+        result = {"renewed": 0, "superseded": 0, "failed": 0}
+
+        for row in self.due():
+            # Already replaced, e.g. by a renewal whose registry update raced this scan
+            active = registry.active(row["email"], row["device"])
+            if active is not None and active["serial"] != row["serial"]:
+                registry.supersede(row["serial"])
+                result["superseded"] += 1
+                continue
+
+            try:
+                self.vpn_manager.renew_client_certificates(row["email"], row["device"])
+                result["renewed"] += 1
+            except Exception:
+                delay = min(RETRY_DELAY * 2 ** row["renewal_attempts"], DAY)
+                registry.defer_renewal(row["serial"], time.time() + delay)
+                result["failed"] += 1
+            if self.rate:
+                time.sleep(1 / self.rate)
+
+        try:
+            if self.vpn_manager.revocation.refresh() is not None:
+                self.crl_published += 1
+        except Exception:
+            # CA key not loadable in-process; publish-crl from cron covers it
+            pass
+
+        self.renewed += result["renewed"]
+        self.failed += result["failed"]
+        self.passes += 1
+        self.last_pass = time.time()
+        return result
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                # Registry briefly unavailable; try again next interval
+                pass
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Start the background thread, once per process."""
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+            self._stop.clear()
+            threading.Thread(target=self._loop, daemon=True).start()
+            self._started_pid = os.getpid()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._lock:
+            self._started_pid = None
+
+    def stats(self) -> dict:
+        return {
+            "passes": self.passes,
+            "renewed": self.renewed,
+            "failed": self.failed,
+            "crl_published": self.crl_published,
+            "last_pass": self.last_pass,
+        }
@@ -0,0 +1,167 @@
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    """A ``{{NAME}}`` template split once into literal and placeholder segments.
+
+    Rendering is a single ``str.join`` over the segments, so the output is
+    built without intermediate copies of the whole document. Placeholders
+    with no value are left in place.
+    """
+
+    def __init__(self, text: str):
+        parts = _PLACEHOLDER.split(text)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+        self.version = hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    def partial(self, values: dict) -> "CompiledTemplate":
+        """Return a template with ``values`` filled in and the remaining placeholders kept."""
+        literals = [self.literals[0]]
+        names = []
+        for name, literal in zip(self.names, self.literals[1:]):
+            value = values.get(name)
+            if value is None:
+                names.append(name)
+                literals.append(literal)
+            else:
+                literals[-1] += value + literal
+
+        template = object.__new__(CompiledTemplate)
+        template.literals = literals
+        template.names = names
+        template.version = self.version
+        return template
+
+    def render(self, values: dict) -> str:
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            value = values.get(name)
+            parts.append("{{" + name + "}}" if value is None else value)
+            parts.append(literal)
+        return "".join(parts)
+
+
+class TemplateFile:
+    """Compiles a template file on first use and again only when its mtime changes."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._compiled = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self) -> CompiledTemplate:
+        mtime = os.stat(self.path).st_mtime_ns
+        if self._compiled is None or mtime != self._mtime:
+            with self._lock:
+                if self._compiled is None or mtime != self._mtime:
+                    self._compiled = CompiledTemplate(self.path.read_text())
+                    self._mtime = mtime
+        return self._compiled
+
+
+class TemplateRule:
+    """Picks a template for users whose token claims meet every given condition.
+
+    ``hd`` is the hosted domain, ``groups`` matches when the user is in any
+    of them, and ``email`` is a shell-style pattern such as
+    ``*@contractors.example.com``.
+    """
+
+    def __init__(self, template: TemplateFile, hd: str = None, groups=None, email: str = None):
+        if isinstance(groups, str):
+            groups = [groups]
+        self.template = template
+        self.hd = hd.lower() if hd else None
+        self.groups = frozenset(groups or ())
+        self.email = re.compile(fnmatch.translate(email), re.IGNORECASE) if email else None
+
+    def matches(self, claims: dict) -> bool:
+        if self.hd is not None and (claims.get("hd") or "").lower() != self.hd:
+            return False
+        if self.groups and self.groups.isdisjoint(claims.get("groups") or ()):
+            return False
+        if self.email is not None and not self.email.match(claims.get("email") or ""):
+            return False
+        return True
+
+
+class TemplateRegistry:
+    """Chooses each user's client template from their token claims.
+
+    Rules are tried in order and the first that matches wins; users matching
+    none get ``default``. Every rule is indexed under its hosted domain or
+    its groups, so a lookup only tests the rules a user could match (plus
+    those keyed on email alone) however many are defined.
+    """
+
+    def __init__(self, default: TemplateFile, rules=()):
+        self.default = default
+        self.rules = list(rules)
+        self._by_hd = {}
+        self._by_group = {}
+        self._unindexed = []
+        for i, rule in enumerate(self.rules):
+            if rule.hd is not None:
+                self._by_hd.setdefault(rule.hd, []).append(i)
+            elif rule.groups:
+                for group in rule.groups:
+                    self._by_group.setdefault(group, []).append(i)
+            else:
+                self._unindexed.append(i)
+
+    @property
+    def uses_groups(self) -> bool:
+        """Whether any rule depends on the ``groups`` claim."""
+        return any(rule.groups for rule in self.rules)
+
+    @classmethod
+    def load(cls, path, default: TemplateFile) -> "TemplateRegistry":
+        """Read rules from a JSON file and compile every template they name.
+
+        The file holds a list of objects with a ``template`` path (relative
+        to the file) and any of ``hd``, ``groups`` and ``email``. A missing
+        template or unknown key fails here, at startup, rather than on a
+        user's download.
+        """
+        path = Path(path)
+        with open(path) as f:
+            entries = json.load(f)
+
+        templates = {}
+        rules = []
+        for entry in entries:
+            entry = dict(entry)
+            template_path = path.parent / entry.pop("template")
+            unknown = set(entry) - {"hd", "groups", "email"}
+            if unknown:
+                raise ValueError(f"Unknown template rule keys: {', '.join(sorted(unknown))}")
+
+            if template_path not in templates:
+                templates[template_path] = TemplateFile(template_path)
+                templates[template_path].get()
+            rules.append(TemplateRule(templates[template_path], **entry))
+        return cls(default, rules)
+
+    def select(self, claims: dict) -> TemplateFile:
+        if not self.rules:
+            return self.default
+
+        candidates = set(self._unindexed)
+        candidates.update(self._by_hd.get((claims.get("hd") or "").lower(), ()))
+        for group in claims.get("groups") or ():
+            candidates.update(self._by_group.get(group, ()))
+
+        for i in sorted(candidates):
+            if self.rules[i].matches(claims):
+                return self.rules[i].template
+        return self.default
@@ -0,0 +1,205 @@
+import os
+import re
+import threading
+import time
+
+import requests
+from google.auth import transport
+from google.auth.transport.requests import Request
+
+DEFAULT_MAX_AGE = 300
+REFRESH_MARGIN = 60
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(headers, default=DEFAULT_MAX_AGE) -> int:
+    """Return the freshness lifetime advertised by a certs response, in seconds."""
+    cache_control = headers.get("Cache-Control", "") or headers.get("cache-control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+
+    match = _MAX_AGE_RE.search(cache_control)
+    if not match:
+        return default
+
+    age = headers.get("Age") or headers.get("age") or 0
+    try:
+        age = int(age)
+    except (TypeError, ValueError):
+        age = 0
+    return max(int(match.group(1)) - age, 0)
+
+
+class _CachedResponse(transport.Response):
+    """A certs response held in memory between verifications."""
+
+    def __init__(self, status, headers, data, max_age):
+        self._status = status
+        self._headers = dict(headers)
+        self._data = data
+        self.fetched_at = time.monotonic()
+        self.expires_at = self.fetched_at + max_age
+        # Set on the first cache hit; an unused entry is not refreshed ahead of expiry
+        self.used = False
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @property
+    def data(self):
+        return self._data
+
+
+class CachedCertsRequest(transport.Request):
+    """google-auth transport that caches GET responses for signing certificates.
+
+    Responses are kept for the Cache-Control max-age of the certs endpoint and
+    refreshed in the background shortly before they expire, so token
+    verification only waits on the network for the very first fetch. Only
+    entries that were used since their last fetch are refreshed, so an idle
+    worker stops polling. All fetches go through one pooled keep-alive
+    session.
+    """
+
+    def __init__(self, session=None, refresh_margin=REFRESH_MARGIN):
+        self.session = session or requests.Session()
+        self.refresh_margin = refresh_margin
+        self._request = Request(session=self.session)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._timers = {}
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+        self.fetch_seconds = 0.0
+
+    def __call__(self, url, method="GET", body=None, headers=None, timeout=None, **kwargs):
+        if method != "GET" or body is not None:
+            return self._request(url, method=method, body=body, headers=headers, timeout=timeout, **kwargs)
+
+        entry = self._entries.get(url)
+        now = time.monotonic()
+
+        if entry is not None and now < entry.expires_at:
+            entry.used = True
+            self._count("hits")
+            if now >= entry.expires_at - self.refresh_margin:
+                self._refresh_in_background(url, headers, timeout)
+            return entry
+
+        self._count("misses")
+        return self._fetch(url, headers, timeout)
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def _fetch(self, url, headers=None, timeout=None):
+        started = time.monotonic()
+        response = self._request(url, method="GET", headers=headers, timeout=timeout)
+        self._count("fetch_seconds", time.monotonic() - started)
+
+        if response.status != 200:
+            self._count("errors")
+            return response
+
+        entry = _CachedResponse(response.status, response.headers, response.data, parse_max_age(response.headers))
+        if entry.expires_at > entry.fetched_at:
+            with self._lock:
+                self._entries[url] = entry
+            self._schedule_refresh(url, entry, headers, timeout)
+        return entry
+
+    def _refresh(self, url, headers=None, timeout=None):
+        try:
+            self._fetch(url, headers, timeout)
+            self._count("refreshes")
+        except Exception:
+            self._count("errors")
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    def _refresh_in_background(self, url, headers=None, timeout=None):
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+
+        thread = threading.Thread(target=self._refresh, args=(url, headers, timeout), daemon=True)
+        thread.start()
+
+    def _schedule_refresh(self, url, entry, headers=None, timeout=None):
+        delay = entry.expires_at - self.refresh_margin - time.monotonic()
+        if delay <= 0:
+            return
+
+        timer = threading.Timer(delay, self._refresh_if_used, args=(url, headers, timeout))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.pop(url, None)
+            self._timers[url] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _refresh_if_used(self, url, headers=None, timeout=None):
+        with self._lock:
+            self._timers.pop(url, None)
+            entry = self._entries.get(url)
+        # Without traffic the timer is not re-armed; the next request refetches on demand
+        if entry is not None and entry.used:
+            self._refresh_in_background(url, headers, timeout)
+
+    def close(self):
+        """Cancel pending refreshes and release pooled connections."""
+        with self._lock:
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
+        self.session.close()
+
+    def stats(self) -> dict:
+        """Return cache counters, including the fetch time avoided by hits."""
+        fetches = self.misses + self.refreshes
+        average = self.fetch_seconds / fetches if fetches else 0.0
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_seconds": self.hits * average,
+        }
+
+
+_certs_request = None
+_certs_request_pid = None
+_certs_request_lock = threading.Lock()
+
+
+def get_certs_request() -> CachedCertsRequest:
+    """Return the process-wide certificate-caching transport.
+
+    A fresh instance is created after a fork so gunicorn workers never share
+    pooled sockets with their parent.
+    """
+    global _certs_request, _certs_request_pid
+
+    pid = os.getpid()
+    with _certs_request_lock:
+        if _certs_request is None or _certs_request_pid != pid:
+            _certs_request = CachedCertsRequest()
+            _certs_request_pid = pid
+        return _certs_request
@@ -1,5 +1,8 @@
+from functools import lru_cache
 from importlib.metadata import version
 
 
+@lru_cache(maxsize=None)
 def get_version():
+    # Reading the installed metadata scans site-packages; the answer is fixed for the process
     return version("gcp-ovpn-portal")
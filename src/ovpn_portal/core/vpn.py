@@ -1,7 +1,23 @@
 # src/ovpn_portal/core/vpn.py
-import subprocess
+import hashlib
+import time
 from pathlib import Path
 
+from cryptography import x509
+
+from .cache import FileCache, ProfileCache
+from .crl import RevocationList
+from .db import portal_db_path
+from .keypool import KeyPool
+from .keystore import KeyStore
+from .locks import LockStats, file_lock
+from .pki import EasyRSABackend, NativeBackend
+from .registry import SUPERSEDED, VALID, CertificateRegistry, client_name, split_client_name
+from .template import TemplateFile, TemplateRegistry
+
+TEMPLATE_PATH = Path(__file__).parent / "templates" / "client.ovpn"
+CLIENT_CERT_CACHE_SIZE = 4096
+
 
 class VPNManager:
     """Manages OpenVPN operations."""
@@ -9,70 +25,303 @@ class VPNManager:
     def __init__(self, config):
         self.config = config
         self.easy_rsa_dir = Path(config.OPENVPN_DIR) / "easy-rsa"
+        self.easyrsa_backend = EasyRSABackend(self.easy_rsa_dir, algorithm=config.CERT_KEY_ALGORITHM)
+        self.native_backend = NativeBackend(
+            self.easy_rsa_dir,
+            days=config.CERT_DAYS,
+            passphrase=config.CA_KEY_PASSPHRASE,
+            algorithm=config.CERT_KEY_ALGORITHM,
+        )
+        self.key_pool = None
+        if config.KEY_POOL_SIZE > 0:
+            # One pool per algorithm, so keys made before a CERT_KEY_ALGORITHM change are not handed out
+            self.key_pool = KeyPool(
+                Path(config.OPENVPN_DIR) / "keypool" / config.CERT_KEY_ALGORITHM,
+                self.native_backend.generate_key,
+                size=config.KEY_POOL_SIZE,
+                low_water=config.KEY_POOL_LOW_WATER,
+                concurrency=config.KEY_POOL_CONCURRENCY,
+            )
+        # Per-user certificate and key storage under OPENVPN_DIR/clients
+        self.keys = KeyStore(Path(config.OPENVPN_DIR) / "clients", legacy_dir=Path(config.OPENVPN_DIR))
+        self.template = TemplateFile(TEMPLATE_PATH)
+        self.templates = TemplateRegistry(self.template)
+        if config.PROFILE_TEMPLATES:
+            self.templates = TemplateRegistry.load(config.PROFILE_TEMPLATES, self.template)
+        self.files = FileCache()
+        self.client_certs = FileCache(maxsize=CLIENT_CERT_CACHE_SIZE)
+        self._server_templates = {}
+        self.profiles = ProfileCache(config.PROFILE_CACHE_SIZE, spill_dir=config.PROFILE_CACHE_DIR)
+        self.issuance_locks = LockStats()
+        self.registry = CertificateRegistry(portal_db_path(config))
+        self._registry_checked = False
+        self.revocation = RevocationList(
+            self.native_backend,
+            self.registry,
+            [self.easy_rsa_dir / "pki" / "crl.pem", Path(config.OPENVPN_DIR) / "crl.pem"],
+            days=config.CRL_DAYS,
+        )
+
+    def _check_registry(self) -> None:
+        """Import an existing PKI into an empty registry, once per manager."""
+        if self._registry_checked:
+            return
+        if self.registry.count() == 0:
+            self.registry.rebuild(self.easy_rsa_dir / "pki")
+        self._registry_checked = True
+
+    def has_client_certificates(self, email: str, device: str = "") -> bool:
+        """Return whether a user (or one of their devices) has a valid certificate and key.
+
+        The registry answers for every certificate issued through it. Files
+        are only probed for users it has never seen, i.e. certificates that
+        predate the registry and could not be imported from index.txt.
+        """
+        self._check_registry()
+        if self.registry.active(email, device) is not None:
+            return True
+        if self.registry.known(email, device):
+            # Expired or revoked
+            return False
+
+        return self.keys.locate(client_name(email, device)) is not None
 
-    def ensure_client_certificates(self, email: str) -> None:
-        """Ensure client certificates exist, generate if needed."""
-        cert_path = Path(self.config.OPENVPN_DIR) / f"{email}.crt"
-        key_path = Path(self.config.OPENVPN_DIR) / f"{email}.key"
+    def ensure_client_certificates(self, email: str, device: str = "") -> None:
+        """Ensure client certificates exist, generate if needed.
 
-        if cert_path.exists() and key_path.exists():
+        Generation is single-flight per certificate across all workers: the
+        first caller takes the lock file and issues, later callers block on
+        the lock and then find the certificates already in place. Users an
+        administrator disabled get PermissionError instead.
+        """
+        if self.has_client_certificates(email, device):
             return
+        if self.registry.is_disabled(email):
+            raise PermissionError(f"{email} has been disabled by an administrator")
+
+        name = client_name(email, device)
+        with self._user_lock(name):
+            if self.has_client_certificates(email, device):
+                return
+            if self.registry.known(email, device):
+                # Reissuing after expiry or revocation
+                self._remove_issued(name)
+            self._generate_client_certificates(name)
+
+    def renew_client_certificates(self, email: str, device: str = ""):
+        """Issue a replacement certificate for a user's device and return its registry entry.
+
+        The old certificate is marked superseded (it stays usable until it
+        expires) and the cached profile material is dropped. Users an
+        administrator disabled get PermissionError instead.
+        """
+        if self.registry.is_disabled(email):
+            raise PermissionError(f"{email} has been disabled by an administrator")
+
+        name = client_name(email, device)
+        with self._user_lock(name):
+            previous = self.registry.active(email, device)
+            self._remove_issued(name)
+            self._generate_client_certificates(name)
+            if previous is not None:
+                self.registry.supersede(previous["serial"])
+            self.invalidate_profile(email, device)
+        return self.registry.active(email, device)
+
+    def invalidate_profile(self, email: str, device: str = "") -> None:
+        """Forget cached profile material for a user's device.
+
+        The rendered profile is dropped everywhere; the certificate text only
+        in this worker (other workers notice the replaced file by its stat).
+        """
+        name = client_name(email, device)
+        for cert_path, _ in [self.keys.paths(name), self.keys.legacy_paths(name)]:
+            self.client_certs.invalidate(str(cert_path))
+        self.profiles.invalidate(name)
+
+    def _user_lock(self, name: str):
+        return file_lock(Path(self.config.OPENVPN_DIR) / "locks" / f"{name}.lock", stats=self.issuance_locks)
+
+    def _remove_issued(self, name: str) -> None:
+        """Remove a name's request, certificate and key from the PKI so easy-rsa can issue it again.
+
+        The index.txt entry and ``certs_by_serial`` copy of the old
+        certificate are kept.
+        """
+        pki_dir = self.easy_rsa_dir / "pki"
+        for path in ["reqs/{}.req", "issued/{}.crt", "private/{}.key"]:
+            (pki_dir / path.format(name)).unlink(missing_ok=True)
 
-        self._generate_client_certificates(email)
+    def devices(self, email: str) -> list:
+        """Return a user's devices that hold a valid certificate."""
+        self._check_registry()
+        return [row for row in self.registry.devices(email) if row["device"]]
 
-    def _generate_client_certificates(self, email: str) -> None:
-        """Generate client certificates."""
+    def revoke_certificates(self, emails, serials=None, device: str = None, disable: bool = False) -> list:
+        """Revoke users' usable certificates, or only those in ``serials``; return the serials revoked.
+
+        All of a user's devices are included unless ``device`` names one.
+        Usable means valid, or superseded by a renewal but not yet expired.
+
+        The whole batch is published as one new CRL. A user's next download
+        after a revocation issues a fresh certificate, unless ``disable``
+        also denies them new certificates and portal access (see
+        ``enable_user``).
+        """
+        self._check_registry()
+        if disable:
+            for email in dict.fromkeys(emails):
+                self.registry.disable(email)
+        wanted = {serial.upper() for serial in serials} if serials is not None else None
+        now = time.time()
+        targets = [
+            row
+            for email in dict.fromkeys(emails)
+            for row in self.registry.for_email(email)
+            if (row["status"] == VALID or (row["status"] == SUPERSEDED and row["not_after"] > now))
+            and (wanted is None or row["serial"] in wanted)
+            and (device is None or row["device"] == device)
+        ]
+        revoked = self.revocation.revoke([row["serial"] for row in targets])
+        for row in targets:
+            self.invalidate_profile(row["email"], row["device"])
+        return revoked
+
+    def enable_user(self, email: str) -> bool:
+        """Let a disabled user sign in and get certificates again; return False if they were not disabled."""
+        return self.registry.enable(email)
+
+    def issuance_backend(self):
+        """Return the backend selected by CERT_BACKEND.
+
+        ``auto`` signs in-process when the CA key can be loaded and falls back
+        to easy-rsa otherwise, e.g. for a passphrase-protected CA.
+        """
+        choice = self.config.CERT_BACKEND
+        if choice == "easyrsa":
+            return self.easyrsa_backend
+        if choice == "native" or self.native_backend.available():
+            return self.native_backend
+        return self.easyrsa_backend
+
+    def _generate_client_certificates(self, name: str) -> None:
+        """Generate client certificates for a certificate name (``email`` or ``email+device``)."""
         if not self.easy_rsa_dir.exists():
             raise RuntimeError("easy-rsa directory not found. Run setup first.")
 
-        try:
-            subprocess.run(
-                ["./easyrsa", "gen-req", email, "nopass"],
-                cwd=self.easy_rsa_dir,
-                check=True,
-                capture_output=True,
-                text=True,
-                input=f"{email}\n",
-            )
+        backend = self.issuance_backend()
+        if backend is self.native_backend:
+            # Only the signing step has to happen on the request path
+            key = self.key_pool.take() if self.key_pool is not None else None
+            cert = backend.issue(name, key=key)
+        else:
+            backend.issue(name)
+            cert = None
 
-            subprocess.run(
-                ["./easyrsa", "sign-req", "client", email],
-                cwd=self.easy_rsa_dir,
-                check=True,
-                capture_output=True,
-                text=True,
-                input="yes\n",
-            )
+        # Copy files to the key store, then drop any copies left in the old flat layout
+        cert_pem = (self.easy_rsa_dir / f"pki/issued/{name}.crt").read_bytes()
+        key_pem = (self.easy_rsa_dir / f"pki/private/{name}.key").read_bytes()
+        self.keys.write(name, cert_pem, key_pem)
+        for path in self.keys.legacy_paths(name):
+            path.unlink(missing_ok=True)
+        self.profiles.invalidate(name)
 
-            # Copy files to OpenVPN directory
-            for ext in [".crt", ".key"]:
-                src = self.easy_rsa_dir / f"pki/{'issued' if ext == '.crt' else 'private'}/{email}{ext}"
-                dst = Path(self.config.OPENVPN_DIR) / f"{email}{ext}"
-                dst.write_bytes(src.read_bytes())
+        if cert is None:
+            try:
+                cert = x509.load_pem_x509_certificate(cert_pem)
+            except ValueError:
+                return
+        email, device = split_client_name(name)
+        self.registry.record(email, cert, device=device)
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Certificate generation failed: {e.stdout} {e.stderr}")
+    def _client_paths(self, email: str, device: str = ""):
+        name = client_name(email, device)
+        paths = self.keys.locate(name)
+        if paths is None:
+            raise FileNotFoundError(f"No certificate found for {name}")
+        return paths
 
-    def generate_config(self, email: str) -> str:
-        """Generate OpenVPN configuration for a user."""
-        self.ensure_client_certificates(email)
+    def select_template(self, email: str, claims: dict = None) -> TemplateFile:
+        """Return the client template PROFILE_TEMPLATES assigns to a user's token claims."""
+        return self.templates.select(dict(claims or {}, email=email))
 
-        # Get the absolute path to the templates directory
-        current_file = Path(__file__)  # Get the path of the current file
-        template_path = current_file.parent / "templates" / "client.ovpn"
+    def generate_config(self, email: str, device: str = "", claims: dict = None) -> str:
+        """Generate OpenVPN configuration for a user, or for one of their devices.
 
-        config = template_path.read_text()
+        ``claims`` from the user's token choose the template; without them
+        only email rules apply.
 
-        # Replace placeholders
-        replacements = {
-            "{{EXTERNAL_IP}}": self.config.EXTERNAL_IP,
-            "{{CA_CERT}}": (Path(self.config.OPENVPN_DIR) / "ca.crt").read_text(),
-            "{{CLIENT_CERT}}": (Path(self.config.OPENVPN_DIR) / f"{email}.crt").read_text(),
-            "{{CLIENT_KEY}}": (Path(self.config.OPENVPN_DIR) / f"{email}.key").read_text(),
-            "{{TLS_AUTH}}": (Path(self.config.OPENVPN_DIR) / "ta.key").read_text(),
-        }
+        Every device shares the cached CA/tls-auth material and the
+        pre-rendered server part of the template; only the device's own
+        certificate and key are read. Rendered profiles are cached under
+        their ETag, so a repeat download costs a few stat() calls.
+        """
+        self.ensure_client_certificates(email, device)
 
-        for key, value in replacements.items():
-            config = config.replace(key, value)
+        name = client_name(email, device)
+        if name in self.profiles:
+            profile = self.profiles.get(name, self.profile_etag(email, device, claims))
+            if profile is not None:
+                return profile
 
-        return config
+        template_file = self.select_template(email, claims)
+        template = template_file.get()
+        ca = self.files.get(str(Path(self.config.OPENVPN_DIR) / "ca.crt"))
+        cert_path, key_path = self._client_paths(email, device)
+        client_cert = self.client_certs.get(str(cert_path))
+        client_key = key_path.read_text()
+        tls_auth = self.files.get(str(Path(self.config.OPENVPN_DIR) / "ta.key"))
+
+        server_template = self._get_server_template(template_file.path, template, ca, tls_auth)
+        profile = server_template.render({"CLIENT_CERT": client_cert.text, "CLIENT_KEY": client_key})
+        self.profiles.set(name, self._profile_version(template, ca, client_cert, tls_auth), profile)
+        return profile
+
+    def _get_server_template(self, path, template, ca, tls_auth):
+        """Return the template with the server-wide parts (CA, tls-auth, remote) already filled in."""
+        key = (template.version, ca.fingerprint, tls_auth.fingerprint, self.config.EXTERNAL_IP)
+        cached_key, server_template = self._server_templates.get(path, (None, None))
+        if key != cached_key:
+            server_template = template.partial(
+                {
+                    "EXTERNAL_IP": self.config.EXTERNAL_IP,
+                    "CA_CERT": ca.text,
+                    "TLS_AUTH": tls_auth.text,
+                }
+            )
+            self._server_templates[path] = (key, server_template)
+        return server_template
+
+    def profile_etag(self, email: str, device: str = "", claims: dict = None) -> str:
+        """Return a strong validator for a user's profile without rendering it.
+
+        The tag covers the template version, the remote address and the
+        fingerprints of the CA, client certificate and tls-auth key; the
+        client key is implied by its certificate.
+        """
+        openvpn_dir = Path(self.config.OPENVPN_DIR)
+        return self._profile_version(
+            self.select_template(email, claims).get(),
+            self.files.get(str(openvpn_dir / "ca.crt")),
+            self.client_certs.get(str(self._client_paths(email, device)[0])),
+            self.files.get(str(openvpn_dir / "ta.key")),
+        )
+
+    def _profile_version(self, template, ca, client_cert, tls_auth) -> str:
+        parts = [
+            template.version,
+            self.config.EXTERNAL_IP,
+            ca.fingerprint,
+            client_cert.fingerprint,
+            tls_auth.fingerprint,
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+    def stats(self) -> dict:
+        return {
+            "server_files": self.files.stats(),
+            "client_certs": self.client_certs.stats(),
+            "profiles": self.profiles.stats(),
+            "key_pool": self.key_pool.stats() if self.key_pool is not None else None,
+            "issuance_locks": self.issuance_locks.stats(),
+        }
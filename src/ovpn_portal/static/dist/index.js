@@ -201,7 +201,7 @@ Check the render method of %s.`,pe(gn)||"Unknown"));var u=mr(i,o);u.payload={ele
 
   let root = createRoot(domContainer);
   root.render(<App />);`),t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(i=t.onRecoverableError),t.transitionCallbacks!==void 0&&t.transitionCallbacks);var o=Gg(e,Fs,null,n,a,r,i);Ms(o.current,e);var l=e.nodeType===ht?e.parentNode:e;return zl(l),new nm(o)}function Ic(e){this._internalRoot=e}function D_(e){e&&YE(e)}Ic.prototype.unstable_scheduleHydration=D_;function __(e,t,n){if(!qc(e))throw new Error("hydrateRoot(...): Target container is not a DOM element.");mS(e),t===void 0&&d("Must provide initial children as second argument to hydrateRoot. Example usage: hydrateRoot(domContainer, <App />)");var a=n??null,r=n!=null&&n.hydratedSources||null,i=!1,o=!1,l="",u=vS;n!=null&&(n.unstable_strictMode===!0&&(i=!0),n.identifierPrefix!==void 0&&(l=n.identifierPrefix),n.onRecoverableError!==void 0&&(u=n.onRecoverableError));var c=Qg(t,null,e,Fs,a,i,o,l,u);if(Ms(c.current,e),zl(e),r)for(var f=0;f<r.length;f++){var h=r[f];MT(c,h)}return new Ic(c)}function qc(e){return!!(e&&(e.nodeType===kn||e.nodeType===ir||e.nodeType===uf))}function Mu(e){return!!(e&&(e.nodeType===kn||e.nodeType===ir||e.nodeType===uf||e.nodeType===ht&&e.nodeValue===" react-mount-point-unstable "))}function mS(e){e.nodeType===kn&&e.tagName&&e.tagName.toUpperCase()==="BODY"&&d("createRoot(): Creating roots directly with document.body is discouraged, since its children are often manipulated by third-party scripts and browser extensions. This may lead to subtle reconciliation issues. Try using a container element created for your app."),Wl(e)&&(e._reactRootContainer?d("You are calling ReactDOMClient.createRoot() on a container that was previously passed to ReactDOM.render(). This is not supported."):d("You are calling ReactDOMClient.createRoot() on a container that has already been passed to createRoot() before. Instead, call root.render() on the existing root instead if you want to update it."))}var O_=I.ReactCurrentOwner,hS;hS=function(e){if(e._reactRootContainer&&e.nodeType!==ht){var t=Xg(e._reactRootContainer.current);t&&t.parentNode!==e&&d("render(...): It looks like the React-rendered content of this container was removed without using React. This is not supported and will cause errors. Instead, call ReactDOM.unmountComponentAtNode to empty a container.")}var n=!!e._reactRootContainer,a=am(e),r=!!(a&&Ur(a));r&&!n&&d("render(...): Replacing React-rendered children with a new root component. If you intended to update the children of this node, you should instead have the existing children update their state and render the new components instead of calling ReactDOM.render."),e.nodeType===kn&&e.tagName&&e.tagName.toUpperCase()==="BODY"&&d("render(): Rendering components directly into document.body is discouraged, since its children are often manipulated by third-party scripts and browser extensions. This may lead to subtle reconciliation issues. Try rendering into a container element created for your app.")};function am(e){return e?e.nodeType===ir?e.documentElement:e.firstChild:null}function yS(){}function k_(e,t,n,a,r){if(r){if(typeof a=="function"){var i=a;a=function(){var m=Pc(o);i.call(m)}}var o=Qg(t,a,e,zr,null,!1,!1,"",yS);e._reactRootContainer=o,Ms(o.current,e);var l=e.nodeType===ht?e.parentNode:e;return zl(l),gr(),o}else{for(var u;u=e.lastChild;)e.removeChild(u);if(typeof a=="function"){var c=a;a=function(){var m=Pc(f);c.call(m)}}var f=Gg(e,zr,null,!1,!1,"",yS);e._reactRootContainer=f,Ms(f.current,e);var h=e.nodeType===ht?e.parentNode:e;return zl(h),gr(function(){ju(t,f,n,a)}),f}}function j_(e,t){e!==null&&typeof e!="function"&&d("%s(...): Expected the last optional `callback` argument to be a function. Instead received: %s.",t,e)}function Gc(e,t,n,a,r){hS(n),j_(r===void 0?null:r,"render");var i=n._reactRootContainer,o;if(!i)o=k_(n,t,e,r,a);else{if(o=i,typeof r=="function"){var l=r;r=function(){var u=Pc(o);l.call(u)}}ju(t,o,e,r)}return Pc(o)}var bS=!1;function M_(e){{bS||(bS=!0,d("findDOMNode is deprecated and will be removed in the next major release. Instead, add a ref directly to the element you want to reference. Learn more about using refs safely here: https://reactjs.org/link/strict-mode-find-node"));var t=O_.current;if(t!==null&&t.stateNode!==null){var n=t.stateNode._warnedAboutRefsInRender;n||d("%s is accessing findDOMNode inside its render(). render() should be a pure function of props and state. It should never access something that requires stale data from the previous render, such as refs. Move this logic to componentDidMount and componentDidUpdate instead.",Ae(t.type)||"A component"),t.stateNode._warnedAboutRefsInRender=!0}}return e==null?null:e.nodeType===kn?e:y_(e,"findDOMNode")}function A_(e,t,n){if(d("ReactDOM.hydrate is no longer supported in React 18. Use hydrateRoot instead. Until you switch to the new API, your app will behave as if it's running React 17. Learn more: https://reactjs.org/link/switch-to-createroot"),!Mu(t))throw new Error("Target container is not a DOM element.");{var a=Wl(t)&&t._reactRootContainer===void 0;a&&d("You are calling ReactDOM.hydrate() on a container that was previously passed to ReactDOMClient.createRoot(). This is not supported. Did you mean to call hydrateRoot(container, element)?")}return Gc(null,e,t,!0,n)}function L_(e,t,n){if(d("ReactDOM.render is no longer supported in React 18. Use createRoot instead. Until you switch to the new API, your app will behave as if it's running React 17. Learn more: https://reactjs.org/link/switch-to-createroot"),!Mu(t))throw new Error("Target container is not a DOM element.");{var a=Wl(t)&&t._reactRootContainer===void 0;a&&d("You are calling ReactDOM.render() on a container that was previously passed to ReactDOMClient.createRoot(). This is not supported. Did you mean to call root.render(element)?")}return Gc(null,e,t,!1,n)}function U_(e,t,n,a){if(d("ReactDOM.unstable_renderSubtreeIntoContainer() is no longer supported in React 18. Consider using a portal instead. Until you switch to the createRoot API, your app will behave as if it's running React 17. Learn more: https://reactjs.org/link/switch-to-createroot"),!Mu(n))throw new Error("Target container is not a DOM element.");if(e==null||!Ox(e))throw new Error("parentComponent must be a valid React Component");return Gc(e,t,n,!1,a)}var gS=!1;function V_(e){if(gS||(gS=!0,d("unmountComponentAtNode is deprecated and will be removed in the next major release. Switch to the createRoot API. Learn more: https://reactjs.org/link/switch-to-createroot")),!Mu(e))throw new Error("unmountComponentAtNode(...): Target container is not a DOM element.");{var t=Wl(e)&&e._reactRootContainer===void 0;t&&d("You are calling ReactDOM.unmountComponentAtNode() on a container that was previously passed to ReactDOMClient.createRoot(). This is not supported. Did you mean to call root.unmount()?")}if(e._reactRootContainer){{var n=am(e),a=n&&!Ur(n);a&&d("unmountComponentAtNode(): The node you're attempting to unmount was rendered by another copy of React.")}return gr(function(){Gc(null,null,e,!1,function(){e._reactRootContainer=null,vy(e)})}),!0}else{{var r=am(e),i=!!(r&&Ur(r)),o=e.nodeType===kn&&Mu(e.parentNode)&&!!e.parentNode._reactRootContainer;i&&d("unmountComponentAtNode(): The node you're attempting to unmount was rendered by React and is not a top-level container. %s",o?"You may have accidentally passed in a React root node instead of its container.":"Instead, have the parent component update its state and rerender in order to remove this component.")}return!1}}ME(b_),LE(g_),UE(S_),VE(ga),zE(OE),(typeof Map!="function"||Map.prototype==null||typeof Map.prototype.forEach!="function"||typeof Set!="function"||Set.prototype==null||typeof Set.prototype.clear!="function"||typeof Set.prototype.forEach!="function")&&d("React depends on Map and Set built-in types. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills"),gx(HR),Ex(Av,_D,gr);function z_(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:null;if(!qc(t))throw new Error("Target container is not a DOM element.");return h_(e,t,null,n)}function H_(e,t,n,a){return U_(e,t,n,a)}var rm={usingClientEntryPoint:!1,Events:[Ur,go,As,Om,km,Av]};function F_(e,t){return rm.usingClientEntryPoint||d('You are importing createRoot from "react-dom" which is not supported. You should instead import it from "react-dom/client".'),N_(e,t)}function B_(e,t,n){return rm.usingClientEntryPoint||d('You are importing hydrateRoot from "react-dom" which is not supported. You should instead import it from "react-dom/client".'),__(e,t,n)}function $_(e){return Tg()&&d("flushSync was called from inside a lifecycle method. React cannot flush when React is already rendering. Consider moving this call to a scheduler task or micro task."),gr(e)}var Y_=T_({findFiberByHostInstance:Ri,bundleType:1,version:Kv,rendererPackageName:"react-dom"});if(!Y_&&qt&&window.top===window.self&&(navigator.userAgent.indexOf("Chrome")>-1&&navigator.userAgent.indexOf("Edge")===-1||navigator.userAgent.indexOf("Firefox")>-1)){var SS=window.location.protocol;/^(https?|file):$/.test(SS)&&console.info("%cDownload the React DevTools for a better development experience: https://reactjs.org/link/react-devtools"+(SS==="file:"?`
-You might need to use a local HTTP server (instead of file://): https://reactjs.org/link/react-devtools-faq`:""),"font-weight:bold")}Vn.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=rm,Vn.createPortal=z_,Vn.createRoot=F_,Vn.findDOMNode=M_,Vn.flushSync=$_,Vn.hydrate=A_,Vn.hydrateRoot=B_,Vn.render=L_,Vn.unmountComponentAtNode=V_,Vn.unstable_batchedUpdates=Av,Vn.unstable_renderSubtreeIntoContainer=H_,Vn.version=Kv,typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"&&typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.registerInternalModuleStop=="function"&&__REACT_DEVTOOLS_GLOBAL_HOOK__.registerInternalModuleStop(new Error)}(),Vn}var DS;function J_(){return DS||(DS=1,lm.exports=K_()),lm.exports}var _S;function Z_(){if(_S)return Wc;_S=1;var M=J_();{var T=M.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED;Wc.createRoot=function(I,oe){T.usingClientEntryPoint=!0;try{return M.createRoot(I,oe)}finally{T.usingClientEntryPoint=!1}},Wc.hydrateRoot=function(I,oe,ve){T.usingClientEntryPoint=!0;try{return M.hydrateRoot(I,oe,ve)}finally{T.usingClientEntryPoint=!1}}}return Wc}var e0=Z_();const kS=()=>{const[M,T]=bt.useState({connected:!1,clientIp:null,loading:!0});return bt.useEffect(()=>{const I=()=>new Promise((W,d)=>{const ge=new Set,L=window.RTCPeerConnection||window.webkitRTCPeerConnection||window.mozRTCPeerConnection;if(!L){d(new Error("WebRTC not supported"));return}const j=setTimeout(()=>{te&&te.close(),W(Array.from(ge))},1e3),te=new L({iceServers:[{urls:"stun:stun.l.google.com:19302"}],iceCandidatePoolSize:1});te.createDataChannel(""),te.onicecandidate=U=>{if(!U.candidate){clearTimeout(j),te.close(),W(Array.from(ge));return}const ae=/([0-9]{1,3}(\.[0-9]{1,3}){3}|[a-f0-9]{1,4}(:[a-f0-9]{1,4}){7})/i.exec(U.candidate.candidate);ae&&ae[1]&&ge.add(ae[1])},te.createOffer().then(U=>te.setLocalDescription(U)).catch(U=>{clearTimeout(j),te.close(),d(U)})}),oe=async()=>{var W;T(d=>({...d,loading:!0}));try{const d=await I(),ge=((W=window.VPN_NETWORK)==null?void 0:W.split(".").slice(0,2).join("."))||"10.8",L=d.some(j=>{try{return j.startsWith(ge)}catch(te){return console.error("Error checking IP:",te),!1}});T({connected:L,clientIp:d.find(j=>j.startsWith("10.8."))||d[0],allIps:d,loading:!1})}catch(d){console.error("Error checking VPN status:",d),T({connected:!1,clientIp:"Unknown",loading:!1})}};oe();const ve=setInterval(oe,1e4);return()=>clearInterval(ve)},[]),M},t0=()=>{const{connected:M,clientIp:T}=kS(),[I,oe]=bt.useState({location:{city:"Loading...",country:"...",region:""},latency:{value:null},connectionQuality:{status:"checking"}}),ve=W=>W?W<50?{status:"Excellent",color:"green"}:W<100?{status:"Good",color:"green"}:W<200?{status:"Fair",color:"yellow"}:{status:"Poor",color:"red"}:{status:"unknown",color:"gray"};return bt.useEffect(()=>{const W=async()=>{try{const ge=performance.now(),L=await fetch("https://get.geojs.io/v1/ip/geo.json");if(!L.ok)throw new Error("Location API request failed");const j=await L.json(),te=Math.round(performance.now()-ge),U=ve(te);oe({location:{city:j.city,region:j.region,country:j.country,isp:j.organization_name,loading:!1},latency:{value:te,loading:!1},connectionQuality:{status:U.status,color:U.color,loading:!1}})}catch(ge){console.error("Error fetching metrics:",ge),oe(L=>({...L,location:{city:"Error loading",region:"Unknown",country:"Unknown",isp:"Unknown",loading:!1},latency:{value:null,loading:!1},connectionQuality:{status:"unknown",color:"gray",loading:!1}}))}};W();const d=setInterval(W,1e4);return()=>clearInterval(d)},[M]),g.jsxDEV("div",{className:"bg-white rounded-lg shadow-sm p-4 mb-4",children:[g.jsxDEV("div",{className:"mb-4 border-b border-gray-100 pb-4",children:[g.jsxDEV("div",{className:"flex items-center justify-between mb-2",children:[g.jsxDEV("h3",{className:"text-sm font-medium text-gray-800",children:"Connection Status"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:91,columnNumber:11},void 0),g.jsxDEV("span",{className:`px-2 py-1 text-xs rounded-full ${M?"bg-green-100 text-green-800":"bg-gray-100 text-gray-800"}`,children:M?"Connected":"Not Connected"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:94,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:90,columnNumber:9},void 0),!I.connectionQuality.loading&&g.jsxDEV("div",{className:"flex items-center mt-2 justify-between",children:[g.jsxDEV("span",{className:"text-sm text-gray-600 mr-2",children:"Connection Quality:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:108,columnNumber:13},void 0),g.jsxDEV("span",{className:`text-sm font-medium ${I.connectionQuality.color==="green"?"text-green-600":I.connectionQuality.color==="yellow"?"text-yellow-600":I.connectionQuality.color==="red"?"text-red-600":"text-gray-600"}`,children:I.connectionQuality.status},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:111,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:107,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:89,columnNumber:7},void 0),g.jsxDEV("div",{className:"space-y-3",children:[g.jsxDEV("div",{className:"flex justify-between items-start text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"Location:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:132,columnNumber:11},void 0),g.jsxDEV("div",{className:"text-right",children:[g.jsxDEV("div",{className:"font-medium",children:I.location.loading?"Loading...":`${I.location.city}, ${I.location.region}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:134,columnNumber:13},void 0),g.jsxDEV("div",{className:"font-medium text-gray-500 text-xs",children:I.location.loading?"Loading...":I.location.country},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:139,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:133,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:131,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex justify-between items-center text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"Network Provider:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:149,columnNumber:11},void 0),g.jsxDEV("span",{className:"font-medium text-right max-w-28",children:I.location.loading?"Loading...":I.location.isp||"Unknown"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:150,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:148,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex justify-between items-center text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"IP Address:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:159,columnNumber:11},void 0),g.jsxDEV("span",{className:"font-medium",children:T||"Unknown"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:160,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:158,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex justify-between items-center text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"Response Time:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:165,columnNumber:11},void 0),g.jsxDEV("span",{className:`font-medium ${I.latency.value<100?"text-green-600":I.latency.value<200?"text-yellow-600":"text-red-600"}`,children:I.latency.loading?"Loading...":`${I.latency.value}ms`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:166,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:164,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:129,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:87,columnNumber:5},void 0)},cm=({status:M,text:T})=>{const I=oe=>({connected:"bg-green-500",disconnected:"bg-red-500",checking:"bg-blue-500 animate-pulse",warning:"bg-yellow-500"})[oe]||"bg-gray-500";return g.jsxDEV("div",{className:"flex items-center space-x-2",children:[g.jsxDEV("div",{className:`h-2 w-2 rounded-full ${I(M)}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/StatusIndicator/index.jsx",lineNumber:16,columnNumber:7},void 0),T&&g.jsxDEV("span",{className:"text-sm",children:T},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/StatusIndicator/index.jsx",lineNumber:17,columnNumber:16},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/StatusIndicator/index.jsx",lineNumber:15,columnNumber:5},void 0)},n0=({isConnected:M})=>{const[T,I]=bt.useState({dns:{status:"pending",latency:null},connectivity:{status:"pending",details:[]},stability:{status:"pending",samples:[],drops:0,averageLatency:null}}),oe=async()=>{const ge=["google.com","amazon.com","microsoft.com"],L=[];for(const U of ge){const ae=performance.now();try{await fetch(`https://${U}/favicon.ico`,{mode:"no-cors"});const Y=performance.now()-ae;L.push({success:!0,latency:Y})}catch{L.push({success:!1,latency:null})}}const j=L.filter(U=>U.success).length,te=L.filter(U=>U.success).reduce((U,ae)=>U+ae.latency,0)/j||0;return{status:j>=2?"healthy":"issue",latency:Math.round(te)}},ve=async()=>{const ge=[{name:"VPN Endpoint",url:"/health"},{name:"DNS Resolution",url:"https://1.1.1.1/favicon.ico",mode:"no-cors"},{name:"External Access",url:"https://www.google.com/favicon.ico",mode:"no-cors"}],L=[];for(const j of ge)try{const te=performance.now();await fetch(j.url,j.mode?{mode:j.mode}:{}),L.push({name:j.name,status:"success",latency:Math.round(performance.now()-te)})}catch(te){L.push({name:j.name,status:"failed",error:te.message})}return{status:L.every(j=>j.status==="success")?"healthy":"issue",details:L}},W=async()=>{const L=[];let j=0;for(let ae=0;ae<5;ae++){try{const Y=performance.now();await fetch("/health"),L.push(performance.now()-Y)}catch{j++,L.push(null)}await new Promise(Y=>setTimeout(Y,200))}const te=L.filter(ae=>ae!==null),U=te.length?Math.round(te.reduce((ae,Y)=>ae+Y,0)/te.length):null;return{status:j<=1?"stable":j<=2?"unstable":"poor",samples:L,drops:j,averageLatency:U}},d=async()=>{I(te=>({...te,dns:{...te.dns,status:"checking"},connectivity:{...te.connectivity,status:"checking"},stability:{...te.stability,status:"checking"}}));const[ge,L,j]=await Promise.all([oe(),ve(),W()]);I({dns:ge,connectivity:L,stability:j})};return bt.useEffect(()=>{d();const ge=setInterval(d,6e4);return()=>clearInterval(ge)},[M]),g.jsxDEV("div",{className:"bg-white rounded-lg shadow-sm p-4 mb-4",children:[g.jsxDEV("div",{className:"flex items-center justify-between mb-4",children:[g.jsxDEV("h3",{className:"text-sm font-medium text-gray-800",children:"Connection Diagnostics"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:152,columnNumber:9},void 0),T.dns.status==="checking"?g.jsxDEV("div",{className:"flex",children:[g.jsxDEV("span",{className:"text-xs text-blue-600 mr-2",children:"Running Tests..."},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:157,columnNumber:13},void 0),g.jsxDEV("div",{className:"animate-spin rounded-full h-4 w-4 border-2 border-gray-300 border-t-gray-600"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:158,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:156,columnNumber:11},void 0):g.jsxDEV("button",{className:"text-xs text-blue-600 hover:text-blue-800",onClick:d,children:"Run Tests"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:161,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:151,columnNumber:7},void 0),g.jsxDEV("div",{className:"mb-3",children:g.jsxDEV(cm,{status:T.dns.status,text:`DNS Resolution: ${T.dns.status==="checking"?"Checking...":T.dns.status==="healthy"?`Healthy (${T.dns.latency}ms)`:"Issues Detected"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:172,columnNumber:9},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:171,columnNumber:7},void 0),g.jsxDEV("div",{className:"mb-3",children:[g.jsxDEV(cm,{status:T.connectivity.status,text:`Connectivity: ${T.connectivity.status==="checking"?"Checking...":T.connectivity.status==="healthy"?"All Services Reachable":"Some Services Unreachable"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:186,columnNumber:9},void 0),T.connectivity.details.map((ge,L)=>g.jsxDEV("div",{className:"ml-4 text-xs text-gray-500 mt-1",children:`${ge.name}: ${ge.status==="success"?`${ge.latency}ms`:"Failed"}`},`detail-${L}`,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:197,columnNumber:11},void 0))]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:185,columnNumber:7},void 0),g.jsxDEV("div",{className:"mb-3",children:[g.jsxDEV(cm,{status:T.stability.status,text:`Connection Stability: ${T.stability.status==="checking"?"Checking...":T.stability.status==="stable"?`Stable (avg ${T.stability.averageLatency}ms)`:T.stability.status==="unstable"?"Minor Issues Detected":"Unstable Connection"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:210,columnNumber:9},void 0),T.stability.drops>0&&g.jsxDEV("div",{className:"ml-4 text-xs text-gray-500 mt-1",children:`Packet Loss: ${(T.stability.drops/5*100).toFixed(1)}%`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:223,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:209,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:149,columnNumber:5},void 0)},jS=bt.createContext(null),a0=({children:M})=>{const[T,I]=bt.useState({isAuthenticated:!1,email:null,token:null,loading:!0});bt.useEffect(()=>{(async()=>{try{const d=await(await fetch("/auth/status")).json();I({isAuthenticated:d.authenticated,email:d.email,token:d.token,loading:!1})}catch(W){console.error("Auth check failed:",W),I(d=>({...d,loading:!1}))}})()},[]);const oe=ve=>{I({isAuthenticated:!0,email:ve.email,token:ve.token,loading:!1})};return g.jsxDEV(jS.Provider,{value:{...T,updateAuth:oe},children:M},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/context/AuthContext.jsx",lineNumber:45,columnNumber:5},void 0)},dm=()=>{const M=bt.useContext(jS);if(!M)throw new Error("useAuth must be used within an AuthProvider");return M},r0=()=>g.jsxDEV("div",{className:"flex items-center space-x-2 mb-8",children:g.jsxDEV("div",{className:"h-8 flex items-center",children:g.jsxDEV("svg",{height:"32",viewBox:"0 0 540 80",className:"h-full w-auto",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[g.jsxDEV("path",{d:"M28 72s32-16 32-40V12L28 0 0 12v20c0 24 28 40 28 40z",fill:"#F78B1F"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:15,columnNumber:11},void 0),g.jsxDEV("path",{d:"M28 16c-4.4 0-8 3.6-8 8v4h-4v16h24V28h-4v-4c0-4.4-3.6-8-8-8zm0 4c2.2 0 4 1.8 4 4v4H24v-4c0-2.2 1.8-4 4-4z",fill:"white"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:21,columnNumber:11},void 0),g.jsxDEV("text",{x:"70",y:"45",style:{fontFamily:"Arial, sans-serif",fontSize:"32px",fontWeight:"bold",fill:"#333333"},children:`OpenVPN Client Portal (v${window.VERSION})`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:27,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:7,columnNumber:9},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:6,columnNumber:7},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:5,columnNumber:5},void 0),i0=({isAuthenticated:M,email:T})=>g.jsxDEV("div",{className:"bg-white p-4 rounded-lg shadow-sm border border-gray-200 mb-6",children:[g.jsxDEV("div",{className:"text-sm font-medium text-gray-800 mb-2",children:"Authentication"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:6,columnNumber:7},void 0),g.jsxDEV("div",{className:"text-xs text-gray-600",children:M?`Signed in: ${T}`:"Not authenticated"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:9,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:5,columnNumber:5},void 0),o0=()=>{const{updateAuth:M}=dm(),T=async ve=>{try{const d=await(await fetch("/",{method:"POST",headers:{"Content-Type":"application/x-www-form-urlencoded",Accept:"application/json"},body:"credential="+ve.credential,credentials:"same-origin"})).json();if(d.success&&d.token)return M({email:d.email,token:d.token}),d.token;throw new Error(d.error||"Authentication failed")}catch(W){console.error("Authentication error:",W)}},I=()=>{window.google.accounts.id.initialize({client_id:window.CLIENT_ID,callback:T,state_cookie_domain:window.location.hostname,auto_select:!0,ux_mode:"redirect",login_uri:window.location.origin+"/"})};return bt.useEffect(()=>{const W=setInterval(async()=>{try{const ge=await(await fetch("/auth/status",{credentials:"same-origin"})).json();ge.authenticated?M(ge):window.google.accounts.id.prompt(L=>{console.log("Prompt notification:",L)})}catch(d){console.error("Error checking auth status:",d)}},1e4);return()=>{clearInterval(W)}},[M]),{renderGoogleButton:ve=>{var W,d;(d=(W=window.google)==null?void 0:W.accounts)!=null&&d.id&&(I(),window.google.accounts.id.renderButton(document.getElementById(ve),{type:"standard",theme:"outline",size:"large",shape:"pill",text:"signin_with",width:250}))}}},l0=({isAuthenticated:M,token:T})=>{const{renderGoogleButton:I}=o0(),oe=bt.useRef(null),ve=async()=>{if(T)try{const W=await fetch("/vpn/download-config",{headers:{Authorization:`Bearer ${T}`}});if(W.ok){const d=await W.blob(),ge=window.URL.createObjectURL(d),L=document.createElement("a");L.href=ge,L.download="client.ovpn",document.body.appendChild(L),L.click(),window.URL.revokeObjectURL(ge),document.body.removeChild(L)}else{const d=await W.json();throw new Error(d.error||"Download failed")}}catch(W){console.error("Download error:",W),alert("Error downloading configuration: "+W.message)}};return bt.useEffect(()=>{!M&&oe.current&&I("signInDiv")},[M,I]),g.jsxDEV("div",{className:"mt-auto",children:M?g.jsxDEV("button",{onClick:ve,className:"w-full bg-orange-700 text-white px-4 py-2 rounded-lg hover:bg-orange-800 flex items-center justify-center space-x-2",children:[g.jsxDEV("svg",{className:"w-4 h-4",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:g.jsxDEV("path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4M7 10l5 5 5-5M12 15V3"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:59,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:52,columnNumber:11},void 0),g.jsxDEV("span",{children:"Download Config"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:61,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:48,columnNumber:9},void 0):g.jsxDEV("div",{id:"signInDiv",ref:oe,className:"w-full px-4 py-2 rounded-lg flex items-center justify-center space-x-2"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:64,columnNumber:9},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:46,columnNumber:5},void 0)},u0=(M=1e4)=>{const[T,I]=bt.useState({isActive:!1,isOperational:!1,loading:!0});return bt.useEffect(()=>{const oe=async()=>{try{const d=await(await fetch("/health")).json();I({isActive:!0,isOperational:d.status==="healthy",loading:!1})}catch(W){console.error("Error checking server status:",W),I({isActive:!1,isOperational:!1,loading:!1})}};oe();const ve=setInterval(oe,M);return()=>clearInterval(ve)},[M]),T},s0=({pollingInterval:M})=>{const T=u0(M);return g.jsxDEV("div",{className:"bg-white rounded-lg shadow-sm p-6 mb-6",children:[g.jsxDEV("div",{className:"flex items-center space-x-2 mb-4",children:[g.jsxDEV("div",{className:`h-2 w-2 rounded-full ${T.loading?"bg-gray-300":T.isActive&&T.isOperational?"bg-green-500":"bg-red-500"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:11,columnNumber:9},void 0),g.jsxDEV("span",{className:`text-sm font-medium ${T.loading?"text-gray-500":T.isActive&&T.isOperational?"text-green-700":"text-red-700"}`,children:T.loading?"Checking Status...":T.isActive&&T.isOperational?"Server Active":"Server Offline"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:20,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:10,columnNumber:7},void 0),g.jsxDEV("div",{className:"flex items-center justify-between text-sm text-gray-600 border-t border-gray-100 pt-4",children:[g.jsxDEV("span",{children:"Server Status"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:39,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex items-center space-x-1",children:T.loading?g.jsxDEV(bt.Fragment,{children:[g.jsxDEV("div",{className:"animate-spin rounded-full h-4 w-4 border-2 border-gray-300 border-t-gray-600"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:43,columnNumber:15},void 0),g.jsxDEV("span",{className:"text-gray-600",children:"Checking..."},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:44,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:42,columnNumber:13},void 0):g.jsxDEV(bt.Fragment,{children:[g.jsxDEV("svg",{className:`h-4 w-4 ${T.isOperational?"text-green-500":"text-red-500"}`,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:T.isOperational?g.jsxDEV("polyline",{points:"20 6 9 17 4 12"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:58,columnNumber:19},void 0):g.jsxDEV("line",{x1:"18",y1:"6",x2:"6",y2:"18"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:60,columnNumber:19},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:48,columnNumber:15},void 0),g.jsxDEV("span",{className:T.isOperational?"text-green-600":"text-red-600",children:T.isOperational?"Operational":"Offline"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:63,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:47,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:40,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:38,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:8,columnNumber:5},void 0)},c0=({version:M="v2.5.1"})=>g.jsxDEV("div",{className:"mt-6 text-center",children:g.jsxDEV("p",{className:"text-xs text-gray-500",children:["OpenVPN • ",M]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DrawerFooter/index.jsx",lineNumber:6,columnNumber:7},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DrawerFooter/index.jsx",lineNumber:5,columnNumber:5},void 0),f0=()=>{const{isAuthenticated:M,email:T,token:I}=dm(),oe=kS();return g.jsxDEV("div",{className:"w-128 h-screen bg-gray-50 border-r border-gray-200 p-6 fixed left-0 top-0",children:g.jsxDEV("div",{className:"flex flex-col h-full",children:[g.jsxDEV(r0,{},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:21,columnNumber:9},void 0),g.jsxDEV(i0,{isAuthenticated:M,email:T},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:24,columnNumber:9},void 0),M&&g.jsxDEV(bt.Fragment,{children:[g.jsxDEV(s0,{pollingInterval:1e4},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:29,columnNumber:13},void 0),g.jsxDEV(t0,{isConnected:oe.connected,clientIp:oe.clientIp},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:32,columnNumber:13},void 0),oe.connected&&g.jsxDEV(n0,{isConnected:oe.connected},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:39,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:27,columnNumber:11},void 0),g.jsxDEV(l0,{isAuthenticated:M,token:I},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:45,columnNumber:9},void 0),g.jsxDEV(c0,{},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:48,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:19,columnNumber:7},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:18,columnNumber:5},void 0)},OS=({href:M,children:T})=>g.jsxDEV("a",{href:M,className:"download-link",children:T},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadLink/index.jsx",lineNumber:4,columnNumber:3},void 0),Er=({title:M,children:T})=>g.jsxDEV("div",{className:"instruction-card",children:[g.jsxDEV("h3",{children:M},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/InstructionCard/index.jsx",lineNumber:5,columnNumber:5},void 0),T]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/InstructionCard/index.jsx",lineNumber:4,columnNumber:3},void 0),Lu=({children:M})=>g.jsxDEV("pre",{className:"bg-gray-100 p-2 rounded mt-2 overflow-x-auto",children:M},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/CommandBlock/index.jsx",lineNumber:4,columnNumber:3},void 0),d0=()=>{const{isAuthenticated:M}=dm(),[T,I]=bt.useState("windows"),oe={windows:{label:"Windows",content:g.jsxDEV("div",{className:"space-y-6",children:[g.jsxDEV(Er,{title:"Step 1: Download OpenVPN Client",children:g.jsxDEV(OS,{href:"https://openvpn.net/downloads/openvpn-connect-v3-windows.msi",children:"Download OpenVPN Connect for Windows"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:18,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:17,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 2: Install OpenVPN Connect",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Double-click the downloaded MSI file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:25,columnNumber:15},void 0),g.jsxDEV("li",{children:"Follow the installation wizard"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:26,columnNumber:15},void 0),g.jsxDEV("li",{children:"Accept the default settings when prompted"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:27,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:24,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:23,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 3: Import Configuration",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Download your personal client.ovpn file using the button in the left panel"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:33,columnNumber:15},void 0),g.jsxDEV("li",{children:"Double-click the downloaded .ovpn file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:37,columnNumber:15},void 0),g.jsxDEV("li",{children:"OpenVPN Connect will automatically import the configuration"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:38,columnNumber:15},void 0),g.jsxDEV("li",{children:'Click "Connect" to establish the VPN connection'},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:41,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:32,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:31,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:16,columnNumber:9},void 0)},mac:{label:"macOS",content:g.jsxDEV("div",{className:"space-y-6",children:[g.jsxDEV(Er,{title:"Step 1: Download OpenVPN Client",children:g.jsxDEV(OS,{href:"https://openvpn.net/downloads/openvpn-connect-v3-macos.dmg",children:"Download OpenVPN Connect for macOS"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:52,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:51,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 2: Install OpenVPN Connect",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Open the downloaded .dmg file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:59,columnNumber:15},void 0),g.jsxDEV("li",{children:"Drag OpenVPN Connect to the Applications folder"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:60,columnNumber:15},void 0),g.jsxDEV("li",{children:"Launch OpenVPN Connect from Applications"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:61,columnNumber:15},void 0),g.jsxDEV("li",{children:"Allow system extensions if prompted"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:62,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:58,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:57,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 3: Import Configuration",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Download your personal client.ovpn file using the button in the left panel"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:68,columnNumber:15},void 0),g.jsxDEV("li",{children:"Open OpenVPN Connect"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:72,columnNumber:15},void 0),g.jsxDEV("li",{children:"Drag and drop the .ovpn file into the OpenVPN Connect window"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:73,columnNumber:15},void 0),g.jsxDEV("li",{children:'Click "Add" to import the profile'},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:76,columnNumber:15},void 0),g.jsxDEV("li",{children:'Click "Connect" to establish the VPN connection'},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:77,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:67,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:66,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:50,columnNumber:9},void 0)},linux:{label:"Linux",content:g.jsxDEV("div",{className:"space-y-6",children:[g.jsxDEV(Er,{title:"Debian/Ubuntu Installation",children:[g.jsxDEV("p",{className:"mb-4",children:"Open terminal and run the following commands:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:88,columnNumber:13},void 0),g.jsxDEV(Lu,{children:`sudo apt update
+You might need to use a local HTTP server (instead of file://): https://reactjs.org/link/react-devtools-faq`:""),"font-weight:bold")}Vn.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=rm,Vn.createPortal=z_,Vn.createRoot=F_,Vn.findDOMNode=M_,Vn.flushSync=$_,Vn.hydrate=A_,Vn.hydrateRoot=B_,Vn.render=L_,Vn.unmountComponentAtNode=V_,Vn.unstable_batchedUpdates=Av,Vn.unstable_renderSubtreeIntoContainer=H_,Vn.version=Kv,typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"&&typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.registerInternalModuleStop=="function"&&__REACT_DEVTOOLS_GLOBAL_HOOK__.registerInternalModuleStop(new Error)}(),Vn}var DS;function J_(){return DS||(DS=1,lm.exports=K_()),lm.exports}var _S;function Z_(){if(_S)return Wc;_S=1;var M=J_();{var T=M.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED;Wc.createRoot=function(I,oe){T.usingClientEntryPoint=!0;try{return M.createRoot(I,oe)}finally{T.usingClientEntryPoint=!1}},Wc.hydrateRoot=function(I,oe,ve){T.usingClientEntryPoint=!0;try{return M.hydrateRoot(I,oe,ve)}finally{T.usingClientEntryPoint=!1}}}return Wc}var e0=Z_();const kS=()=>{const[M,T]=bt.useState({connected:!1,clientIp:null,loading:!0});return bt.useEffect(()=>{const I=()=>new Promise((W,d)=>{const ge=new Set,L=window.RTCPeerConnection||window.webkitRTCPeerConnection||window.mozRTCPeerConnection;if(!L){d(new Error("WebRTC not supported"));return}const j=setTimeout(()=>{te&&te.close(),W(Array.from(ge))},1e3),te=new L({iceServers:[{urls:"stun:stun.l.google.com:19302"}],iceCandidatePoolSize:1});te.createDataChannel(""),te.onicecandidate=U=>{if(!U.candidate){clearTimeout(j),te.close(),W(Array.from(ge));return}const ae=/([0-9]{1,3}(\.[0-9]{1,3}){3}|[a-f0-9]{1,4}(:[a-f0-9]{1,4}){7})/i.exec(U.candidate.candidate);ae&&ae[1]&&ge.add(ae[1])},te.createOffer().then(U=>te.setLocalDescription(U)).catch(U=>{clearTimeout(j),te.close(),d(U)})}),oe=async()=>{var W;T(d=>({...d,loading:!0}));try{const d=await I(),ge=((W=window.VPN_NETWORK)==null?void 0:W.split(".").slice(0,2).join("."))||"10.8",L=d.some(j=>{try{return j.startsWith(ge)}catch(te){return console.error("Error checking IP:",te),!1}});T({connected:L,clientIp:d.find(j=>j.startsWith("10.8."))||d[0],allIps:d,loading:!1})}catch(d){console.error("Error checking VPN status:",d),T({connected:!1,clientIp:"Unknown",loading:!1})}};oe();const ve=setInterval(oe,1e4);return()=>clearInterval(ve)},[]),M},t0=()=>{const{connected:M,clientIp:T}=kS(),[I,oe]=bt.useState({location:{city:"Loading...",country:"...",region:""},latency:{value:null},connectionQuality:{status:"checking"}}),ve=W=>W?W<50?{status:"Excellent",color:"green"}:W<100?{status:"Good",color:"green"}:W<200?{status:"Fair",color:"yellow"}:{status:"Poor",color:"red"}:{status:"unknown",color:"gray"};return bt.useEffect(()=>{const W=async()=>{try{const ge=performance.now(),L=await fetch("https://get.geojs.io/v1/ip/geo.json");if(!L.ok)throw new Error("Location API request failed");const j=await L.json(),te=Math.round(performance.now()-ge),U=ve(te);oe({location:{city:j.city,region:j.region,country:j.country,isp:j.organization_name,loading:!1},latency:{value:te,loading:!1},connectionQuality:{status:U.status,color:U.color,loading:!1}})}catch(ge){console.error("Error fetching metrics:",ge),oe(L=>({...L,location:{city:"Error loading",region:"Unknown",country:"Unknown",isp:"Unknown",loading:!1},latency:{value:null,loading:!1},connectionQuality:{status:"unknown",color:"gray",loading:!1}}))}};W();const d=setInterval(W,1e4);return()=>clearInterval(d)},[M]),g.jsxDEV("div",{className:"bg-white rounded-lg shadow-sm p-4 mb-4",children:[g.jsxDEV("div",{className:"mb-4 border-b border-gray-100 pb-4",children:[g.jsxDEV("div",{className:"flex items-center justify-between mb-2",children:[g.jsxDEV("h3",{className:"text-sm font-medium text-gray-800",children:"Connection Status"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:91,columnNumber:11},void 0),g.jsxDEV("span",{className:`px-2 py-1 text-xs rounded-full ${M?"bg-green-100 text-green-800":"bg-gray-100 text-gray-800"}`,children:M?"Connected":"Not Connected"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:94,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:90,columnNumber:9},void 0),!I.connectionQuality.loading&&g.jsxDEV("div",{className:"flex items-center mt-2 justify-between",children:[g.jsxDEV("span",{className:"text-sm text-gray-600 mr-2",children:"Connection Quality:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:108,columnNumber:13},void 0),g.jsxDEV("span",{className:`text-sm font-medium ${I.connectionQuality.color==="green"?"text-green-600":I.connectionQuality.color==="yellow"?"text-yellow-600":I.connectionQuality.color==="red"?"text-red-600":"text-gray-600"}`,children:I.connectionQuality.status},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:111,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:107,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:89,columnNumber:7},void 0),g.jsxDEV("div",{className:"space-y-3",children:[g.jsxDEV("div",{className:"flex justify-between items-start text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"Location:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:132,columnNumber:11},void 0),g.jsxDEV("div",{className:"text-right",children:[g.jsxDEV("div",{className:"font-medium",children:I.location.loading?"Loading...":`${I.location.city}, ${I.location.region}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:134,columnNumber:13},void 0),g.jsxDEV("div",{className:"font-medium text-gray-500 text-xs",children:I.location.loading?"Loading...":I.location.country},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:139,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:133,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:131,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex justify-between items-center text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"Network Provider:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:149,columnNumber:11},void 0),g.jsxDEV("span",{className:"font-medium text-right max-w-28",children:I.location.loading?"Loading...":I.location.isp||"Unknown"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:150,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:148,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex justify-between items-center text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"IP Address:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:159,columnNumber:11},void 0),g.jsxDEV("span",{className:"font-medium",children:T||"Unknown"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:160,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:158,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex justify-between items-center text-sm",children:[g.jsxDEV("span",{className:"text-gray-600",children:"Response Time:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:165,columnNumber:11},void 0),g.jsxDEV("span",{className:`font-medium ${I.latency.value<100?"text-green-600":I.latency.value<200?"text-yellow-600":"text-red-600"}`,children:I.latency.loading?"Loading...":`${I.latency.value}ms`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:166,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:164,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:129,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/NetworkMetrics/index.jsx",lineNumber:87,columnNumber:5},void 0)},cm=({status:M,text:T})=>{const I=oe=>({connected:"bg-green-500",disconnected:"bg-red-500",checking:"bg-blue-500 animate-pulse",warning:"bg-yellow-500"})[oe]||"bg-gray-500";return g.jsxDEV("div",{className:"flex items-center space-x-2",children:[g.jsxDEV("div",{className:`h-2 w-2 rounded-full ${I(M)}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/StatusIndicator/index.jsx",lineNumber:16,columnNumber:7},void 0),T&&g.jsxDEV("span",{className:"text-sm",children:T},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/StatusIndicator/index.jsx",lineNumber:17,columnNumber:16},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/StatusIndicator/index.jsx",lineNumber:15,columnNumber:5},void 0)},n0=({isConnected:M})=>{const[T,I]=bt.useState({dns:{status:"pending",latency:null},connectivity:{status:"pending",details:[]},stability:{status:"pending",samples:[],drops:0,averageLatency:null}}),oe=async()=>{const ge=["google.com","amazon.com","microsoft.com"],L=[];for(const U of ge){const ae=performance.now();try{await fetch(`https://${U}/favicon.ico`,{mode:"no-cors"});const Y=performance.now()-ae;L.push({success:!0,latency:Y})}catch{L.push({success:!1,latency:null})}}const j=L.filter(U=>U.success).length,te=L.filter(U=>U.success).reduce((U,ae)=>U+ae.latency,0)/j||0;return{status:j>=2?"healthy":"issue",latency:Math.round(te)}},ve=async()=>{const ge=[{name:"VPN Endpoint",url:"/health"},{name:"DNS Resolution",url:"https://1.1.1.1/favicon.ico",mode:"no-cors"},{name:"External Access",url:"https://www.google.com/favicon.ico",mode:"no-cors"}],L=[];for(const j of ge)try{const te=performance.now();await fetch(j.url,j.mode?{mode:j.mode}:{}),L.push({name:j.name,status:"success",latency:Math.round(performance.now()-te)})}catch(te){L.push({name:j.name,status:"failed",error:te.message})}return{status:L.every(j=>j.status==="success")?"healthy":"issue",details:L}},W=async()=>{const L=[];let j=0;for(let ae=0;ae<5;ae++){try{const Y=performance.now();await fetch("/health"),L.push(performance.now()-Y)}catch{j++,L.push(null)}await new Promise(Y=>setTimeout(Y,200))}const te=L.filter(ae=>ae!==null),U=te.length?Math.round(te.reduce((ae,Y)=>ae+Y,0)/te.length):null;return{status:j<=1?"stable":j<=2?"unstable":"poor",samples:L,drops:j,averageLatency:U}},d=async()=>{I(te=>({...te,dns:{...te.dns,status:"checking"},connectivity:{...te.connectivity,status:"checking"},stability:{...te.stability,status:"checking"}}));const[ge,L,j]=await Promise.all([oe(),ve(),W()]);I({dns:ge,connectivity:L,stability:j})};return bt.useEffect(()=>{d();const ge=setInterval(d,6e4);return()=>clearInterval(ge)},[M]),g.jsxDEV("div",{className:"bg-white rounded-lg shadow-sm p-4 mb-4",children:[g.jsxDEV("div",{className:"flex items-center justify-between mb-4",children:[g.jsxDEV("h3",{className:"text-sm font-medium text-gray-800",children:"Connection Diagnostics"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:152,columnNumber:9},void 0),T.dns.status==="checking"?g.jsxDEV("div",{className:"flex",children:[g.jsxDEV("span",{className:"text-xs text-blue-600 mr-2",children:"Running Tests..."},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:157,columnNumber:13},void 0),g.jsxDEV("div",{className:"animate-spin rounded-full h-4 w-4 border-2 border-gray-300 border-t-gray-600"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:158,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:156,columnNumber:11},void 0):g.jsxDEV("button",{className:"text-xs text-blue-600 hover:text-blue-800",onClick:d,children:"Run Tests"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:161,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:151,columnNumber:7},void 0),g.jsxDEV("div",{className:"mb-3",children:g.jsxDEV(cm,{status:T.dns.status,text:`DNS Resolution: ${T.dns.status==="checking"?"Checking...":T.dns.status==="healthy"?`Healthy (${T.dns.latency}ms)`:"Issues Detected"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:172,columnNumber:9},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:171,columnNumber:7},void 0),g.jsxDEV("div",{className:"mb-3",children:[g.jsxDEV(cm,{status:T.connectivity.status,text:`Connectivity: ${T.connectivity.status==="checking"?"Checking...":T.connectivity.status==="healthy"?"All Services Reachable":"Some Services Unreachable"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:186,columnNumber:9},void 0),T.connectivity.details.map((ge,L)=>g.jsxDEV("div",{className:"ml-4 text-xs text-gray-500 mt-1",children:`${ge.name}: ${ge.status==="success"?`${ge.latency}ms`:"Failed"}`},`detail-${L}`,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:197,columnNumber:11},void 0))]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:185,columnNumber:7},void 0),g.jsxDEV("div",{className:"mb-3",children:[g.jsxDEV(cm,{status:T.stability.status,text:`Connection Stability: ${T.stability.status==="checking"?"Checking...":T.stability.status==="stable"?`Stable (avg ${T.stability.averageLatency}ms)`:T.stability.status==="unstable"?"Minor Issues Detected":"Unstable Connection"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:210,columnNumber:9},void 0),T.stability.drops>0&&g.jsxDEV("div",{className:"ml-4 text-xs text-gray-500 mt-1",children:`Packet Loss: ${(T.stability.drops/5*100).toFixed(1)}%`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:223,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:209,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/ConnectionDiagnostics/index.jsx",lineNumber:149,columnNumber:5},void 0)},jS=bt.createContext(null),a0=({children:M})=>{const[T,I]=bt.useState({isAuthenticated:!1,email:null,token:null,loading:!0});bt.useEffect(()=>{(async()=>{try{const d=await(await fetch("/auth/status")).json();I({isAuthenticated:d.authenticated,email:d.email,token:d.token,loading:!1})}catch(W){console.error("Auth check failed:",W),I(d=>({...d,loading:!1}))}})()},[]);const oe=ve=>{I({isAuthenticated:!0,email:ve.email,token:ve.token,loading:!1})};return g.jsxDEV(jS.Provider,{value:{...T,updateAuth:oe},children:M},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/context/AuthContext.jsx",lineNumber:45,columnNumber:5},void 0)},dm=()=>{const M=bt.useContext(jS);if(!M)throw new Error("useAuth must be used within an AuthProvider");return M},r0=()=>g.jsxDEV("div",{className:"flex items-center space-x-2 mb-8",children:g.jsxDEV("div",{className:"h-8 flex items-center",children:g.jsxDEV("svg",{height:"32",viewBox:"0 0 540 80",className:"h-full w-auto",fill:"none",xmlns:"http://www.w3.org/2000/svg",children:[g.jsxDEV("path",{d:"M28 72s32-16 32-40V12L28 0 0 12v20c0 24 28 40 28 40z",fill:"#F78B1F"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:15,columnNumber:11},void 0),g.jsxDEV("path",{d:"M28 16c-4.4 0-8 3.6-8 8v4h-4v16h24V28h-4v-4c0-4.4-3.6-8-8-8zm0 4c2.2 0 4 1.8 4 4v4H24v-4c0-2.2 1.8-4 4-4z",fill:"white"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:21,columnNumber:11},void 0),g.jsxDEV("text",{x:"70",y:"45",style:{fontFamily:"Arial, sans-serif",fontSize:"32px",fontWeight:"bold",fill:"#333333"},children:`OpenVPN Client Portal (v${window.VERSION})`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:27,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:7,columnNumber:9},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:6,columnNumber:7},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Logo/index.jsx",lineNumber:5,columnNumber:5},void 0),Xk=()=>{const M=new URLSearchParams(window.location.search),T=M.get("error");if(T){M.delete("error");const I=M.toString();window.history.replaceState(null,"",window.location.pathname+(I?`?${I}`:"")+window.location.hash)}return T},i0=({isAuthenticated:M,email:T})=>{const[I]=bt.useState(Xk);return g.jsxDEV("div",{className:"bg-white p-4 rounded-lg shadow-sm border border-gray-200 mb-6",children:[g.jsxDEV("div",{className:"text-sm font-medium text-gray-800 mb-2",children:"Authentication"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:24,columnNumber:7},void 0),g.jsxDEV("div",{className:"text-xs text-gray-600",children:M?`Signed in: ${T}`:"Not authenticated"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:27,columnNumber:7},void 0),!M&&I&&g.jsxDEV("div",{className:"text-xs text-red-600 mt-2",role:"alert",children:["Sign-in failed: ",I]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:31,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/AuthStatus/index.jsx",lineNumber:23,columnNumber:5},void 0)},o0=()=>{const{updateAuth:M}=dm(),T=async ve=>{try{const d=await(await fetch("/",{method:"POST",headers:{"Content-Type":"application/x-www-form-urlencoded",Accept:"application/json"},body:"credential="+ve.credential,credentials:"same-origin"})).json();if(d.success&&d.token)return M({email:d.email,token:d.token}),d.token;throw new Error(d.error||"Authentication failed")}catch(W){console.error("Authentication error:",W)}},I=()=>{window.google.accounts.id.initialize({client_id:window.CLIENT_ID,callback:T,state_cookie_domain:window.location.hostname,auto_select:!0,ux_mode:"redirect",login_uri:window.location.origin+"/"})};return bt.useEffect(()=>{const W=setInterval(async()=>{try{const ge=await(await fetch("/auth/status",{credentials:"same-origin"})).json();ge.authenticated?M(ge):window.google.accounts.id.prompt(L=>{console.log("Prompt notification:",L)})}catch(d){console.error("Error checking auth status:",d)}},1e4);return()=>{clearInterval(W)}},[M]),{renderGoogleButton:ve=>{var W,d;(d=(W=window.google)==null?void 0:W.accounts)!=null&&d.id&&(I(),window.google.accounts.id.renderButton(document.getElementById(ve),{type:"standard",theme:"outline",size:"large",shape:"pill",text:"signin_with",width:250}))}}},Yj=M=>new Promise(T=>setTimeout(T,M)),Zj=async(M,T)=>{for(;;){const I=await fetch(M,{headers:{Authorization:`Bearer ${T}`}}),oe=await I.json();if(!I.ok||oe.status==="failed")throw new Error(oe.error||"Certificate issuance failed");if(oe.status==="done")return;await Yj(Number(I.headers.get("Retry-After")||2)*1e3)}},l0=({isAuthenticated:M,token:T})=>{const{renderGoogleButton:I}=o0(),oe=bt.useRef(null),ve=async()=>{if(T)try{const Xj=()=>fetch("/vpn/download-config",{headers:{Authorization:`Bearer ${T}`}});let W=await Xj();if(W.status===202){const d=await W.json();await Zj(d.url,T),W=await Xj()}if(W.ok){const d=await W.blob(),ge=window.URL.createObjectURL(d),L=document.createElement("a");L.href=ge,L.download="client.ovpn",document.body.appendChild(L),L.click(),window.URL.revokeObjectURL(ge),document.body.removeChild(L)}else{const d=await W.json();throw new Error(d.error||"Download failed")}}catch(W){console.error("Download error:",W),alert("Error downloading configuration: "+W.message)}};return bt.useEffect(()=>{!M&&oe.current&&I("signInDiv")},[M,I]),g.jsxDEV("div",{className:"mt-auto",children:M?g.jsxDEV("button",{onClick:ve,className:"w-full bg-orange-700 text-white px-4 py-2 rounded-lg hover:bg-orange-800 flex items-center justify-center space-x-2",children:[g.jsxDEV("svg",{className:"w-4 h-4",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:g.jsxDEV("path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4M7 10l5 5 5-5M12 15V3"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:59,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:52,columnNumber:11},void 0),g.jsxDEV("span",{children:"Download Config"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:61,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:48,columnNumber:9},void 0):g.jsxDEV("div",{id:"signInDiv",ref:oe,className:"w-full px-4 py-2 rounded-lg flex items-center justify-center space-x-2"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:64,columnNumber:9},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadConfig/index.jsx",lineNumber:46,columnNumber:5},void 0)},u0=(M=1e4)=>{const[T,I]=bt.useState({isActive:!1,isOperational:!1,loading:!0});return bt.useEffect(()=>{const oe=async()=>{try{const d=await(await fetch("/health")).json();I({isActive:!0,isOperational:d.status==="healthy",loading:!1})}catch(W){console.error("Error checking server status:",W),I({isActive:!1,isOperational:!1,loading:!1})}};oe();const ve=setInterval(oe,M);return()=>clearInterval(ve)},[M]),T},s0=({pollingInterval:M})=>{const T=u0(M);return g.jsxDEV("div",{className:"bg-white rounded-lg shadow-sm p-6 mb-6",children:[g.jsxDEV("div",{className:"flex items-center space-x-2 mb-4",children:[g.jsxDEV("div",{className:`h-2 w-2 rounded-full ${T.loading?"bg-gray-300":T.isActive&&T.isOperational?"bg-green-500":"bg-red-500"}`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:11,columnNumber:9},void 0),g.jsxDEV("span",{className:`text-sm font-medium ${T.loading?"text-gray-500":T.isActive&&T.isOperational?"text-green-700":"text-red-700"}`,children:T.loading?"Checking Status...":T.isActive&&T.isOperational?"Server Active":"Server Offline"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:20,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:10,columnNumber:7},void 0),g.jsxDEV("div",{className:"flex items-center justify-between text-sm text-gray-600 border-t border-gray-100 pt-4",children:[g.jsxDEV("span",{children:"Server Status"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:39,columnNumber:9},void 0),g.jsxDEV("div",{className:"flex items-center space-x-1",children:T.loading?g.jsxDEV(bt.Fragment,{children:[g.jsxDEV("div",{className:"animate-spin rounded-full h-4 w-4 border-2 border-gray-300 border-t-gray-600"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:43,columnNumber:15},void 0),g.jsxDEV("span",{className:"text-gray-600",children:"Checking..."},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:44,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:42,columnNumber:13},void 0):g.jsxDEV(bt.Fragment,{children:[g.jsxDEV("svg",{className:`h-4 w-4 ${T.isOperational?"text-green-500":"text-red-500"}`,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:T.isOperational?g.jsxDEV("polyline",{points:"20 6 9 17 4 12"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:58,columnNumber:19},void 0):g.jsxDEV("line",{x1:"18",y1:"6",x2:"6",y2:"18"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:60,columnNumber:19},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:48,columnNumber:15},void 0),g.jsxDEV("span",{className:T.isOperational?"text-green-600":"text-red-600",children:T.isOperational?"Operational":"Offline"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:63,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:47,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:40,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:38,columnNumber:7},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/VPNStatus/index.jsx",lineNumber:8,columnNumber:5},void 0)},c0=({version:M="v2.5.1"})=>g.jsxDEV("div",{className:"mt-6 text-center",children:g.jsxDEV("p",{className:"text-xs text-gray-500",children:["OpenVPN • ",M]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DrawerFooter/index.jsx",lineNumber:6,columnNumber:7},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DrawerFooter/index.jsx",lineNumber:5,columnNumber:5},void 0),f0=()=>{const{isAuthenticated:M,email:T,token:I}=dm(),oe=kS();return g.jsxDEV("div",{className:"w-128 h-screen bg-gray-50 border-r border-gray-200 p-6 fixed left-0 top-0",children:g.jsxDEV("div",{className:"flex flex-col h-full",children:[g.jsxDEV(r0,{},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:21,columnNumber:9},void 0),g.jsxDEV(i0,{isAuthenticated:M,email:T},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:24,columnNumber:9},void 0),M&&g.jsxDEV(bt.Fragment,{children:[g.jsxDEV(s0,{pollingInterval:1e4},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:29,columnNumber:13},void 0),g.jsxDEV(t0,{isConnected:oe.connected,clientIp:oe.clientIp},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:32,columnNumber:13},void 0),oe.connected&&g.jsxDEV(n0,{isConnected:oe.connected},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:39,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:27,columnNumber:11},void 0),g.jsxDEV(l0,{isAuthenticated:M,token:I},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:45,columnNumber:9},void 0),g.jsxDEV(c0,{},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:48,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:19,columnNumber:7},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Drawer/index.jsx",lineNumber:18,columnNumber:5},void 0)},OS=({href:M,children:T})=>g.jsxDEV("a",{href:M,className:"download-link",children:T},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/DownloadLink/index.jsx",lineNumber:4,columnNumber:3},void 0),Er=({title:M,children:T})=>g.jsxDEV("div",{className:"instruction-card",children:[g.jsxDEV("h3",{children:M},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/InstructionCard/index.jsx",lineNumber:5,columnNumber:5},void 0),T]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/InstructionCard/index.jsx",lineNumber:4,columnNumber:3},void 0),Lu=({children:M})=>g.jsxDEV("pre",{className:"bg-gray-100 p-2 rounded mt-2 overflow-x-auto",children:M},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/CommandBlock/index.jsx",lineNumber:4,columnNumber:3},void 0),d0=()=>{const{isAuthenticated:M}=dm(),[T,I]=bt.useState("windows"),oe={windows:{label:"Windows",content:g.jsxDEV("div",{className:"space-y-6",children:[g.jsxDEV(Er,{title:"Step 1: Download OpenVPN Client",children:g.jsxDEV(OS,{href:"https://openvpn.net/downloads/openvpn-connect-v3-windows.msi",children:"Download OpenVPN Connect for Windows"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:18,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:17,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 2: Install OpenVPN Connect",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Double-click the downloaded MSI file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:25,columnNumber:15},void 0),g.jsxDEV("li",{children:"Follow the installation wizard"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:26,columnNumber:15},void 0),g.jsxDEV("li",{children:"Accept the default settings when prompted"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:27,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:24,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:23,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 3: Import Configuration",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Download your personal client.ovpn file using the button in the left panel"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:33,columnNumber:15},void 0),g.jsxDEV("li",{children:"Double-click the downloaded .ovpn file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:37,columnNumber:15},void 0),g.jsxDEV("li",{children:"OpenVPN Connect will automatically import the configuration"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:38,columnNumber:15},void 0),g.jsxDEV("li",{children:'Click "Connect" to establish the VPN connection'},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:41,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:32,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:31,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:16,columnNumber:9},void 0)},mac:{label:"macOS",content:g.jsxDEV("div",{className:"space-y-6",children:[g.jsxDEV(Er,{title:"Step 1: Download OpenVPN Client",children:g.jsxDEV(OS,{href:"https://openvpn.net/downloads/openvpn-connect-v3-macos.dmg",children:"Download OpenVPN Connect for macOS"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:52,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:51,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 2: Install OpenVPN Connect",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Open the downloaded .dmg file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:59,columnNumber:15},void 0),g.jsxDEV("li",{children:"Drag OpenVPN Connect to the Applications folder"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:60,columnNumber:15},void 0),g.jsxDEV("li",{children:"Launch OpenVPN Connect from Applications"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:61,columnNumber:15},void 0),g.jsxDEV("li",{children:"Allow system extensions if prompted"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:62,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:58,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:57,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Step 3: Import Configuration",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Download your personal client.ovpn file using the button in the left panel"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:68,columnNumber:15},void 0),g.jsxDEV("li",{children:"Open OpenVPN Connect"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:72,columnNumber:15},void 0),g.jsxDEV("li",{children:"Drag and drop the .ovpn file into the OpenVPN Connect window"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:73,columnNumber:15},void 0),g.jsxDEV("li",{children:'Click "Add" to import the profile'},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:76,columnNumber:15},void 0),g.jsxDEV("li",{children:'Click "Connect" to establish the VPN connection'},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:77,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:67,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:66,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:50,columnNumber:9},void 0)},linux:{label:"Linux",content:g.jsxDEV("div",{className:"space-y-6",children:[g.jsxDEV(Er,{title:"Debian/Ubuntu Installation",children:[g.jsxDEV("p",{className:"mb-4",children:"Open terminal and run the following commands:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:88,columnNumber:13},void 0),g.jsxDEV(Lu,{children:`sudo apt update
 sudo apt install openvpn`},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:91,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:87,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Fedora/RHEL Installation",children:[g.jsxDEV("p",{className:"mb-4",children:"Open terminal and run the following commands:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:96,columnNumber:13},void 0),g.jsxDEV(Lu,{children:"sudo dnf install openvpn"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:99,columnNumber:13},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:95,columnNumber:11},void 0),g.jsxDEV(Er,{title:"Import Configuration",children:g.jsxDEV("ol",{className:"list-decimal pl-6 space-y-2",children:[g.jsxDEV("li",{children:"Download your personal client.ovpn file using the button in the left panel"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:104,columnNumber:15},void 0),g.jsxDEV("li",{children:"Move the configuration file to the OpenVPN directory:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:108,columnNumber:15},void 0),g.jsxDEV(Lu,{children:"sudo mv ~/Downloads/client.ovpn /etc/openvpn/client/"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:109,columnNumber:15},void 0),g.jsxDEV("li",{children:"Start the VPN connection:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:112,columnNumber:15},void 0),g.jsxDEV(Lu,{children:"sudo openvpn --config /etc/openvpn/client/client.ovpn"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:113,columnNumber:15},void 0),g.jsxDEV("li",{children:"Or enable it as a system service:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:116,columnNumber:15},void 0),g.jsxDEV(Lu,{children:"sudo systemctl enable --now openvpn-client@client"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:117,columnNumber:15},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:103,columnNumber:13},void 0)},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:102,columnNumber:11},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:86,columnNumber:9},void 0)}};return g.jsxDEV("div",{className:"main-content",children:[g.jsxDEV("img",{src:"dist/images/openvpn_logo.png",alt:"OpenVPN Logo",className:"h-16 w-auto"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:129,columnNumber:7},void 0),g.jsxDEV("h1",{className:"text-2xl font-bold mb-4",children:"OpenVPN Client Portal"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:135,columnNumber:7},void 0),g.jsxDEV("p",{className:"mb-4",children:"To download your VPN configuration:"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:136,columnNumber:7},void 0),g.jsxDEV("ol",{className:"list-decimal pl-6 mb-8 space-y-2",children:[g.jsxDEV("li",{children:"Sign in with your organization account"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:138,columnNumber:9},void 0),g.jsxDEV("li",{children:"Download your personalized OpenVPN configuration file"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:139,columnNumber:9},void 0),g.jsxDEV("li",{children:"Import the configuration into your OpenVPN client"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:140,columnNumber:9},void 0)]},void 0,!0,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:137,columnNumber:7},void 0),M&&g.jsxDEV("div",{className:"mt-8",children:[g.jsxDEV("h2",{className:"text-xl font-semibold mb-6",children:"VPN Setup Instructions"},void 0,!1,{fileName:"/home/abby/workspace/portfolio/apps/web/gcp-ovpn-portal/src/ovpn_portal/static/src/components/Instructions/index.jsx",lineNumber:145,columnNumber:11},void 0),g.jsxDEV("div",{className:"mb-6",children:g.jsxDEV("nav",{className:"flex space-x-4","aria-label":"Tabs",children:Object.entries(oe).map(([ve,{label:W}])=>g.jsxDEV("button",{onClick:()=>I(ve),className:`
                   tab-button 
                   ${T===ve?"active":""}
@@ -1,6 +1,24 @@
-import React from "react";
+import React, { useState } from "react";
+
+// A failed sign-in redirects back to "/?error=<reason>"; read it once and tidy the URL
+const takeLoginError = () => {
+  const params = new URLSearchParams(window.location.search);
+  const error = params.get("error");
+  if (error) {
+    params.delete("error");
+    const query = params.toString();
+    window.history.replaceState(
+      null,
+      "",
+      window.location.pathname + (query ? `?${query}` : "") + window.location.hash
+    );
+  }
+  return error;
+};
 
 export const AuthStatus = ({ isAuthenticated, email }) => {
+  const [loginError] = useState(takeLoginError);
+
   return (
     <div className="bg-white p-4 rounded-lg shadow-sm border border-gray-200 mb-6">
       <div className="text-sm font-medium text-gray-800 mb-2">
@@ -9,6 +27,11 @@ export const AuthStatus = ({ isAuthenticated, email }) => {
       <div className="text-xs text-gray-600">
         {isAuthenticated ? `Signed in: ${email}` : "Not authenticated"}
       </div>
+      {!isAuthenticated && loginError && (
+        <div className="text-xs text-red-600 mt-2" role="alert">
+          Sign-in failed: {loginError}
+        </div>
+      )}
     </div>
   );
 };
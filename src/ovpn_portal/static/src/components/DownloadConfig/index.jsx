@@ -1,6 +1,28 @@
 import React, { useEffect, useRef } from "react";
 import { useGoogleAuth } from "../../hooks/useGoogleAuth";
 
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Poll an issuance job until the certificate is ready
+const waitForJob = async (url, token) => {
+  for (;;) {
+    const response = await fetch(url, {
+      headers: {
+        Authorization: `Bearer ${token}`,
+      },
+    });
+    const job = await response.json();
+
+    if (!response.ok || job.status === "failed") {
+      throw new Error(job.error || "Certificate issuance failed");
+    }
+    if (job.status === "done") {
+      return;
+    }
+    await sleep(Number(response.headers.get("Retry-After") || 2) * 1000);
+  }
+};
+
 export const DownloadConfig = ({ isAuthenticated, token }) => {
   const { renderGoogleButton } = useGoogleAuth();
   const signInDivRef = useRef(null);
@@ -9,11 +31,20 @@ export const DownloadConfig = ({ isAuthenticated, token }) => {
     if (!token) return;
 
     try {
-      const response = await fetch("/vpn/download-config", {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
+      const fetchConfig = () =>
+        fetch("/vpn/download-config", {
+          headers: {
+            Authorization: `Bearer ${token}`,
+          },
+        });
+      let response = await fetchConfig();
+
+      // With asynchronous issuance the first download answers 202 with a job to poll
+      if (response.status === 202) {
+        const job = await response.json();
+        await waitForJob(job.url, token);
+        response = await fetchConfig();
+      }
 
       if (response.ok) {
         const blob = await response.blob();
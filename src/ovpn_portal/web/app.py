@@ -1,7 +1,10 @@
 from flask import Flask
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 
+from ..core.config import Config
 from ..core.logging import setup_logging
+from .extensions import init_extensions
 from .routes.auth import auth_bp
 from .routes.health import health_bp
 from .routes.ui import ui_bp
@@ -20,12 +23,19 @@ def create_app(config_object=None):
     else:
         app.config.update(config_object)
 
+    # Client addresses (used for throttling and logs) come from the trusted proxies
+    if Config.PROXY_HOPS > 0:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=Config.PROXY_HOPS, x_proto=Config.PROXY_HOPS)
+
     # Initialize CORS
     CORS(app)
 
     # Set up logging
     setup_logging(app)  # Add this line
 
+    # Managers are created once so their caches and transports stay warm
+    init_extensions(app)
+
     # Register blueprints
     app.register_blueprint(ui_bp)  # UI routes first (catch-all should be last)
     app.register_blueprint(auth_bp, url_prefix="/auth")
@@ -0,0 +1,125 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+# One year, the longest lifetime caches honour
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Below this size compression saves less than the extra header costs
+MIN_COMPRESS_SIZE = 1024
+_COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml", "image/vnd.microsoft.icon")
+
+
+class StaticAsset:
+    """One file of the frontend build with its precompressed variants.
+
+    ``variants`` maps a content coding (``""`` for none) to the encoded body
+    and its strong ETag; a coding is only kept when it is smaller than the
+    plain file.
+    """
+
+    def __init__(self, data: bytes, mimetype: str):
+        self.mimetype = mimetype
+        self.hash = hashlib.sha256(data).hexdigest()[:16]
+        self.variants = {"": (data, self.hash)}
+        if len(data) >= MIN_COMPRESS_SIZE and mimetype.startswith(_COMPRESSIBLE):
+            encoded = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                encoded["br"] = brotli.compress(data, quality=11)
+            for coding, body in encoded.items():
+                if len(body) < len(data):
+                    self.variants[coding] = (body, f"{self.hash}-{coding}")
+
+    @property
+    def size(self) -> int:
+        return len(self.variants[""][0])
+
+
+class AssetTable:
+    """The frontend build, loaded and compressed once at startup.
+
+    Requests are answered from memory by ``Accept-Encoding`` negotiation
+    (brotli when the optional ``brotli`` package is installed, then gzip)
+    without touching the filesystem. Pages link assets with their content
+    hash in the URL (see ``version``), so those URLs can be cached as
+    immutable.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.assets = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        if root and os.path.isdir(root):
+            self._load(root)
+
+    def _load(self, root) -> None:
+        for directory, _, files in os.walk(root):
+            for filename in files:
+                full_path = os.path.join(directory, filename)
+                path = os.path.relpath(full_path, root).replace(os.sep, "/")
+                with open(full_path, "rb") as f:
+                    data = f.read()
+                mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                self.assets[path] = StaticAsset(data, mimetype)
+
+    def get(self, path: str):
+        return self.assets.get(path)
+
+    def version(self, path: str) -> str:
+        """Return the content hash used to fingerprint ``path``'s URL, or "" if unknown."""
+        asset = self.assets.get(path)
+        return asset.hash if asset is not None else ""
+
+    def response(self, request, asset: StaticAsset) -> Response:
+        """Serve the best encoding the client accepts, or 304 if it already has it."""
+        coding = ""
+        for candidate in ("br", "gzip"):
+            if candidate in asset.variants and request.accept_encodings[candidate]:
+                coding = candidate
+                break
+        body, etag = asset.variants[coding]
+
+        # Only a URL carrying the current hash can never change
+        cache_control = IMMUTABLE if request.args.get("v") == asset.hash else "public, no-cache"
+        headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if coding:
+            headers["Content-Encoding"] = coding
+
+        not_modified = request.if_none_match.contains(etag)
+        if not_modified:
+            response = Response(status=304, headers=headers)
+        else:
+            response = Response(body, mimetype=asset.mimetype, headers=headers)
+        response.set_etag(etag)
+
+        with self._lock:
+            self.requests += 1
+            if not_modified:
+                self.not_modified += 1
+            else:
+                # Saved by compression; 304s are counted separately
+                self.bytes_sent += len(body)
+                self.bytes_saved += asset.size - len(body)
+        return response
+
+    def stats(self) -> dict:
+        return {
+            "assets": len(self.assets),
+            "brotli": brotli is not None,
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "bytes_sent": self.bytes_sent,
+            "bytes_saved": self.bytes_saved,
+        }
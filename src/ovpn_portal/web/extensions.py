@@ -0,0 +1,72 @@
+import os
+
+from flask import current_app
+
+from ..core.auth import AuthManager
+from ..core.config import Config
+from ..core.db import portal_db_path
+from ..core.jobs import JobQueue
+from ..core.ratelimit import SharedRateLimiter
+from ..core.renewal import RenewalScheduler
+from ..core.vpn import VPNManager
+from .assets import AssetTable
+
+
+def init_extensions(app, config=Config):
+    """Create the long-lived managers shared by every request of this app."""
+    app.extensions["vpn_manager"] = vpn_manager = VPNManager(config)
+    app.extensions["auth_manager"] = AuthManager(config, registry=vpn_manager.registry)
+    if vpn_manager.templates.uses_groups and not config.OIDC_ISSUER:
+        app.logger.warning(
+            "PROFILE_TEMPLATES has rules on groups, but Google ID tokens carry no groups claim so they never match;"
+            " set OIDC_ISSUER to a provider that emits one"
+        )
+    if vpn_manager.key_pool is not None:
+        # Each worker fills the pool on its first request, so the first issuance does not pay for keygen
+        app.before_request(vpn_manager.key_pool.start)
+    app.extensions["job_queue"] = job_queue = JobQueue(
+        portal_db_path(config), vpn_manager.ensure_client_certificates, workers=config.ISSUANCE_WORKERS
+    )
+    if config.ISSUANCE_MODE == "async":
+        # Each gunicorn worker starts its threads on its first request, picking up jobs queued before a restart
+        app.before_request(job_queue.start)
+    app.extensions["renewal_scheduler"] = scheduler = RenewalScheduler(
+        vpn_manager,
+        window_days=config.RENEWAL_WINDOW_DAYS,
+        interval=config.RENEWAL_INTERVAL,
+        batch_size=config.RENEWAL_BATCH_SIZE,
+        rate=config.RENEWAL_RATE,
+    )
+    if config.RENEWAL_INTERVAL > 0:
+        # Started from the first request so each gunicorn worker (not the master) runs it
+        app.before_request(scheduler.start)
+    app.extensions["assets"] = AssetTable(config.FRONTEND_DIR)
+    app.extensions["rate_limiter"] = SharedRateLimiter(
+        config.RATE_LIMIT_FILE or os.path.join(config.OPENVPN_DIR, "ratelimit"),
+        rate=config.AUTH_FAILURE_RATE,
+        burst=config.AUTH_FAILURE_BURST,
+    )
+
+
+def get_auth_manager() -> AuthManager:
+    return current_app.extensions["auth_manager"]
+
+
+def get_vpn_manager() -> VPNManager:
+    return current_app.extensions["vpn_manager"]
+
+
+def get_renewal_scheduler() -> RenewalScheduler:
+    return current_app.extensions["renewal_scheduler"]
+
+
+def get_rate_limiter() -> SharedRateLimiter:
+    return current_app.extensions["rate_limiter"]
+
+
+def get_assets() -> AssetTable:
+    return current_app.extensions["assets"]
+
+
+def get_job_queue() -> JobQueue:
+    return current_app.extensions["job_queue"]
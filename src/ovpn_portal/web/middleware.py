@@ -1,9 +1,8 @@
 from functools import wraps
 
-from flask import jsonify, request
+from flask import g, jsonify, request
 
-from ..core.auth import AuthManager
-from ..core.config import Config
+from .extensions import get_auth_manager, get_rate_limiter
 
 
 def require_auth(f):
@@ -13,12 +12,30 @@ def require_auth(f):
         if not auth_header or not auth_header.startswith("Bearer "):
             return jsonify({"error": "No authorization token provided"}), 401
 
+        # Clients that keep failing are turned away before any token work
+        limiter = get_rate_limiter()
+        client_key = request.remote_addr or "unknown"
+        if not limiter.allowed(client_key):
+            return jsonify({"error": "Too many failed authentication attempts"}), 429
+
         token = auth_header.split(" ")[1]
         try:
-            auth_manager = AuthManager(Config)
-            email = auth_manager.verify_token(token)
-            return f(email, *args, **kwargs)
+            email = get_auth_manager().authenticate(token)
         except Exception as e:
+            limiter.consume(client_key)
             return jsonify({"error": str(e)}), 401
 
+        g.auth_token = token
+        return f(email, *args, **kwargs)
+
     return decorated_function
+
+
+def current_claims() -> dict:
+    """Return the profile claims (email, hosted domain, groups) of the request's token.
+
+    Looked up on first use, so only routes that need them pay for it.
+    """
+    if "claims" not in g:
+        g.claims = get_auth_manager().claims(g.auth_token)
+    return g.claims
@@ -1,19 +1,18 @@
 from flask import Blueprint, jsonify, session
 
-from ...core.auth import AuthManager
-from ...core.config import Config
+from ..extensions import get_auth_manager
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
 
 @auth_bp.route("/status")
 def auth_status():
-    auth_manager = AuthManager(Config)
+    auth_manager = get_auth_manager()
     authenticated = False
 
     if session.get("token") is not None:
         try:
-            auth_manager.verify_token(session.get("token"))
+            auth_manager.authenticate(session.get("token"))
             authenticated = True
         except Exception:
             authenticated = False
@@ -1,6 +1,10 @@
-from flask import Blueprint, jsonify
+import hmac
 
+from flask import Blueprint, abort, jsonify, request
+
+from ...core.config import Config
 from ...core.version import get_version
+from ..extensions import get_assets, get_auth_manager, get_job_queue, get_renewal_scheduler, get_vpn_manager
 
 health_bp = Blueprint("health", __name__)
 
@@ -8,3 +12,23 @@ health_bp = Blueprint("health", __name__)
 @health_bp.route("/health")
 def health_check():
     return jsonify({"status": "healthy", "version": get_version()})
+
+
+@health_bp.route("/metrics")
+def metrics():
+    """Cache and pool counters for this worker, plus the shared issuance queue.
+
+    Only served to callers presenting METRICS_TOKEN as a bearer token.
+    """
+    expected = f"Bearer {Config.METRICS_TOKEN}" if Config.METRICS_TOKEN else None
+    if expected is None:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get("Authorization", "").encode(), expected.encode()):
+        return jsonify({"error": "Invalid metrics token"}), 401
+
+    metrics = {"auth": get_auth_manager().stats(), "vpn": get_vpn_manager().stats(), "assets": get_assets().stats()}
+    if Config.ISSUANCE_MODE == "async":
+        metrics["jobs"] = get_job_queue().stats()
+    if Config.RENEWAL_INTERVAL > 0:
+        metrics["renewal"] = get_renewal_scheduler().stats()
+    return jsonify(metrics)
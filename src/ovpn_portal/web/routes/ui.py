@@ -1,21 +1,11 @@
-import os
-
-from flask import (
-    Blueprint,
-    abort,
-    make_response,
-    redirect,
-    render_template,
-    request,
-    send_from_directory,
-    session,
-    url_for,
-)
-from google.auth.transport import requests
-from google.oauth2 import id_token
+import hashlib
 
+from flask import Blueprint, Response, abort, current_app, redirect, render_template, request, session, url_for
+
+from ...core.auth import profile_claims
 from ...core.config import Config
 from ...core.version import get_version
+from ..extensions import get_assets, get_auth_manager
 
 ui_bp = Blueprint("ui", __name__)
 
@@ -28,15 +18,17 @@ def index():
             if not credential:
                 return redirect(url_for("ui.index", error="No credential provided"))
 
-            idinfo = id_token.verify_oauth2_token(credential, requests.Request(), Config.CLIENT_ID)
+            auth_manager = get_auth_manager()
+            idinfo = auth_manager.verify_id_token(credential)
             email = idinfo.get("email", "")
 
             if not email.endswith("@" + Config.ALLOWED_DOMAIN):
                 return redirect(url_for("ui.index", error="Invalid domain"))
+            auth_manager.check_enabled(email)
 
-            # Store in session
+            # Store a portal-issued token so API calls skip Google verification
             session["email"] = email
-            session["token"] = credential
+            session["token"] = auth_manager.issue_session_token(email, profile_claims(idinfo))
 
             # Redirect back to the main page
             return redirect(url_for("ui.index"))
@@ -44,28 +36,44 @@ def index():
         except Exception as e:
             return redirect(url_for("ui.index", error=str(e)))
 
-    # Handle GET request
-    error = request.args.get("error")
-    response = make_response(
-        render_template(
+    # The shell is the same for every visitor; a login ?error= stays in the URL for the client
+    body, etag = _render_shell()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="text/html")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["Cross-Origin-Opener-Policy"] = "same-origin-allow-popups"
+    return response
+
+
+def _render_shell():
+    """Return the rendered SPA shell and its ETag, rendering once per set of values it depends on."""
+    key = (Config.CLIENT_ID, Config.VPN_NETWORK, get_version())
+    shells = current_app.extensions.setdefault("ui_shells", {})
+    shell = shells.get(key)
+    if shell is None:
+        body = render_template(
             "index.html",
             client_id=Config.CLIENT_ID,
             vpn_network=Config.VPN_NETWORK,
             app_version=get_version(),
-            error=error,
-        )
-    )
-    response.headers["Cross-Origin-Opener-Policy"] = "same-origin-allow-popups"
-    return response
+        ).encode()
+        shell = shells[key] = (body, hashlib.sha256(body).hexdigest()[:32])
+    return shell
+
+
+@ui_bp.app_template_global()
+def asset_url(path: str) -> str:
+    """Return the fingerprinted URL of a frontend asset, cacheable as immutable."""
+    return url_for("ui.static_files", path=path, v=get_assets().version(path))
 
 
 @ui_bp.route("/static/<path:path>")
 def static_files(path):
-    """Serve static files from the frontend build directory."""
-    static_dir = Config.FRONTEND_DIR
-    if not static_dir:
-        static_dir = os.path.join(os.path.dirname(__file__), "..", "static", "dist")
-    try:
-        return send_from_directory(static_dir, path)
-    except FileNotFoundError:
-        abort(404)  # Return 404 instead of letting it raise an unhandled exception
+    """Serve the frontend build from memory, precompressed."""
+    asset = get_assets().get(path)
+    if asset is None:
+        abort(404)
+    return get_assets().response(request, asset)
@@ -1,47 +1,187 @@
-import os
-import tempfile
-
-from flask import Blueprint, current_app, jsonify, request, send_file
+from flask import Blueprint, Response, current_app, jsonify, request, url_for
 
 from ...core.config import Config
-from ...core.vpn import VPNManager
-from ..middleware import require_auth
+from ...core.registry import normalize_device
+from ..extensions import get_job_queue, get_vpn_manager
+from ..middleware import current_claims, require_auth
 
 vpn_bp = Blueprint("vpn", __name__, url_prefix="/vpn")
 
 
+def _profile_etag(vpn_manager, email, device="", claims=None):
+    try:
+        return vpn_manager.profile_etag(email, device, claims)
+    except OSError:
+        # Not provisioned yet
+        return None
+
+
+def _device_limit_response(vpn_manager, email, device):
+    """Return a 409 if issuing ``device`` would take the user past MAX_DEVICES, else None."""
+    if not device or vpn_manager.has_client_certificates(email, device):
+        return None
+    if len(vpn_manager.devices(email)) < Config.MAX_DEVICES:
+        return None
+    return jsonify({"error": f"At most {Config.MAX_DEVICES} devices allowed; remove one first"}), 409
+
+
+def _job_response(job):
+    body = {"id": job["id"], "status": job["status"], "error": job["error"]}
+    if job["status"] == "done":
+        body["download_url"] = url_for("vpn.download_config")
+    return body
+
+
 @vpn_bp.route("/download-config")
 @require_auth
 def download_config(email):
     try:
-        vpn_manager = VPNManager(Config)
-        config = vpn_manager.generate_config(email)
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ovpn", delete=False) as temp_file:
-            temp_file.write(config)
-            temp_path = temp_file.name
-
-        # Send file and cleanup after
-        return_value = send_file(
-            temp_path,
-            as_attachment=True,
-            download_name="client.ovpn",
+        device = normalize_device(request.args.get("device", ""))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        vpn_manager = get_vpn_manager()
+
+        # First-time issuance runs in the background so it does not hold this worker
+        if Config.ISSUANCE_MODE == "async" and not device and not vpn_manager.has_client_certificates(email):
+            job = get_job_queue().submit(email)
+            location = url_for("vpn.job_status", job_id=job["id"])
+            response = jsonify(dict(_job_response(job), url=location))
+            response.status_code = 202
+            response.headers["Location"] = location
+            response.headers["Retry-After"] = "2"
+            return response
+
+        limited = _device_limit_response(vpn_manager, email, device)
+        if limited is not None:
+            return limited
+
+        # Unchanged profiles are answered without rendering anything, but only
+        # while their certificate is valid: after a revocation or expiry the
+        # old files still match the client's tag
+        claims = current_claims() if vpn_manager.templates.rules else None
+        etag = None
+        if vpn_manager.has_client_certificates(email, device):
+            etag = _profile_etag(vpn_manager, email, device, claims)
+        if etag is not None and request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        config = vpn_manager.generate_config(email, device, claims)
+        if etag is None:
+            etag = _profile_etag(vpn_manager, email, device, claims)
+
+        # Serve straight from memory; Response sets Content-Length for us
+        response = Response(
+            config.encode(),
             mimetype="application/x-openvpn-profile",
+            headers={
+                "Content-Disposition": f"attachment; filename={device or 'client'}.ovpn",
+                "Cache-Control": "private, no-cache",
+            },
         )
+        if etag is not None:
+            response.set_etag(etag)
+        return response
+
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@vpn_bp.route("/jobs/<job_id>")
+@require_auth
+def job_status(email, job_id):
+    job = get_job_queue().get(job_id)
+    if job is None or job["email"] != email:
+        return jsonify({"error": "Job not found"}), 404
+
+    response = jsonify(_job_response(job))
+    if job["status"] in ("queued", "running"):
+        response.headers["Retry-After"] = "2"
+    return response
+
+
+@vpn_bp.route("/revoke", methods=["POST"])
+@require_auth
+def revoke(email):
+    """Revoke the caller's certificates; admins may name another user, who is then disabled.
+
+    A user revoking their own certificates (e.g. after losing a device) gets
+    new ones on their next download; a user revoked by an admin does not.
+    """
+    data = request.get_json(silent=True) or {}
+    target = data.get("email") or email
+    if target != email and email not in Config.ADMIN_EMAILS:
+        return jsonify({"error": "Not allowed to revoke another user's certificates"}), 403
+
+    try:
+        revoked = get_vpn_manager().revoke_certificates([target], serials=data.get("serials"), disable=target != email)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    return jsonify({"email": target, "revoked": revoked})
+
+
+def _device_response(row):
+    return {
+        "device": row["device"],
+        "serial": row["serial"],
+        "not_after": row["not_after"],
+        "download_url": url_for("vpn.download_config", device=row["device"]),
+    }
 
-        @return_value.call_on_close
-        def cleanup():
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
 
-        return return_value
+@vpn_bp.route("/devices")
+@require_auth
+def list_devices(email):
+    return jsonify({"devices": [_device_response(row) for row in get_vpn_manager().devices(email)]})
+
+
+@vpn_bp.route("/devices", methods=["POST"])
+@require_auth
+def add_device(email):
+    data = request.get_json(silent=True) or {}
+    try:
+        device = normalize_device(data.get("device", ""))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not device:
+        return jsonify({"error": "No device id provided"}), 400
 
+    try:
+        vpn_manager = get_vpn_manager()
+        limited = _device_limit_response(vpn_manager, email, device)
+        if limited is not None:
+            return limited
+        vpn_manager.ensure_client_certificates(email, device)
+        row = vpn_manager.registry.active(email, device)
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    return jsonify(_device_response(row)), 201
+
+
+@vpn_bp.route("/devices/<device>", methods=["DELETE"])
+@require_auth
+def remove_device(email, device):
+    try:
+        device = normalize_device(device)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        revoked = get_vpn_manager().revoke_certificates([email], device=device)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+    if not revoked:
+        return jsonify({"error": "Device not found"}), 404
+    return jsonify({"device": device, "revoked": revoked})
+
 
 @vpn_bp.route("/status")
 def vpn_status():
@@ -75,13 +75,20 @@ def config(mock_env, mock_openvpn_dir):
     config.ALLOWED_DOMAIN = mock_env["ALLOWED_DOMAIN"]
     config.EXTERNAL_IP = mock_env["EXTERNAL_IP"]
     config.OPENVPN_DIR = mock_openvpn_dir
+    # Keep the portal database next to the mock PKI
+    config.PORTAL_DB = None
     config.SECRET_KEY = mock_env["SECRET_KEY"]
     return config
 
 
 @pytest.fixture
-def app(config):
+def app(config, monkeypatch, tmp_path):
     """Create and configure a test application instance."""
+    # The managers resolve their paths once, in create_app, so point them at private copies first
+    monkeypatch.setattr(Config, "OPENVPN_DIR", config.OPENVPN_DIR)
+    monkeypatch.setattr(Config, "PORTAL_DB", str(tmp_path / "portal.db"))
+    monkeypatch.setattr(Config, "RATE_LIMIT_FILE", str(tmp_path / "ratelimit"))
+
     app = create_app()
     # Update both app.config and the config object passed to create_app
     app.config.update(
@@ -190,3 +197,87 @@ def auth_client(client):
         session["email"] = "test@test.com"
         session["token"] = "test-token"
     return client
+
+
+@pytest.fixture
+def certs_server():
+    """Serve JSON documents from a local HTTP server standing in for an issuer."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StandIn:
+        def __init__(self):
+            self.routes = {}
+            self.hits = {}
+            self.delay = 0.0
+
+        def add(self, path, body, max_age=3600):
+            self.routes[path] = (body, max_age)
+            self.hits[path] = 0
+
+        def url(self, path):
+            return f"http://127.0.0.1:{server.server_port}{path}"
+
+    stand_in = StandIn()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in stand_in.routes:
+                self.send_error(404)
+                return
+            time.sleep(stand_in.delay)
+            stand_in.hits[self.path] += 1
+            body, max_age = stand_in.routes[self.path]
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Cache-Control", f"public, max-age={max_age}")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def native_pki(mock_openvpn_dir):
+    """Add an unencrypted CA to the mock easy-rsa PKI so certificates can be signed in-process."""
+    import datetime
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    pki_dir = Path(mock_openvpn_dir) / "easy-rsa" / "pki"
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Test CA")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=3650))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+
+    (pki_dir / "ca.crt").write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    (pki_dir / "private" / "ca.key").write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    (pki_dir / "index.txt").touch()
+    return pki_dir
@@ -0,0 +1,141 @@
+import time
+
+from ovpn_portal.core.cache import ProfileCache, TTLCache
+
+
+def test_ttl_cache_get_set():
+    """Test basic cache hits and misses."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test LRU eviction once the cache is full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expiry():
+    """Test that entries expire after their own ttl."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0.05)
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_ttl_cache_ttl_is_capped():
+    """Test that per-entry ttl never exceeds the cache ttl and non-positive ttl is ignored."""
+    cache = TTLCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1, ttl=3600)
+    cache.set("b", 2, ttl=-1)
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_file_cache_reads_once(tmp_path):
+    """Test that unchanged files are served from memory."""
+    from unittest.mock import patch
+
+    from ovpn_portal.core.cache import FileCache
+
+    path = tmp_path / "ca.crt"
+    path.write_text("CA v1")
+    cache = FileCache()
+
+    assert cache.read(str(path)) == "CA v1"
+    with patch("pathlib.Path.read_text") as mock_read:
+        assert cache.read(str(path)) == "CA v1"
+        mock_read.assert_not_called()
+    assert cache.stats() == {"files": 1, "hits": 1, "misses": 1}
+
+
+def test_file_cache_picks_up_replaced_file(tmp_path):
+    """Test that a rotated file is re-read."""
+    import os
+
+    from ovpn_portal.core.cache import FileCache
+
+    path = tmp_path / "ca.crt"
+    path.write_text("CA v1")
+    cache = FileCache()
+    first = cache.get(str(path))
+
+    replacement = tmp_path / "ca.crt.new"
+    replacement.write_text("CA v2 rotated")
+    os.replace(replacement, path)
+
+    second = cache.get(str(path))
+    assert second.text == "CA v2 rotated"
+    assert second.fingerprint != first.fingerprint
+
+
+def test_profile_cache_matches_version():
+    """Test that a profile is only served for the version it was rendered at."""
+    cache = ProfileCache(maxsize=2)
+    cache.set("a@example.com", "v1", "profile")
+
+    assert cache.get("a@example.com", "v1") == "profile"
+    assert cache.get("a@example.com", "v2") is None
+    cache.invalidate("a@example.com")
+    assert "a@example.com" not in cache
+    assert cache.stats()["hits"] == 1
+
+
+def test_profile_cache_shared_between_workers(tmp_path):
+    """Test that spilled profiles are served by other instances and replaced on a new version."""
+    writer = ProfileCache(spill_dir=tmp_path)
+    reader = ProfileCache(spill_dir=tmp_path)
+    writer.set("a@example.com", "v1", "old profile")
+    writer.set("a@example.com", "v2", "new profile")
+
+    assert "a@example.com" in reader
+    assert reader.get("a@example.com", "v1") is None
+    assert reader.get("a@example.com", "v2") == "new profile"
+    assert len(list(tmp_path.rglob("*.ovpn"))) == 1
+
+    writer.invalidate("a@example.com")
+    assert list(tmp_path.rglob("*.ovpn")) == []
+    assert reader.get("a@example.com", "v2") is None
+
+
+def test_profile_cache_holds_no_descriptors(tmp_path):
+    """Test that spilled profiles are not kept open, however many are cached."""
+    import os
+
+    cache = ProfileCache(maxsize=4, spill_dir=tmp_path)
+    before = len(os.listdir("/proc/self/fd"))
+    for i in range(50):
+        cache.set(f"user{i}@example.com", "v1", f"profile {i}")
+        assert cache.get(f"user{i}@example.com", "v1") == f"profile {i}"
+
+    assert len(os.listdir("/proc/self/fd")) == before
+    assert cache.stats()["size"] == 4
+
+
+def test_profile_cache_keeps_other_writers_temporary_files(tmp_path):
+    """Test that storing a profile does not delete another worker's half-written one."""
+    cache = ProfileCache(spill_dir=tmp_path)
+    cache.set("a@example.com", "v1", "old profile")
+    directory = cache._spill_dir("a@example.com")
+    in_flight = directory / ".v2.ovpn.abc123.tmp"
+    in_flight.write_text("new pro")
+
+    cache.set("a@example.com", "v2", "new profile")
+    assert in_flight.exists()
+    assert sorted(path.name for path in directory.glob("*.ovpn")) == ["v2.ovpn"]
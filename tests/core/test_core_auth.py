@@ -48,3 +48,151 @@ def test_verify_token_verification_error(config):
 
         with pytest.raises(ValueError, match="Token verification failed"):
             auth.verify_token("invalid-token")
+
+
+def test_verify_token_cached_until_exp(config):
+    """Test that verified tokens are served from the cache."""
+    import time
+
+    from ovpn_portal.core.cache import TTLCache
+
+    auth = AuthManager(config, token_cache=TTLCache(maxsize=8, ttl=600))
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.return_value = {
+            "email": f"test@{config.ALLOWED_DOMAIN}",
+            "exp": time.time() + 3600,
+        }
+
+        for _ in range(3):
+            assert auth.verify_token("cached-token") == f"test@{config.ALLOWED_DOMAIN}"
+
+        assert mock_verify.call_count == 1
+        assert auth.token_cache.stats()["hits"] == 2
+        assert "cached-token" not in auth.token_cache
+
+
+def test_verify_token_not_cached_when_expired(config):
+    """Test that tokens at or past exp are never cached."""
+    import time
+
+    from ovpn_portal.core.cache import TTLCache
+
+    auth = AuthManager(config, token_cache=TTLCache(maxsize=8, ttl=600))
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.return_value = {"email": f"test@{config.ALLOWED_DOMAIN}", "exp": time.time() - 1}
+
+        auth.verify_token("expired-token")
+        auth.verify_token("expired-token")
+
+        assert mock_verify.call_count == 2
+        assert len(auth.token_cache) == 0
+
+
+def test_verify_token_cache_respects_domain_change(config):
+    """Test that a cached identity is rejected after ALLOWED_DOMAIN changes."""
+    import time
+
+    from ovpn_portal.core.cache import TTLCache
+
+    auth = AuthManager(config, token_cache=TTLCache(maxsize=8, ttl=600))
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.return_value = {"email": f"test@{config.ALLOWED_DOMAIN}", "exp": time.time() + 3600}
+        auth.verify_token("domain-token")
+
+        config.ALLOWED_DOMAIN = "other.com"
+        with pytest.raises(ValueError, match="Invalid email domain"):
+            auth.verify_token("domain-token")
+
+        assert mock_verify.call_count == 1
+
+
+def test_session_token_round_trip(config):
+    """Test that portal session tokens verify locally without Google."""
+    auth = AuthManager(config)
+    token = auth.issue_session_token(f"test@{config.ALLOWED_DOMAIN}")
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        assert auth.verify_session_token(token) == f"test@{config.ALLOWED_DOMAIN}"
+        assert auth.authenticate(token) == f"test@{config.ALLOWED_DOMAIN}"
+        mock_verify.assert_not_called()
+
+
+def test_session_token_expired(config):
+    """Test that portal session tokens expire after SESSION_TOKEN_TTL."""
+    auth = AuthManager(config)
+    token = auth.issue_session_token(f"test@{config.ALLOWED_DOMAIN}")
+    config.SESSION_TOKEN_TTL = -1
+
+    with pytest.raises(ValueError, match="Session token expired"):
+        auth.authenticate(token)
+
+
+def test_session_token_tampered(config):
+    """Test that a token signed with another key is rejected."""
+    auth = AuthManager(config)
+    token = auth.issue_session_token(f"test@{config.ALLOWED_DOMAIN}")
+    config.SECRET_KEY = "another-key"
+
+    with pytest.raises(ValueError, match="Invalid session token"):
+        auth.verify_session_token(token)
+
+
+def test_authenticate_falls_back_to_google(config):
+    """Test that non-portal tokens are verified as Google ID tokens."""
+    auth = AuthManager(config)
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.return_value = {"email": f"test@{config.ALLOWED_DOMAIN}"}
+
+        assert auth.authenticate("google-id-token") == f"test@{config.ALLOWED_DOMAIN}"
+        mock_verify.assert_called_once()
+
+
+def test_authenticate_skips_negative_cache_on_transport_error(config):
+    """Test that transient key-fetch failures are not remembered."""
+    from google.auth.exceptions import TransportError
+
+    auth = AuthManager(config)
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.side_effect = TransportError("Could not fetch certificates")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Could not fetch certificates"):
+                auth.authenticate("google-id-token")
+
+        assert mock_verify.call_count == 2
+
+
+def test_session_token_carries_profile_claims(config):
+    """Test that hosted domain and groups survive the exchange for a portal token."""
+    from ovpn_portal.core.auth import profile_claims
+
+    auth = AuthManager(config)
+    email = f"test@{config.ALLOWED_DOMAIN}"
+    claims = profile_claims({"email": email, "hd": config.ALLOWED_DOMAIN, "groups": ["eng"], "sub": "1"})
+    token = auth.issue_session_token(email, claims)
+
+    assert auth.authenticate(token) == email
+    assert auth.claims(token) == {"email": email, "hd": config.ALLOWED_DOMAIN, "groups": ["eng"]}
+
+
+def test_authenticate_rejects_disabled_users(config, tmp_path):
+    """Test that a disabled user's otherwise valid token stops working."""
+    from ovpn_portal.core.registry import CertificateRegistry
+
+    registry = CertificateRegistry(tmp_path / "portal.db")
+    auth = AuthManager(config, registry=registry)
+    email = f"test@{config.ALLOWED_DOMAIN}"
+    token = auth.issue_session_token(email)
+
+    registry.disable(email)
+    with pytest.raises(ValueError, match="User has been disabled"):
+        auth.authenticate(token)
+
+    # A fresh manager, as the failure above is remembered for NEGATIVE_CACHE_TTL
+    registry.enable(email)
+    assert AuthManager(config, registry=registry).authenticate(token) == email
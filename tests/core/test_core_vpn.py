@@ -148,9 +148,10 @@ def test_generate_client_certificates_file_operations(config, mock_openvpn_dir):
         # Verify subprocess calls
         assert mock_run.call_count == 2
 
-        # Verify files were copied
-        assert (Path(mock_openvpn_dir) / f"{email}.crt").exists()
-        assert (Path(mock_openvpn_dir) / f"{email}.key").exists()
+        # Verify files were copied into the key store
+        cert_path, key_path = vpn.keys.paths(email)
+        assert cert_path.exists()
+        assert key_path.exists()
 
 
 def test_generate_client_certificates_file_copy_operations(config, mock_openvpn_dir):
@@ -182,8 +183,7 @@ def test_generate_client_certificates_file_copy_operations(config, mock_openvpn_
         vpn._generate_client_certificates(email)
 
         # Verify files were copied to the correct locations
-        dest_cert = Path(config.OPENVPN_DIR) / f"{email}.crt"
-        dest_key = Path(config.OPENVPN_DIR) / f"{email}.key"
+        dest_cert, dest_key = vpn.keys.paths(email)
 
         assert dest_cert.exists()
         assert dest_key.exists()
@@ -316,3 +316,94 @@ remote {{EXTERNAL_IP}} 1194
         # Verify no placeholder remains
         assert "{{" not in config_content
         assert "}}" not in config_content
+
+
+def test_generate_config_reuses_server_material(config, mock_openvpn_dir):
+    """Test that CA and tls-auth material is read once and picked up again after rotation."""
+    import os
+
+    vpn = VPNManager(config)
+    email = "test@example.com"
+    (Path(mock_openvpn_dir) / f"{email}.crt").write_text("client cert")
+    (Path(mock_openvpn_dir) / f"{email}.key").write_text("client key")
+
+    first = vpn.generate_config(email)
+    second = vpn.generate_config(email)
+    assert first == second
+    assert vpn.files.stats()["misses"] == 2
+
+    ca_path = Path(mock_openvpn_dir) / "ca.crt"
+    (Path(mock_openvpn_dir) / "ca.crt.new").write_text("Rotated CA Certificate")
+    os.replace(Path(mock_openvpn_dir) / "ca.crt.new", ca_path)
+
+    rotated = vpn.generate_config(email)
+    assert "Rotated CA Certificate" in rotated
+    assert "Mock CA Certificate" not in rotated
+    assert "client cert" in rotated
+
+
+def test_generate_config_caches_rendered_profile(config, mock_openvpn_dir):
+    """Test that a repeat download is served from the profile cache until the certificate changes."""
+    import os
+
+    vpn = VPNManager(config)
+    email = "test@example.com"
+    (Path(mock_openvpn_dir) / f"{email}.crt").write_text("client cert")
+    (Path(mock_openvpn_dir) / f"{email}.key").write_text("client key")
+
+    first = vpn.generate_config(email)
+    with patch.object(Path, "read_text", side_effect=AssertionError("profile rendered again")):
+        assert vpn.generate_config(email) == first
+    assert vpn.profiles.stats()["hits"] == 1
+
+    (Path(mock_openvpn_dir) / "new.crt").write_text("reissued cert")
+    os.replace(Path(mock_openvpn_dir) / "new.crt", Path(mock_openvpn_dir) / f"{email}.crt")
+    assert "reissued cert" in vpn.generate_config(email)
+
+
+def test_ensure_client_certificates_single_flight(config, mock_openvpn_dir):
+    """Test that concurrent requests for one user generate certificates once."""
+    import threading
+    import time
+
+    vpn = VPNManager(config)
+    email = "new@example.com"
+    calls = []
+
+    def generate(email):
+        calls.append(email)
+        time.sleep(0.2)
+        for ext in [".key", ".crt"]:
+            (Path(mock_openvpn_dir) / f"{email}{ext}").write_text("generated")
+
+    with patch.object(vpn, "_generate_client_certificates", side_effect=generate):
+        threads = [threading.Thread(target=vpn.ensure_client_certificates, args=(email,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert calls == [email]
+    stats = vpn.stats()["issuance_locks"]
+    assert stats["contended"] >= 1
+    assert stats["max_wait_seconds"] > 0
+
+
+def test_generate_config_selects_template_from_claims(config, mock_openvpn_dir, tmp_path):
+    """Test that users in a matching group get their team's template."""
+    import json
+
+    (tmp_path / "split.ovpn").write_text("split tunnel\nremote {{EXTERNAL_IP}}\n<cert>\n{{CLIENT_CERT}}\n</cert>")
+    (tmp_path / "rules.json").write_text(json.dumps([{"template": "split.ovpn", "groups": ["eng"]}]))
+    config.PROFILE_TEMPLATES = str(tmp_path / "rules.json")
+    vpn = VPNManager(config)
+    email = "test@example.com"
+    (Path(mock_openvpn_dir) / f"{email}.crt").write_text("client cert")
+    (Path(mock_openvpn_dir) / f"{email}.key").write_text("client key")
+
+    default = vpn.generate_config(email)
+    split = vpn.generate_config(email, claims={"groups": ["eng"]})
+
+    assert "redirect-gateway def1" in default
+    assert split == f"split tunnel\nremote {config.EXTERNAL_IP}\n<cert>\nclient cert\n</cert>"
+    assert vpn.profile_etag(email) != vpn.profile_etag(email, claims={"groups": ["eng"]})
@@ -0,0 +1,151 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from cryptography import x509
+
+from ovpn_portal.cli.commands.registry import enable, publish_crl, revoke
+from ovpn_portal.core.crl import RevocationList
+from ovpn_portal.core.pki import NativeBackend, format_serial
+from ovpn_portal.core.registry import CertificateRegistry
+from ovpn_portal.core.vpn import VPNManager
+
+
+def _crl_serials(path):
+    crl = x509.load_pem_x509_crl(Path(path).read_bytes())
+    return {format_serial(entry.serial_number) for entry in crl}
+
+
+def test_revoke_publishes_crl_and_updates_index(config, native_pki):
+    """Test that revocation updates the registry, index.txt and both CRL copies."""
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates("a@example.com")
+    vpn.ensure_client_certificates("b@example.com")
+    serial = vpn.registry.active("a@example.com")["serial"]
+
+    assert vpn.revoke_certificates(["a@example.com"]) == [serial]
+    assert vpn.revoke_certificates(["a@example.com"]) == []
+
+    assert _crl_serials(native_pki / "crl.pem") == {serial}
+    assert (Path(config.OPENVPN_DIR) / "crl.pem").read_bytes() == (native_pki / "crl.pem").read_bytes()
+    crl = x509.load_pem_x509_crl((native_pki / "crl.pem").read_bytes())
+    assert crl.is_signature_valid(vpn.native_backend.load_ca()[0].public_key())
+
+    with open(native_pki / "index.txt") as f:
+        lines = [line.split("\t") for line in f.read().splitlines()]
+    assert [fields[0] for fields in lines if fields[3] == serial] == ["R"]
+    assert [fields[0] for fields in lines if fields[3] != serial] == ["V"]
+    assert not vpn.has_client_certificates("a@example.com")
+    assert vpn.has_client_certificates("b@example.com")
+
+
+def test_revocation_list_syncs_other_workers(tmp_path, native_pki):
+    """Test that each worker's CRL includes revocations made by the others."""
+    backend = NativeBackend(native_pki.parent)
+    registry = CertificateRegistry(tmp_path / "portal.db")
+    serials = []
+    for name in ["a@example.com", "b@example.com"]:
+        serials.append(registry.record(name, backend.issue(name))["serial"])
+
+    first = RevocationList(backend, registry, [tmp_path / "crl.pem"])
+    second = RevocationList(backend, registry, [tmp_path / "crl.pem"])
+
+    first.revoke([serials[0]])
+    second.revoke([serials[1]])
+    assert _crl_serials(tmp_path / "crl.pem") == set(serials)
+    assert second.stats()["revoked"] == 2
+
+    first.publish()
+    assert _crl_serials(tmp_path / "crl.pem") == set(serials)
+    crl = x509.load_pem_x509_crl((tmp_path / "crl.pem").read_bytes())
+    assert crl.extensions.get_extension_for_class(x509.CRLNumber).value.crl_number == 3
+
+
+def test_revoke_command(config, native_pki):
+    """Test revoking from the command line."""
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates("a@example.com")
+
+    result = CliRunner().invoke(revoke, ["a@example.com"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "Revoked 1 certificates for 1 users" in result.output
+    assert len(_crl_serials(native_pki / "crl.pem")) == 1
+
+
+def test_refresh_republishes_before_next_update(config, native_pki):
+    """Test that a CRL close to its next update is republished and a fresh one is left alone."""
+    vpn = VPNManager(config)
+    assert vpn.revocation.refresh() is None
+
+    vpn.revocation.days = 1
+    vpn.revocation.publish()
+    first = vpn.revocation.next_update()
+    assert vpn.revocation.refresh(margin_days=0.5) is None
+    assert vpn.revocation.refresh(margin_days=2) is not None
+    assert vpn.revocation.next_update() >= first
+
+
+def test_publish_crl_command(config, native_pki):
+    """Test republishing the CRL from the command line."""
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates("a@example.com")
+    vpn.revoke_certificates(["a@example.com"])
+
+    result = CliRunner().invoke(publish_crl, ["--if-due"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "CRL is up to date" in result.output
+
+    result = CliRunner().invoke(publish_crl, [], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "Published CRL with 1 revoked certificates" in result.output
+
+
+def test_admin_revocation_disables_user(config, native_pki):
+    """Test that a disabled user gets no new certificate until enabled, unlike a plain revocation."""
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates("a@example.com")
+    vpn.ensure_client_certificates("b@example.com")
+
+    vpn.revoke_certificates(["a@example.com"])
+    vpn.ensure_client_certificates("a@example.com")
+    assert vpn.has_client_certificates("a@example.com")
+
+    vpn.revoke_certificates(["b@example.com"], disable=True)
+    with pytest.raises(PermissionError):
+        vpn.ensure_client_certificates("b@example.com")
+    with pytest.raises(PermissionError):
+        vpn.ensure_client_certificates("b@example.com", "phone")
+
+    result = CliRunner().invoke(enable, ["b@example.com"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "Enabled b@example.com" in result.output
+    vpn.ensure_client_certificates("b@example.com")
+    assert vpn.has_client_certificates("b@example.com")
+
+
+def test_revoke_includes_superseded_certificates(config, native_pki):
+    """Test that revocation also covers a renewed user's old, still unexpired certificate."""
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates("a@example.com")
+    old = vpn.registry.active("a@example.com")["serial"]
+    new = vpn.renew_client_certificates("a@example.com")["serial"]
+
+    assert sorted(vpn.revoke_certificates(["a@example.com"], disable=True)) == sorted([old, new])
+    assert _crl_serials(native_pki / "crl.pem") == {old, new}
+    with pytest.raises(PermissionError):
+        vpn.renew_client_certificates("a@example.com")
+
+
+def test_revocation_list_syncs_out_of_order_timestamps(tmp_path, native_pki):
+    """Test that a revocation committed after another worker's, but stamped earlier, still reaches the CRL."""
+    backend = NativeBackend(native_pki.parent)
+    registry = CertificateRegistry(tmp_path / "portal.db")
+    slow, fast = (registry.record(name, backend.issue(name))["serial"] for name in ["a@example.com", "b@example.com"])
+
+    worker = RevocationList(backend, registry, [tmp_path / "crl.pem"])
+    worker.revoke([fast])
+    # Another worker took its timestamp before ``fast`` was revoked but committed after
+    registry.revoke_many([slow], revoked_at=registry.get(fast)["revoked"] - 60)
+
+    worker.publish()
+    assert _crl_serials(tmp_path / "crl.pem") == {slow, fast}
@@ -0,0 +1,93 @@
+import time
+
+from ovpn_portal.core.jobs import JobQueue
+
+
+def test_submit_deduplicates_pending_jobs(tmp_path):
+    """Test that a user has at most one pending job."""
+    queue = JobQueue(tmp_path / "portal.db", handler=lambda email: None, workers=0)
+
+    first = queue.submit("a@example.com")
+    second = queue.submit("a@example.com")
+    other = queue.submit("b@example.com")
+
+    assert first["status"] == "queued"
+    assert second["id"] == first["id"]
+    assert other["id"] != first["id"]
+
+
+def test_run_pending_records_results(tmp_path):
+    """Test that handler success and failure end up in the job status."""
+
+    def handler(email):
+        if email.startswith("bad"):
+            raise RuntimeError("Certificate generation failed")
+
+    queue = JobQueue(tmp_path / "portal.db", handler=handler, workers=0)
+    good = queue.submit("good@example.com")
+    bad = queue.submit("bad@example.com")
+
+    assert queue.run_pending() == 2
+    assert queue.get(good["id"])["status"] == "done"
+    assert queue.get(bad["id"])["status"] == "failed"
+    assert queue.get(bad["id"])["error"] == "Certificate generation failed"
+    assert queue.stats() == {"queued": 0, "running": 0, "done": 1, "failed": 1}
+    assert queue.get("missing") is None
+
+
+def test_jobs_are_shared_between_queues(tmp_path):
+    """Test that a job submitted by one worker can be run by another."""
+    handled = []
+    submitter = JobQueue(tmp_path / "portal.db", handler=handled.append, workers=0)
+    runner = JobQueue(tmp_path / "portal.db", handler=handled.append, workers=0)
+
+    job = submitter.submit("a@example.com")
+    assert runner.run_pending() == 1
+    assert submitter.run_pending() == 0
+    assert handled == ["a@example.com"]
+    assert submitter.get(job["id"])["status"] == "done"
+
+
+def test_abandoned_jobs_are_requeued(tmp_path):
+    """Test that a job whose worker died is retried, then failed after max_attempts."""
+    queue = JobQueue(tmp_path / "portal.db", handler=lambda email: None, workers=0, lease=0, max_attempts=2)
+    job = queue.submit("a@example.com")
+
+    assert queue.claim()["attempts"] == 1
+    time.sleep(0.01)
+    assert queue.claim()["attempts"] == 2
+    time.sleep(0.01)
+    assert queue.claim() is None
+    assert queue.get(job["id"])["status"] == "failed"
+
+
+def test_background_workers_run_jobs(tmp_path):
+    """Test that submitting starts worker threads that process the job."""
+    queue = JobQueue(tmp_path / "portal.db", handler=lambda email: None, workers=1, poll_interval=0.05)
+    try:
+        job = queue.submit("a@example.com")
+        deadline = time.monotonic() + 5
+        while queue.get(job["id"])["status"] != "done" and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert queue.get(job["id"])["status"] == "done"
+    finally:
+        queue.stop()
+
+
+def test_jobs_queued_before_restart_are_run(tmp_path):
+    """Test that a new process runs jobs left in the database without another submit()."""
+    from unittest.mock import patch
+
+    previous = JobQueue(tmp_path / "portal.db", handler=lambda email: None, workers=0)
+    with patch.object(previous, "start"):
+        job = previous.submit("a@example.com")
+
+    queue = JobQueue(tmp_path / "portal.db", handler=lambda email: None, workers=1, poll_interval=0.05)
+    try:
+        queue.start()
+        deadline = time.monotonic() + 5
+        while queue.get(job["id"])["status"] != "done" and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert queue.get(job["id"])["status"] == "done"
+    finally:
+        queue.stop()
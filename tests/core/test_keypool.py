@@ -0,0 +1,111 @@
+import stat
+import time
+
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from ovpn_portal.core.keypool import KeyPool
+from ovpn_portal.core.vpn import VPNManager
+
+
+def _generate():
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def test_key_pool_fill_and_take(tmp_path):
+    """Test that filled keys are handed out once each."""
+    pool = KeyPool(tmp_path / "pool", _generate, size=3, low_water=0)
+
+    assert pool.fill() == 3
+    assert stat.S_IMODE((tmp_path / "pool").stat().st_mode) == 0o700
+    for entry in (tmp_path / "pool").glob("*.pem"):
+        assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+
+    keys = [pool.take() for _ in range(4)]
+    assert all(keys[:3])
+    assert keys[3] is None
+    assert len({key.private_numbers().private_value for key in keys[:3]}) == 3
+    assert pool.stats()["hits"] == 3
+    assert pool.stats()["misses"] == 1
+
+
+def test_key_pool_refills_in_background(tmp_path):
+    """Test that dropping to the low-water mark triggers a refill."""
+    pool = KeyPool(tmp_path / "pool", _generate, size=4, low_water=2, concurrency=2)
+    pool.fill()
+
+    pool.take()
+    pool.take()
+    for _ in range(100):
+        if pool.available() == 4:
+            break
+        time.sleep(0.02)
+
+    assert pool.available() == 4
+    assert pool.stats()["generated"] == 6
+
+
+def test_key_pool_fill_is_exclusive(tmp_path):
+    """Test that a second refiller backs off while one is running."""
+    import fcntl
+    import os
+
+    # low_water=0 keeps take() from starting a background refill of its own
+    pool = KeyPool(tmp_path / "pool", _generate, size=2, low_water=0)
+    pool.fill()
+    pool.take()
+
+    fd = os.open(tmp_path / "pool" / ".refill.lock", os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        assert pool.fill() == 0
+    finally:
+        os.close(fd)
+
+    assert pool.fill() == 1
+
+
+def test_vpn_manager_uses_pooled_key(config, native_pki):
+    """Test that first-time issuance signs a pooled key."""
+    from cryptography import x509
+
+    config.KEY_POOL_SIZE = 2
+    config.KEY_POOL_LOW_WATER = 0
+    vpn = VPNManager(config)
+    vpn.key_pool.generate = _generate
+    vpn.key_pool.fill()
+
+    vpn.ensure_client_certificates("new@example.com")
+
+    cert = x509.load_pem_x509_certificate((native_pki / "issued" / "new@example.com.crt").read_bytes())
+    assert isinstance(cert.public_key(), ec.EllipticCurvePublicKey)
+    assert vpn.stats()["key_pool"]["hits"] == 1
+    assert vpn.key_pool.available() == 1
+
+
+def test_key_pool_is_per_algorithm(config, native_pki):
+    """Test that keys pooled for one CERT_KEY_ALGORITHM are not used after switching to another."""
+    config.KEY_POOL_SIZE = 2
+    config.CERT_KEY_ALGORITHM = "ecdsa"
+    vpn = VPNManager(config)
+    vpn.key_pool.fill()
+    assert vpn.key_pool.available() == 2
+
+    config.CERT_KEY_ALGORITHM = "ed25519"
+    assert VPNManager(config).key_pool.available() == 0
+
+
+def test_key_pool_refill_state_is_per_process(tmp_path, monkeypatch):
+    """Test that a refill inherited from the parent process does not block the child's."""
+    import os
+
+    pool = KeyPool(tmp_path / "pool", _generate, size=2, low_water=0)
+    pool._refilling_pid = os.getpid() + 1
+    pool._started_pid = os.getpid() + 1
+
+    pool.start()
+    for _ in range(100):
+        if pool.available() == 2:
+            break
+        time.sleep(0.05)
+    assert pool.available() == 2
+    assert pool.maybe_refill(force=True)
@@ -0,0 +1,76 @@
+import os
+import stat
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ovpn_portal.cli.commands.migrate import migrate_layout
+from ovpn_portal.core.keystore import KeyStore, write_atomic
+
+
+def test_keystore_write_is_sharded_and_private(tmp_path):
+    """Test the hashed layout, file modes and that no temporary files remain."""
+    store = KeyStore(tmp_path / "clients")
+    cert_path, key_path = store.write("a@example.com", b"cert", b"key")
+
+    assert cert_path.parent == store.shard("a@example.com")
+    assert cert_path.parent.parent.parent == tmp_path / "clients"
+    assert store.shard("a@example.com") != store.shard("b@example.com")
+    assert cert_path.read_bytes() == b"cert"
+    assert stat.S_IMODE(key_path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(cert_path.stat().st_mode) == 0o600
+    assert sorted(os.listdir(cert_path.parent)) == ["a@example.com.crt", "a@example.com.key"]
+    assert store.locate("a@example.com") == (cert_path, key_path)
+    assert store.locate("b@example.com") is None
+
+
+def test_keystore_legacy_fallback_and_migration(tmp_path):
+    """Test that flat-layout users are found, then moved by migrate()."""
+    for name in ["a@example.com", "b@example.com", "server", "ca"]:
+        (tmp_path / f"{name}.crt").write_text(f"{name} cert")
+        (tmp_path / f"{name}.key").write_text(f"{name} key")
+    (tmp_path / "c@example.com.crt").write_text("certificate without a key")
+
+    store = KeyStore(tmp_path / "clients", legacy_dir=tmp_path)
+    assert store.locate("a@example.com") == store.legacy_paths("a@example.com")
+    assert store.legacy_names() == ["a@example.com", "b@example.com"]
+
+    # b was reissued into the store after the flat copy was written
+    store.write("b@example.com", b"new cert", b"new key")
+
+    assert store.migrate() == 2
+    assert store.locate("a@example.com") == store.paths("a@example.com")
+    assert store.paths("a@example.com")[0].read_text() == "a@example.com cert"
+    assert store.paths("b@example.com")[0].read_text() == "new cert"
+    assert not (tmp_path / "a@example.com.crt").exists()
+    assert (tmp_path / "server.crt").exists()
+    assert store.migrate() == 0
+
+
+def test_migrate_layout_command(config, mock_openvpn_dir):
+    """Test the migrate-layout CLI command."""
+    tmp = Path(mock_openvpn_dir)
+    (tmp / "a@example.com.crt").write_text("cert")
+    (tmp / "a@example.com.key").write_text("key")
+    runner = CliRunner()
+
+    result = runner.invoke(migrate_layout, ["--dry-run"], obj={"config": config})
+    assert result.output == "a@example.com\n"
+
+    result = runner.invoke(migrate_layout, obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "Moved 1 users" in result.output
+    assert not (tmp / "a@example.com.crt").exists()
+
+
+def test_write_atomic_concurrent_writers(tmp_path):
+    """Test that threads writing the same path at once each finish with a whole file."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = tmp_path / "crl.pem"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: write_atomic(path, str(i).encode() * 1000, mode=0o644), range(64)))
+
+    assert path.read_bytes() in {str(i).encode() * 1000 for i in range(64)}
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert [entry.name for entry in tmp_path.iterdir()] == ["crl.pem"]
@@ -0,0 +1,46 @@
+import multiprocessing
+import threading
+import time
+
+from ovpn_portal.core.locks import LockStats, file_lock
+
+
+def _hold(path, ready, release):
+    with file_lock(path):
+        ready.set()
+        release.wait(5)
+
+
+def test_file_lock_uncontended(tmp_path):
+    """Test that an uncontended lock is recorded without waiting."""
+    stats = LockStats()
+    with file_lock(tmp_path / "locks" / "a.lock", stats=stats):
+        pass
+
+    assert (tmp_path / "locks" / "a.lock").exists()
+    assert stats.stats()["acquired"] == 1
+    assert stats.stats()["contended"] == 0
+
+
+def test_file_lock_excludes_other_processes(tmp_path):
+    """Test that a lock held by another process makes the caller wait."""
+    path = tmp_path / "a.lock"
+    ready = multiprocessing.Event()
+    release = multiprocessing.Event()
+    holder = multiprocessing.Process(target=_hold, args=(str(path), ready, release))
+    holder.start()
+    try:
+        assert ready.wait(5)
+        stats = LockStats()
+        started = time.monotonic()
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        with file_lock(path, stats=stats):
+            waited = time.monotonic() - started
+    finally:
+        release.set()
+        holder.join(5)
+
+    assert waited >= 0.15
+    assert stats.stats()["contended"] == 1
+    assert stats.stats()["max_wait_seconds"] >= 0.15
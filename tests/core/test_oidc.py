@@ -0,0 +1,172 @@
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from google.auth import crypt, jwt
+
+from ovpn_portal.core.auth import AuthManager
+from ovpn_portal.core.oidc import OIDCProvider, jwk_to_pem
+
+
+def _b64(value: int) -> str:
+    import base64
+
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _rsa_jwk(key, kid):
+    numbers = key.public_key().public_numbers()
+    return {"kty": "RSA", "kid": kid, "use": "sig", "alg": "RS256", "n": _b64(numbers.n), "e": _b64(numbers.e)}
+
+
+def _pem(key):
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+
+@pytest.fixture
+def issuer(certs_server):
+    """Stand up a local OIDC issuer with one RSA signing key."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    issuer_url = certs_server.url("")
+    certs_server.add(
+        "/.well-known/openid-configuration",
+        {"issuer": issuer_url, "jwks_uri": certs_server.url("/jwks")},
+    )
+    certs_server.add("/jwks", {"keys": [_rsa_jwk(key, "key-1")]})
+    certs_server.issuer_url = issuer_url
+    certs_server.keys = {"key-1": key}
+    return certs_server
+
+
+def _token(issuer, kid, email="user@test.com", signer_cls=crypt.RSASigner, **claims):
+    now = int(time.time())
+    payload = {
+        "iss": issuer.issuer_url,
+        "aud": "test-client-id",
+        "email": email,
+        "email_verified": True,
+        "iat": now,
+        "exp": now + 600,
+    }
+    payload.update(claims)
+    signer = signer_cls.from_string(_pem(issuer.keys[kid]), kid)
+    return jwt.encode(signer, payload).decode()
+
+
+def test_verify_uses_cached_discovery_and_jwks(issuer):
+    """Test that repeated verification makes no further requests to the issuer."""
+    provider = OIDCProvider(issuer.issuer_url, "test-client-id")
+
+    for i in range(10):
+        claims = provider.verify(_token(issuer, "key-1", email=f"user{i}@test.com"))
+        assert claims["email"] == f"user{i}@test.com"
+
+    assert issuer.hits["/.well-known/openid-configuration"] == 1
+    assert issuer.hits["/jwks"] == 1
+
+
+def test_unknown_kid_refreshes_jwks_once(issuer):
+    """Test that a rotated key is picked up lazily."""
+    provider = OIDCProvider(issuer.issuer_url, "test-client-id", min_refresh_interval=0)
+    provider.verify(_token(issuer, "key-1"))
+
+    new_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    issuer.keys["key-2"] = new_key
+    # Re-adding the route also resets its hit counter
+    issuer.add("/jwks", {"keys": [_rsa_jwk(issuer.keys["key-1"], "key-1"), _rsa_jwk(new_key, "key-2")]})
+
+    assert provider.verify(_token(issuer, "key-2"))["email"] == "user@test.com"
+    assert provider.verify(_token(issuer, "key-2"))["email"] == "user@test.com"
+    assert issuer.hits["/jwks"] == 1
+
+
+def test_unknown_kid_refresh_is_rate_limited(issuer):
+    """Test that junk kids cannot force a JWKS fetch on every request."""
+    provider = OIDCProvider(issuer.issuer_url, "test-client-id", min_refresh_interval=60)
+    provider.verify(_token(issuer, "key-1"))
+
+    issuer.keys["junk"] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    for _ in range(3):
+        with pytest.raises(ValueError, match="No signing key"):
+            provider.verify(_token(issuer, "junk"))
+
+    assert issuer.hits["/jwks"] == 1
+
+
+def test_verify_rejects_wrong_audience_and_issuer(issuer):
+    """Test that audience and issuer are enforced."""
+    provider = OIDCProvider(issuer.issuer_url, "test-client-id")
+
+    with pytest.raises(Exception, match="audience"):
+        provider.verify(_token(issuer, "key-1", aud="someone-else"))
+    with pytest.raises(ValueError, match="Wrong issuer"):
+        provider.verify(_token(issuer, "key-1", iss="https://evil.example.com"))
+
+
+def test_verify_rejects_unverified_email(issuer):
+    """Test that an email the issuer has not verified is not trusted."""
+    provider = OIDCProvider(issuer.issuer_url, "test-client-id")
+
+    for verified in [False, "false", None]:
+        with pytest.raises(ValueError, match="not verified"):
+            provider.verify(_token(issuer, "key-1", email_verified=verified))
+    assert provider.verify(_token(issuer, "key-1", email_verified="true"))["email"] == "user@test.com"
+
+
+def test_verify_es256(issuer):
+    """Test that EC signing keys are supported."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    numbers = key.public_key().public_numbers()
+    issuer.keys["ec-1"] = key
+    issuer.add(
+        "/jwks",
+        {"keys": [{"kty": "EC", "crv": "P-256", "kid": "ec-1", "x": _b64(numbers.x), "y": _b64(numbers.y)}]},
+    )
+    provider = OIDCProvider(issuer.issuer_url, "test-client-id")
+
+    assert provider.verify(_token(issuer, "ec-1", signer_cls=crypt.ES256Signer))["email"] == "user@test.com"
+
+
+def test_jwk_to_pem_rejects_unknown_key_type():
+    """Test that unsupported JWKs are refused."""
+    with pytest.raises(ValueError, match="Unsupported key type"):
+        jwk_to_pem({"kty": "oct", "k": "c2VjcmV0"})
+
+
+def test_jwk_to_pem_rejects_unverifiable_curves():
+    """Test that EC keys google-auth cannot verify with are refused."""
+    numbers = ec.generate_private_key(ec.SECP384R1()).public_key().public_numbers()
+    with pytest.raises(ValueError, match="Unsupported curve"):
+        jwk_to_pem({"kty": "EC", "crv": "P-384", "x": _b64(numbers.x), "y": _b64(numbers.y)})
+
+
+def test_issuer_outage_is_not_negative_cached(config, issuer):
+    """Test that tokens failing only because the issuer is unreachable are retried."""
+    from unittest.mock import patch
+
+    import requests
+
+    config.OIDC_ISSUER = issuer.issuer_url
+    config.CLIENT_ID = "test-client-id"
+    auth = AuthManager(config)
+    token = _token(issuer, "key-1", email=f"user@{config.ALLOWED_DOMAIN}")
+
+    with patch.object(auth.provider.session, "get", side_effect=requests.ConnectionError("issuer down")):
+        with pytest.raises(ValueError, match="issuer down"):
+            auth.authenticate(token)
+
+    assert auth.authenticate(token) == f"user@{config.ALLOWED_DOMAIN}"
+
+
+def test_auth_manager_uses_oidc_issuer(config, issuer):
+    """Test that AuthManager verifies against the configured issuer."""
+    config.OIDC_ISSUER = issuer.issuer_url
+    config.CLIENT_ID = "test-client-id"
+    auth = AuthManager(config)
+
+    email = auth.verify_token(_token(issuer, "key-1", email=f"user@{config.ALLOWED_DOMAIN}"))
+    assert email == f"user@{config.ALLOWED_DOMAIN}"
@@ -0,0 +1,151 @@
+import stat
+from pathlib import Path
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from ovpn_portal.core.pki import EasyRSABackend, NativeBackend, easyrsa_env
+from ovpn_portal.core.vpn import VPNManager
+
+
+def test_native_backend_issue(native_pki):
+    """Test in-process issuance into the easy-rsa layout."""
+    backend = NativeBackend(native_pki.parent)
+    cert = backend.issue("new@example.com")
+
+    ca_cert = x509.load_pem_x509_certificate((native_pki / "ca.crt").read_bytes())
+    cert.verify_directly_issued_by(ca_cert)
+    assert cert.subject.rfc4514_string() == "CN=new@example.com"
+
+    issued = native_pki / "issued" / "new@example.com.crt"
+    key_path = native_pki / "private" / "new@example.com.key"
+    assert x509.load_pem_x509_certificate(issued.read_bytes()) == cert
+    assert (native_pki / "reqs" / "new@example.com.req").exists()
+    assert stat.S_IMODE(key_path.stat().st_mode) == 0o600
+    assert serialization.load_pem_private_key(key_path.read_bytes(), None).public_key() == cert.public_key()
+
+    fields = (native_pki / "index.txt").read_text().splitlines()[-1].split("\t")
+    assert fields[0] == "V"
+    assert fields[1] == cert.not_valid_after_utc.strftime("%y%m%d%H%M%SZ")
+    assert int(fields[3], 16) == cert.serial_number
+    assert len(fields[3]) % 2 == 0
+    assert fields[5] == "/CN=new@example.com"
+    assert (native_pki / "certs_by_serial" / f"{fields[3]}.pem").exists()
+    assert int((native_pki / "serial").read_text(), 16) == cert.serial_number + 1
+
+
+def test_native_backend_reuses_loaded_ca(native_pki):
+    """Test that the CA is parsed once for many issuances."""
+    from unittest.mock import patch
+
+    backend = NativeBackend(native_pki.parent)
+    backend.issue("one@example.com")
+
+    with patch("cryptography.hazmat.primitives.serialization.load_pem_private_key") as mock_load:
+        backend.issue("two@example.com")
+        mock_load.assert_not_called()
+
+
+def test_native_backend_unavailable_with_encrypted_key(native_pki):
+    """Test that a passphrase-protected CA without a passphrase is reported unavailable."""
+    key_path = native_pki / "private" / "ca.key"
+    key = serialization.load_pem_private_key(key_path.read_bytes(), None)
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.BestAvailableEncryption(b"secret"),
+        )
+    )
+
+    assert not NativeBackend(native_pki.parent).available()
+    assert NativeBackend(native_pki.parent, passphrase="secret").available()
+
+
+def test_vpn_manager_backend_selection(config, mock_openvpn_dir):
+    """Test auto selection falls back to easy-rsa without a usable CA."""
+    vpn = VPNManager(config)
+    assert isinstance(vpn.issuance_backend(), EasyRSABackend)
+
+    config.CERT_BACKEND = "native"
+    assert isinstance(vpn.issuance_backend(), NativeBackend)
+
+
+def test_vpn_manager_native_end_to_end(config, native_pki):
+    """Test that a first download issues certificates without running easy-rsa."""
+    from unittest.mock import patch
+
+    vpn = VPNManager(config)
+    assert isinstance(vpn.issuance_backend(), NativeBackend)
+
+    with patch("subprocess.run") as mock_run:
+        profile = vpn.generate_config("new@example.com")
+        mock_run.assert_not_called()
+
+    cert_path, key_path = vpn.keys.paths("new@example.com")
+    cert_pem = cert_path.read_text()
+    assert stat.S_IMODE(key_path.stat().st_mode) == 0o600
+    assert cert_pem in profile
+
+
+@pytest.mark.parametrize(
+    "algorithm,key_type",
+    [
+        ("rsa", rsa.RSAPublicKey),
+        ("ecdsa", ec.EllipticCurvePublicKey),
+        ("ed25519", ed25519.Ed25519PublicKey),
+    ],
+)
+def test_native_backend_key_algorithms(native_pki, algorithm, key_type):
+    """Test issuing client certificates with each supported key algorithm."""
+    backend = NativeBackend(native_pki.parent, algorithm=algorithm)
+    cert = backend.issue(f"{algorithm}@example.com")
+
+    assert isinstance(cert.public_key(), key_type)
+
+
+def test_native_backend_ed25519_ca(native_pki):
+    """Test signing with an Ed25519 CA, which takes no digest."""
+    import datetime
+
+    from cryptography.x509.oid import NameOID
+
+    key = ed25519.Ed25519PrivateKey.generate()
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Ed25519 CA")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    ca_cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=30))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, None)
+    )
+    (native_pki / "ca.crt").write_bytes(ca_cert.public_bytes(serialization.Encoding.PEM))
+    (native_pki / "private" / "ca.key").write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+
+    cert = NativeBackend(native_pki.parent, algorithm="ed25519").issue("ed@example.com")
+    cert.verify_directly_issued_by(ca_cert)
+
+
+def test_easyrsa_backend_passes_algorithm(mock_openvpn_dir):
+    """Test that easy-rsa is told which algorithm to use."""
+    from unittest.mock import patch
+
+    backend = EasyRSABackend(Path(mock_openvpn_dir) / "easy-rsa", algorithm="ecdsa")
+    with patch("subprocess.run") as mock_run:
+        backend.issue("ec@example.com")
+
+    for call in mock_run.call_args_list:
+        assert call.kwargs["env"]["EASYRSA_ALGO"] == "ec"
+        assert call.kwargs["env"]["EASYRSA_CURVE"] == "prime256v1"
+
+    with pytest.raises(ValueError, match="Unsupported key algorithm"):
+        easyrsa_env("dsa")
@@ -0,0 +1,63 @@
+from click.testing import CliRunner
+
+from ovpn_portal.cli.commands.provision import provision, read_emails
+from ovpn_portal.core.vpn import VPNManager
+
+
+def test_read_emails_plain_and_csv(tmp_path):
+    """Test reading emails from a plain list and from a CSV export."""
+    plain = tmp_path / "users.txt"
+    plain.write_text("# onboarding\na@example.com\n\nb@example.com\na@example.com\n")
+    assert read_emails(plain) == ["a@example.com", "b@example.com"]
+
+    export = tmp_path / "users.csv"
+    export.write_text("name,email\nAlice,a@example.com\nBob,b@example.com\n")
+    assert read_emails(export) == ["a@example.com", "b@example.com"]
+
+
+def test_provision_is_idempotent(config, native_pki, tmp_path):
+    """Test parallel issuance, and that a second run skips provisioned users."""
+    users = tmp_path / "users.txt"
+    users.write_text("a@example.com\nb@example.com\nc@example.com\n")
+    runner = CliRunner()
+
+    result = runner.invoke(provision, ["--file", str(users), "--workers", "2"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "3 issued" in result.output
+    for email in ["a@example.com", "b@example.com", "c@example.com"]:
+        assert VPNManager(config).keys.locate(email) is not None
+    assert len((native_pki / "index.txt").read_text().splitlines()) == 3
+
+    result = runner.invoke(provision, ["d@example.com", "--file", str(users), "--workers", "2"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "1 issued" in result.output
+    assert "3 already provisioned" in result.output
+    assert len((native_pki / "index.txt").read_text().splitlines()) == 4
+
+
+def test_provision_reissues_revoked_users(config, native_pki):
+    """Test that revoked users are reissued and disabled ones are reported as failed."""
+    vpn = VPNManager(config)
+    for email in ["a@example.com", "b@example.com"]:
+        vpn.ensure_client_certificates(email)
+    vpn.revoke_certificates(["a@example.com"])
+    vpn.revoke_certificates(["b@example.com"], disable=True)
+
+    result = CliRunner().invoke(provision, ["a@example.com", "b@example.com", "--workers", "1"], obj={"config": config})
+    assert result.exit_code == 1
+    assert "1 reissued" in result.output
+    assert "1 failed" in result.output
+    assert "b@example.com: failed: " in result.output
+    assert vpn.has_client_certificates("a@example.com")
+
+
+def test_provision_reports_failures(config, mock_openvpn_dir):
+    """Test that failed users are listed and make the command exit non-zero."""
+    from unittest.mock import patch
+
+    with patch("subprocess.run", side_effect=RuntimeError("easyrsa crashed")):
+        result = CliRunner().invoke(provision, ["x@example.com", "--workers", "1"], obj={"config": config})
+
+    assert result.exit_code == 1
+    assert "1 failed" in result.output
+    assert "x@example.com: failed: easyrsa crashed" in result.output
@@ -0,0 +1,55 @@
+import multiprocessing
+
+from ovpn_portal.core.ratelimit import SharedRateLimiter
+
+
+def _consume_in_child(path, results):
+    limiter = SharedRateLimiter(path, rate=0, burst=5)
+    results.put([limiter.consume("1.2.3.4") for _ in range(3)])
+
+
+def test_rate_limiter_burst(tmp_path):
+    """Test that a bucket allows its burst and then refuses."""
+    limiter = SharedRateLimiter(str(tmp_path / "table"), rate=0, burst=3)
+
+    assert [limiter.consume("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    assert not limiter.allowed("1.2.3.4")
+    assert limiter.allowed("5.6.7.8")
+    limiter.close()
+
+
+def test_rate_limiter_refills(tmp_path):
+    """Test that tokens are refilled at the configured rate."""
+    import time
+
+    limiter = SharedRateLimiter(str(tmp_path / "table"), rate=100, burst=1)
+
+    assert limiter.consume("1.2.3.4")
+    assert not limiter.consume("1.2.3.4")
+    time.sleep(0.05)
+    assert limiter.allowed("1.2.3.4")
+    limiter.close()
+
+
+def test_rate_limiter_recycles_slots(tmp_path):
+    """Test that a full table recycles the oldest bucket instead of failing."""
+    limiter = SharedRateLimiter(str(tmp_path / "table"), rate=0, burst=1, slots=2, probe=2)
+
+    for i in range(10):
+        assert limiter.consume(f"10.0.0.{i}")
+    limiter.close()
+
+
+def test_rate_limiter_shared_across_processes(tmp_path):
+    """Test that buckets are shared between worker processes."""
+    path = str(tmp_path / "table")
+    results = multiprocessing.Queue()
+    child = multiprocessing.Process(target=_consume_in_child, args=(path, results))
+    child.start()
+    child.join(10)
+
+    assert results.get(timeout=1) == [True, True, True]
+
+    limiter = SharedRateLimiter(path, rate=0, burst=5)
+    assert [limiter.consume("1.2.3.4") for _ in range(3)] == [True, True, False]
+    limiter.close()
@@ -0,0 +1,127 @@
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ovpn_portal.cli.commands.registry import rebuild_registry
+from ovpn_portal.core.pki import NativeBackend, format_serial
+from ovpn_portal.core.registry import CertificateRegistry, fingerprint
+from ovpn_portal.core.vpn import VPNManager
+
+
+def test_registry_record_and_revoke(tmp_path, native_pki):
+    """Test indexed lookups of valid certificates and revocation."""
+    cert = NativeBackend(native_pki.parent).issue("a@example.com")
+    registry = CertificateRegistry(tmp_path / "portal.db")
+
+    row = registry.record("a@example.com", cert)
+    assert row["serial"] == format_serial(cert.serial_number)
+    assert registry.active("a@example.com")["fingerprint"] == fingerprint(cert)
+    assert registry.active("a@example.com", device="laptop") is None
+    assert registry.active("b@example.com") is None
+
+    assert registry.revoke(row["serial"]) is True
+    assert registry.revoke(row["serial"]) is False
+    assert registry.active("a@example.com") is None
+    assert registry.known("a@example.com")
+    assert registry.stats() == {"valid": 0, "revoked": 1, "expired": 0, "superseded": 0}
+
+
+def test_registry_rebuild_from_index(tmp_path, native_pki):
+    """Test importing an existing PKI from index.txt."""
+    backend = NativeBackend(native_pki.parent)
+    valid = backend.issue("a@example.com")
+    backend.issue("b@example.com")
+    with open(native_pki / "index.txt") as f:
+        lines = f.read().splitlines()
+    lines[1] = "R" + lines[1][1:].replace("\t\t", "\t240101000000Z,keyCompromise\t", 1)
+    lines.append("E\t200101000000Z\t\t0A\tunknown\t/CN=old@example.com")
+    (native_pki / "index.txt").write_text("\n".join(lines) + "\n")
+
+    registry = CertificateRegistry(tmp_path / "portal.db")
+    registry.record("stale@example.com", valid)
+    assert registry.rebuild(native_pki) == 3
+
+    assert registry.active("a@example.com")["fingerprint"] == fingerprint(valid)
+    assert registry.active("b@example.com") is None
+    assert registry.get(lines[1].split("\t")[3])["revoked"] is not None
+    assert [serial for _, serial, _ in registry.revocations_after(0)] == [lines[1].split("\t")[3]]
+    assert registry.get("0a")["status"] == "expired"
+    assert registry.get("0a")["fingerprint"] is None
+    assert registry.for_email("stale@example.com") == []
+
+
+def test_vpn_manager_registers_issued_certificates(config, native_pki):
+    """Test that issuance is recorded and lookups go through the registry."""
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates("new@example.com")
+
+    row = vpn.registry.active("new@example.com")
+    assert row is not None
+    assert row["not_after"] > time.time()
+    assert vpn.has_client_certificates("new@example.com")
+
+    vpn.registry.revoke(row["serial"])
+    assert not vpn.has_client_certificates("new@example.com")
+
+
+def test_vpn_manager_imports_existing_pki(config, native_pki):
+    """Test that an empty registry is filled from index.txt on first use."""
+    NativeBackend(native_pki.parent).issue("old@example.com")
+
+    vpn = VPNManager(config)
+    assert vpn.has_client_certificates("old@example.com")
+    assert vpn.registry.count() == 1
+
+
+def test_rebuild_registry_command(config, native_pki):
+    """Test the rebuild-registry CLI command."""
+    NativeBackend(native_pki.parent).issue("a@example.com")
+
+    result = CliRunner().invoke(rebuild_registry, obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "Imported 1 certificates: 1 valid" in result.output
+    assert (Path(config.OPENVPN_DIR) / "portal.db").exists()
+
+
+def test_client_names_and_devices():
+    """Test device ids and how they are combined with emails into certificate names."""
+    import pytest
+
+    from ovpn_portal.core.registry import client_name, normalize_device, split_client_name
+
+    assert normalize_device(" Laptop ") == "laptop"
+    assert normalize_device("") == ""
+    with pytest.raises(ValueError):
+        normalize_device("../etc")
+
+    assert client_name("a@example.com") == "a@example.com"
+    assert client_name("a@example.com", "phone") == "a@example.com+phone"
+    assert split_client_name("a@example.com+phone") == ("a@example.com", "phone")
+    assert split_client_name("a+vpn@example.com") == ("a+vpn@example.com", "")
+    assert split_client_name("a+vpn@example.com+phone") == ("a+vpn@example.com", "phone")
+
+
+def test_vpn_manager_per_device_certificates(config, native_pki):
+    """Test that each device gets its own certificate and can be revoked alone."""
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+
+    vpn = VPNManager(config)
+    laptop = vpn.generate_config("a@example.com", "laptop")
+    phone = vpn.generate_config("a@example.com", "phone")
+    assert laptop != phone
+
+    cert_path, _ = vpn.keys.paths("a@example.com+phone")
+    cert = x509.load_pem_x509_certificate(cert_path.read_bytes())
+    assert cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value == "a@example.com+phone"
+    assert [row["device"] for row in vpn.devices("a@example.com")] == ["laptop", "phone"]
+
+    assert len(vpn.revoke_certificates(["a@example.com"], device="phone")) == 1
+    assert [row["device"] for row in vpn.devices("a@example.com")] == ["laptop"]
+    assert not vpn.has_client_certificates("a@example.com", "phone")
+
+    # A rebuilt registry recovers the device from the CN
+    registry = CertificateRegistry(Path(config.OPENVPN_DIR) / "rebuilt.db")
+    registry.rebuild(native_pki)
+    assert [row["device"] for row in registry.devices("a@example.com")] == ["laptop"]
@@ -0,0 +1,129 @@
+import fcntl
+import os
+
+from click.testing import CliRunner
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+
+from ovpn_portal.cli.commands.registry import renew
+from ovpn_portal.core.pki import format_serial
+from ovpn_portal.core.renewal import RenewalScheduler
+from ovpn_portal.core.vpn import VPNManager
+
+
+def _expiring_user(config, email, days=10):
+    """Issue a certificate for ``email`` that falls inside the default renewal window."""
+    config.CERT_DAYS = days
+    vpn = VPNManager(config)
+    vpn.ensure_client_certificates(email)
+    return vpn
+
+
+def test_renewal_replaces_expiring_certificates(config, native_pki):
+    """Test that a pass renews expiring certificates, soonest first, and supersedes the old ones."""
+    vpn = _expiring_user(config, "late@example.com", days=20)
+    vpn.native_backend.days = 10
+    vpn.ensure_client_certificates("soon@example.com")
+    vpn.native_backend.days = 365
+    old = vpn.registry.active("soon@example.com")
+
+    scheduler = RenewalScheduler(vpn, window_days=30, batch_size=1, rate=0)
+    assert [row["email"] for row in scheduler.due(limit=10)] == ["soon@example.com", "late@example.com"]
+
+    assert scheduler.run_once() == {"renewed": 1, "superseded": 0, "failed": 0}
+    new = vpn.registry.active("soon@example.com")
+    assert new["serial"] != old["serial"]
+    assert vpn.registry.get(old["serial"])["status"] == "superseded"
+    issued = x509.load_pem_x509_certificate(vpn.keys.paths("soon@example.com")[0].read_bytes())
+    assert format_serial(issued.serial_number) == new["serial"]
+    assert issued.public_bytes(serialization.Encoding.PEM).decode() in vpn.generate_config("soon@example.com")
+    assert [row["email"] for row in scheduler.due(limit=10)] == ["late@example.com"]
+
+    assert scheduler.run_once()["renewed"] == 1
+    assert scheduler.due(limit=10) == []
+    assert scheduler.stats()["renewed"] == 2
+
+
+def test_renewal_pass_is_exclusive(config, native_pki):
+    """Test that a worker skips the pass while another one holds it."""
+    vpn = _expiring_user(config, "a@example.com")
+    scheduler = RenewalScheduler(vpn, rate=0)
+    scheduler.lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd = os.open(scheduler.lock_path, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        assert scheduler.run_once() is None
+    finally:
+        os.close(fd)
+
+
+def test_expired_certificate_is_reissued_on_demand(config, native_pki):
+    """Test that a revoked user gets a new certificate on their next download."""
+    vpn = _expiring_user(config, "a@example.com", days=365)
+    old = vpn.registry.active("a@example.com")
+    vpn.registry.revoke(old["serial"])
+
+    vpn.ensure_client_certificates("a@example.com")
+    assert vpn.registry.active("a@example.com")["serial"] != old["serial"]
+
+
+def test_renew_command(config, native_pki):
+    """Test the renew CLI command, including --dry-run."""
+    _expiring_user(config, "a@example.com")
+    config.CERT_DAYS = 365
+    runner = CliRunner()
+
+    result = runner.invoke(renew, ["--dry-run"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("a@example.com\t")
+
+    result = runner.invoke(renew, ["--rate", "0"], obj={"config": config})
+    assert result.exit_code == 0, result.output
+    assert "Renewed 1 certificates" in result.output
+
+    result = runner.invoke(renew, ["--dry-run"], obj={"config": config})
+    assert result.output == ""
+
+
+def test_renewal_pass_republishes_expiring_crl(config, native_pki):
+    """Test that the pass keeps the CRL from lapsing even when nothing is revoked."""
+    vpn = VPNManager(config)
+    vpn.revocation.days = 1
+    vpn.revocation.publish()
+    published = vpn.revocation.next_update()
+
+    scheduler = RenewalScheduler(vpn, rate=0)
+    vpn.revocation.days = 180
+    assert scheduler.run_once() == {"renewed": 0, "superseded": 0, "failed": 0}
+    assert scheduler.stats()["crl_published"] == 1
+    assert vpn.revocation.next_update() > published
+
+    scheduler.run_once()
+    assert scheduler.stats()["crl_published"] == 1
+
+
+def test_failed_renewals_back_off(config, native_pki, monkeypatch):
+    """Test that a certificate whose renewal failed does not hold up the next batch."""
+    vpn = _expiring_user(config, "broken@example.com", days=5)
+    vpn.native_backend.days = 10
+    vpn.ensure_client_certificates("fine@example.com")
+    vpn.native_backend.days = 365
+
+    renew = vpn.renew_client_certificates
+
+    def failing_renew(email, device=""):
+        if email == "broken@example.com":
+            raise RuntimeError("CA unavailable")
+        return renew(email, device)
+
+    monkeypatch.setattr(vpn, "renew_client_certificates", failing_renew)
+    scheduler = RenewalScheduler(vpn, batch_size=1, rate=0)
+
+    assert scheduler.run_once() == {"renewed": 0, "superseded": 0, "failed": 1}
+    assert scheduler.run_once() == {"renewed": 1, "superseded": 0, "failed": 0}
+    assert scheduler.due(limit=10) == []
+
+    serial = vpn.registry.active("broken@example.com")["serial"]
+    vpn.registry.defer_renewal(serial, 0)
+    assert [(row["email"], row["renewal_attempts"]) for row in scheduler.due()] == [("broken@example.com", 2)]
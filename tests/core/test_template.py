@@ -0,0 +1,103 @@
+import os
+from unittest.mock import patch
+
+from ovpn_portal.core.template import CompiledTemplate, TemplateFile
+
+
+def test_compiled_template_render():
+    """Test single-pass rendering of all placeholders."""
+    template = CompiledTemplate("remote {{EXTERNAL_IP}} 1194\n<ca>\n{{CA_CERT}}\n</ca>\n{{CA_CERT}}")
+
+    assert template.names == ["EXTERNAL_IP", "CA_CERT", "CA_CERT"]
+    assert template.render({"EXTERNAL_IP": "1.2.3.4", "CA_CERT": "CA"}) == "remote 1.2.3.4 1194\n<ca>\nCA\n</ca>\nCA"
+
+
+def test_compiled_template_keeps_unknown_placeholders():
+    """Test that placeholders without a value are left untouched."""
+    template = CompiledTemplate("a {{KNOWN}} b {{UNKNOWN}}")
+
+    assert template.render({"KNOWN": "x"}) == "a x b {{UNKNOWN}}"
+
+
+def test_compiled_template_version_tracks_content():
+    """Test that the version changes with the template text."""
+    assert CompiledTemplate("a").version == CompiledTemplate("a").version
+    assert CompiledTemplate("a").version != CompiledTemplate("b").version
+
+
+def test_template_file_compiles_once(tmp_path):
+    """Test that an unchanged template file is not read again."""
+    path = tmp_path / "client.ovpn"
+    path.write_text("remote {{EXTERNAL_IP}}")
+    template_file = TemplateFile(path)
+
+    first = template_file.get()
+    with patch("pathlib.Path.read_text") as mock_read:
+        assert template_file.get() is first
+        mock_read.assert_not_called()
+
+
+def test_template_file_reloads_on_mtime_change(tmp_path):
+    """Test that editing the template is picked up."""
+    path = tmp_path / "client.ovpn"
+    path.write_text("remote {{EXTERNAL_IP}}")
+    template_file = TemplateFile(path)
+    first = template_file.get()
+
+    path.write_text("remote {{EXTERNAL_IP}} 443")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = template_file.get()
+    assert second is not first
+    assert second.render({"EXTERNAL_IP": "1.2.3.4"}) == "remote 1.2.3.4 443"
+
+
+def test_compiled_template_partial():
+    """Test pre-rendering some placeholders and rendering the rest later."""
+    template = CompiledTemplate("{{A}}-{{B}}-{{A}}-{{C}}")
+    partial = template.partial({"A": "a", "C": "c"})
+
+    assert partial.names == ["B"]
+    assert partial.version == template.version
+    assert partial.render({"B": "b"}) == template.render({"A": "a", "B": "b", "C": "c"}) == "a-b-a-c"
+
+
+def test_template_registry_selects_first_matching_rule(tmp_path):
+    """Test that rules match on hosted domain, groups and email pattern in file order."""
+    import json
+
+    from ovpn_portal.core.template import TemplateRegistry
+
+    for name in ["default", "split", "tcp", "contractors"]:
+        (tmp_path / f"{name}.ovpn").write_text(name)
+    rules = [
+        {"template": "contractors.ovpn", "email": "*@contractors.example.com"},
+        {"template": "split.ovpn", "hd": "example.com", "groups": ["eng"]},
+        {"template": "tcp.ovpn", "groups": "travel"},
+    ]
+    (tmp_path / "rules.json").write_text(json.dumps(rules))
+    registry = TemplateRegistry.load(tmp_path / "rules.json", TemplateFile(tmp_path / "default.ovpn"))
+
+    def select(**claims):
+        return registry.select(claims).get().render({})
+
+    assert select(email="a@example.com", hd="example.com", groups=["eng", "travel"]) == "split"
+    assert select(email="a@example.com", hd="example.com", groups=["travel"]) == "tcp"
+    assert select(email="b@contractors.example.com", groups=["eng"]) == "contractors"
+    assert select(email="c@example.com", hd="example.com") == "default"
+
+
+def test_template_registry_rejects_unknown_keys(tmp_path):
+    """Test that a mistyped rule fails when the rules are loaded."""
+    import json
+
+    import pytest
+
+    from ovpn_portal.core.template import TemplateRegistry
+
+    (tmp_path / "split.ovpn").write_text("split")
+    (tmp_path / "rules.json").write_text(json.dumps([{"template": "split.ovpn", "group": "eng"}]))
+
+    with pytest.raises(ValueError, match="group"):
+        TemplateRegistry.load(tmp_path / "rules.json", TemplateFile(tmp_path / "split.ovpn"))
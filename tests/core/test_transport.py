@@ -0,0 +1,140 @@
+import datetime
+import time
+
+import pytest
+
+from ovpn_portal.core.transport import CachedCertsRequest, get_certs_request, parse_max_age
+
+
+@pytest.fixture
+def signing_key():
+    """Create an RSA key and self-signed certificate like Google's certs endpoint serves."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "stand-in")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    return key_pem, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+def test_parse_max_age():
+    """Test Cache-Control parsing."""
+    assert parse_max_age({"Cache-Control": "public, max-age=19817, must-revalidate"}) == 19817
+    assert parse_max_age({"Cache-Control": "public, max-age=100", "Age": "40"}) == 60
+    assert parse_max_age({"Cache-Control": "no-store"}) == 0
+    assert parse_max_age({}, default=5) == 5
+
+
+def test_cached_certs_request_hit_rate(certs_server):
+    """Test that repeated fetches are served from memory."""
+    certs_server.add("/certs", {"kid": "cert"}, max_age=3600)
+    certs_server.delay = 0.05
+    request = CachedCertsRequest()
+
+    started = time.monotonic()
+    for _ in range(20):
+        response = request(certs_server.url("/certs"))
+    elapsed = time.monotonic() - started
+
+    assert response.status == 200
+    assert certs_server.hits["/certs"] == 1
+    stats = request.stats()
+    assert stats["hits"] == 19
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.95)
+    assert stats["saved_seconds"] >= 19 * 0.05 * 0.9
+    assert elapsed < 20 * 0.05
+    request.close()
+
+
+def test_cached_certs_request_refreshes_in_background(certs_server):
+    """Test that entries close to expiry are refreshed without blocking the caller."""
+    certs_server.add("/certs", {"kid": "cert"}, max_age=2)
+    request = CachedCertsRequest(refresh_margin=1.9)
+
+    request(certs_server.url("/certs"))
+    time.sleep(0.2)
+    certs_server.delay = 0.3
+
+    started = time.monotonic()
+    request(certs_server.url("/certs"))
+    assert time.monotonic() - started < 0.3
+
+    for _ in range(50):
+        if request.refreshes:
+            break
+        time.sleep(0.05)
+
+    assert request.refreshes == 1
+    assert certs_server.hits["/certs"] == 2
+    request.close()
+
+
+def test_cached_certs_request_does_not_cache_errors(certs_server):
+    """Test that failed fetches are retried on the next call."""
+    request = CachedCertsRequest()
+
+    assert request(certs_server.url("/missing")).status == 404
+    assert request(certs_server.url("/missing")).status == 404
+    assert request.stats()["misses"] == 2
+    assert request.stats()["errors"] == 2
+    request.close()
+
+
+def test_verify_token_against_stand_in_certs(certs_server, signing_key):
+    """Test real signature verification against locally served certificates."""
+    from google.auth import crypt, jwt
+    from google.oauth2 import id_token
+
+    key_pem, cert_pem = signing_key
+    certs_server.add("/certs", {"stand-in-kid": cert_pem})
+    signer = crypt.RSASigner.from_string(key_pem, "stand-in-kid")
+    now = int(time.time())
+    token = jwt.encode(
+        signer,
+        {"iss": "https://accounts.google.com", "aud": "test-client-id", "iat": now, "exp": now + 600},
+    )
+
+    request = CachedCertsRequest()
+    for _ in range(5):
+        claims = id_token.verify_token(token, request, "test-client-id", certs_url=certs_server.url("/certs"))
+        assert claims["aud"] == "test-client-id"
+
+    assert certs_server.hits["/certs"] == 1
+    assert request.stats()["hits"] == 4
+    request.close()
+
+
+def test_get_certs_request_is_process_wide():
+    """Test that the default transport is shared."""
+    assert get_certs_request() is get_certs_request()
+
+
+def test_cached_certs_request_idle_entries_are_not_refreshed(certs_server):
+    """Test that a worker with no traffic stops refreshing certificates."""
+    certs_server.add("/certs", {"kid": "cert"}, max_age=2)
+    request = CachedCertsRequest(refresh_margin=1.8)
+
+    request(certs_server.url("/certs"))
+    time.sleep(0.5)
+
+    assert request.refreshes == 0
+    assert certs_server.hits["/certs"] == 1
+    assert not request._timers
+    request.close()
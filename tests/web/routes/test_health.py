@@ -5,3 +5,30 @@ def test_health_check(client):
     data = response.get_json()
     assert data["status"] == "healthy"
     assert "version" in data
+
+
+def test_metrics(client, monkeypatch):
+    """Test that cache and pool counters are exposed."""
+    from ovpn_portal.core.config import Config
+
+    monkeypatch.setattr(Config, "METRICS_TOKEN", "scrape-secret")
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert "hits" in data["auth"]["token_cache"]
+    assert "evictions" in data["auth"]["failed_tokens"]
+    assert "hit_rate" in data["auth"]["signing_certs"]
+    assert "server_files" in data["vpn"]
+    assert "key_pool" in data["vpn"]
+
+
+def test_metrics_requires_token(client, monkeypatch):
+    """Test that /metrics is hidden without a token and refuses a wrong one."""
+    from ovpn_portal.core.config import Config
+
+    monkeypatch.setattr(Config, "METRICS_TOKEN", None)
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setattr(Config, "METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
@@ -170,10 +170,14 @@ def test_index_post_valid_email_session(monkeypatch, client, config):
         assert response.status_code == 302
         assert "error" not in response.location
 
-        # Verify session was set correctly
+        # Verify session holds a portal token instead of the Google credential
         with client.session_transaction() as sess:
             assert sess["email"] == valid_email
-            assert sess["token"] == test_token
+            assert sess["token"] != test_token
+            session_token = sess["token"]
+
+        auth_manager = client.application.extensions["auth_manager"]
+        assert auth_manager.verify_session_token(session_token) == valid_email
 
 
 def test_static_files_file_not_found(client, monkeypatch):
@@ -199,3 +203,66 @@ def test_static_files_with_empty_static_dir(client, monkeypatch):
 
     response = client.get("/static/test.txt")
     assert response.status_code == 404
+
+
+def test_static_files_served_precompressed(client):
+    """Test that assets are negotiated by Accept-Encoding and served with strong ETags."""
+    import gzip
+
+    plain = client.get("/static/index.js")
+    compressed = client.get("/static/index.js", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.status_code == 200
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(compressed.data) == plain.data
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+    assert not compressed.headers["ETag"].startswith("W/")
+
+    assets = client.application.extensions["assets"]
+    assert assets.stats()["bytes_saved"] == len(plain.data) - len(compressed.data)
+
+    cached = client.get(
+        "/static/index.js", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_static_files_fingerprinted_urls_are_immutable(client):
+    """Test that the page links assets by content hash and those URLs are cached for good."""
+    page = client.get("/").get_data(as_text=True)
+    version = client.application.extensions["assets"].version("index.js")
+    assert f"/static/index.js?v={version}" in page
+
+    assert "immutable" in client.get(f"/static/index.js?v={version}").headers["Cache-Control"]
+    assert client.get("/static/index.js").headers["Cache-Control"] == "public, no-cache"
+
+
+def test_index_shell_rendered_once(client):
+    """Test that the SPA shell is rendered once and revalidated by ETag."""
+    first = client.get("/")
+
+    with patch("ovpn_portal.web.routes.ui.render_template") as mock_render:
+        with_error = client.get("/?error=Invalid+domain")
+        revalidated = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+        mock_render.assert_not_called()
+
+    assert with_error.data == first.data
+    assert revalidated.status_code == 304
+    assert revalidated.headers["Cross-Origin-Opener-Policy"] == "same-origin-allow-popups"
+
+
+def test_login_error_is_shown_by_the_client(client):
+    """Test that a failed login lands on the shell whose bundle reads and shows ?error=."""
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.side_effect = Exception("Verification failed")
+        location = client.post("/", data={"credential": "valid-token"}).location
+
+    page = client.get(location)
+    assert page.status_code == 200
+    assert "/static/index.js" in page.get_data(as_text=True)
+
+    bundle = client.get("/static/index.js").get_data(as_text=True)
+    assert 'get("error")' in bundle
+    assert "Sign-in failed: " in bundle
@@ -62,134 +62,197 @@ def test_vpn_status_invalid_ip(client):
     assert data["client_ip"] == "invalid-ip"
 
 
-def test_download_config_cleanup(app, auth_client, mock_openvpn_dir):
-    """Test download config cleanup functionality."""
-    from unittest.mock import MagicMock, patch
-
-    from flask import send_file
+def test_download_config_served_from_memory(app, auth_client, mock_openvpn_dir):
+    """Test that the profile is streamed from memory with attachment headers."""
+    from unittest.mock import MagicMock
 
     app.config["ALLOWED_DOMAIN"] = "test.com"
 
-    cleanup_handler = None
-    original_send_file = send_file
-
-    def mock_send_file(*args, **kwargs):
-        response = original_send_file(*args, **kwargs)
-        nonlocal cleanup_handler
-
-        def capture_cleanup(func):
-            nonlocal cleanup_handler
-            cleanup_handler = func
-            return func
-
-        response.call_on_close = capture_cleanup
-        return response
-
     with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify, patch(
         "ovpn_portal.core.config.Config.ALLOWED_DOMAIN", "test.com", MagicMock
     ), patch("ovpn_portal.core.config.Config.OPENVPN_DIR", mock_openvpn_dir), patch(
-        "ovpn_portal.web.routes.vpn.os.unlink"
-    ) as mock_unlink, patch(
-        "ovpn_portal.web.routes.vpn.send_file", side_effect=mock_send_file
-    ):
+        "tempfile.NamedTemporaryFile"
+    ) as mock_tempfile, patch(
+        "ovpn_portal.core.vpn.VPNManager.generate_config"
+    ) as mock_generate:
 
-        # Set up auth mock
         mock_verify.return_value = {"email": "test@test.com", "hd": "test.com"}
+        mock_generate.return_value = "test config \u2713"
 
-        # Change this line to patch the correct method name
-        with patch("ovpn_portal.core.vpn.VPNManager.generate_config") as mock_generate:
-            mock_generate.return_value = "test config"
+        response = auth_client.get(
+            "/vpn/download-config",
+            headers={"Authorization": "Bearer valid-token"},
+        )
 
-            # Make request
-            response = auth_client.get(
-                "/vpn/download-config",
-                headers={"Authorization": "Bearer valid-token"},
-            )
+        assert response.status_code == 200
+        assert response.data == "test config \u2713".encode()
+        assert response.headers["Content-Length"] == str(len(response.data))
+        assert response.headers["Content-Disposition"] == "attachment; filename=client.ovpn"
+        mock_tempfile.assert_not_called()
 
-            assert response.status_code == 200
 
-            # Consume the response
-            _ = b"".join(response.response)
-            # Manually execute the cleanup handler
-            if cleanup_handler:
-                cleanup_handler()
+def test_download_config_conditional_get(app, client, mock_openvpn_dir):
+    """Test that a matching If-None-Match gets a 304 without rendering."""
+    from pathlib import Path
 
-            # Now verify cleanup was called
-            mock_unlink.assert_called_once()
+    from ovpn_portal.core.vpn import VPNManager
 
+    email = "test@test.com"
+    (Path(mock_openvpn_dir) / f"{email}.crt").write_text("client cert")
+    (Path(mock_openvpn_dir) / f"{email}.key").write_text("client key")
+    token = app.extensions["auth_manager"].issue_session_token(email)
+    headers = {"Authorization": f"Bearer {token}"}
 
-def test_download_config_cleanup_scenarios(app, auth_client, mock_openvpn_dir):
-    """Test both successful and failed cleanup scenarios."""
-    from unittest.mock import patch
+    with patch("ovpn_portal.core.config.Config.ALLOWED_DOMAIN", "test.com"), patch(
+        "ovpn_portal.core.config.Config.OPENVPN_DIR", mock_openvpn_dir
+    ), patch.object(VPNManager, "generate_config", wraps=app.extensions["vpn_manager"].generate_config) as spy:
+        first = client.get("/vpn/download-config", headers=headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert etag
 
-    from flask import send_file
+        second = client.get("/vpn/download-config", headers={**headers, "If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+        assert spy.call_count == 1
 
-    app.config["ALLOWED_DOMAIN"] = "test.com"
+        (Path(mock_openvpn_dir) / f"{email}.crt").write_text("reissued client cert")
+        third = client.get("/vpn/download-config", headers={**headers, "If-None-Match": etag})
+        assert third.status_code == 200
+        assert third.headers["ETag"] != etag
+        assert b"reissued client cert" in third.data
 
-    cleanup_handler = None
-    original_send_file = send_file
 
-    def mock_send_file(*args, **kwargs):
-        response = original_send_file(*args, **kwargs)
-        nonlocal cleanup_handler
+def test_download_config_async_issuance(client, auth_headers, monkeypatch, tmp_path):
+    """Test that a first download queues a job and answers 202 with its URL."""
+    from ovpn_portal.core.config import Config
 
-        def capture_cleanup(func):
-            nonlocal cleanup_handler
-            cleanup_handler = func
-            return func
+    monkeypatch.setattr(Config, "ISSUANCE_MODE", "async")
+    queue = client.application.extensions["job_queue"]
+    monkeypatch.setattr(queue, "db", type(queue.db)(tmp_path / "portal.db", queue.db.schema))
+    monkeypatch.setattr(queue, "start", lambda: None)
 
-        response.call_on_close = capture_cleanup
-        return response
+    with patch("ovpn_portal.core.auth.AuthManager.verify_token") as mock_auth, patch(
+        "ovpn_portal.core.vpn.VPNManager.has_client_certificates", return_value=False
+    ), patch("ovpn_portal.core.vpn.VPNManager.generate_config") as mock_generate:
+        mock_auth.return_value = "test@example.com"
 
-    # Test Case 1: Successful cleanup
-    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify, patch(
-        "ovpn_portal.core.config.Config.ALLOWED_DOMAIN", "test.com"
-    ), patch("ovpn_portal.core.config.Config.OPENVPN_DIR", mock_openvpn_dir), patch(
-        "ovpn_portal.web.routes.vpn.os.unlink"
-    ) as mock_unlink, patch(
-        "ovpn_portal.web.routes.vpn.send_file", side_effect=mock_send_file
-    ), patch(
-        "ovpn_portal.core.vpn.VPNManager.generate_config"
-    ) as mock_generate:
+        response = client.get("/vpn/download-config", headers=auth_headers)
+        assert response.status_code == 202
+        data = response.get_json()
+        assert data["status"] == "queued"
+        assert response.headers["Location"] == data["url"] == f"/vpn/jobs/{data['id']}"
+        mock_generate.assert_not_called()
 
-        mock_verify.return_value = {"email": "test@test.com", "hd": "test.com"}
-        mock_generate.return_value = "test config"
+        response = client.get(data["url"], headers=auth_headers)
+        assert response.status_code == 200
+        assert response.get_json()["status"] == "queued"
 
-        response = auth_client.get(
-            "/vpn/download-config",
-            headers={"Authorization": "Bearer valid-token"},
-        )
+        queue.handler = lambda email: None
+        queue.run_pending()
+        response = client.get(data["url"], headers=auth_headers)
+        assert response.get_json()["status"] == "done"
+        assert response.get_json()["download_url"] == "/vpn/download-config"
+
+        mock_auth.return_value = "other@example.com"
+        response = client.get(data["url"], headers=auth_headers)
+        assert response.status_code == 404
+
+
+def test_revoke_own_and_other_certificates(client, auth_headers, monkeypatch):
+    """Test that users may revoke their own certificates and only admins anyone else's."""
+    from ovpn_portal.core.config import Config
+
+    with patch("ovpn_portal.core.auth.AuthManager.verify_token") as mock_auth, patch(
+        "ovpn_portal.core.vpn.VPNManager.revoke_certificates"
+    ) as mock_revoke:
+        mock_auth.return_value = "user@test.com"
+        mock_revoke.return_value = ["0A"]
 
+        response = client.post("/vpn/revoke", headers=auth_headers)
         assert response.status_code == 200
-        _ = b"".join(response.response)
+        assert response.get_json() == {"email": "user@test.com", "revoked": ["0A"]}
+        mock_revoke.assert_called_with(["user@test.com"], serials=None, disable=False)
 
-        if cleanup_handler:
-            cleanup_handler()
-        mock_unlink.assert_called_once()
+        response = client.post("/vpn/revoke", headers=auth_headers, json={"email": "other@test.com"})
+        assert response.status_code == 403
 
-    # Test Case 2: Failed cleanup (file already gone)
-    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify, patch(
-        "ovpn_portal.core.config.Config.ALLOWED_DOMAIN", "test.com"
-    ), patch("ovpn_portal.core.config.Config.OPENVPN_DIR", mock_openvpn_dir), patch(
-        "ovpn_portal.web.routes.vpn.os.unlink"
-    ) as mock_unlink, patch(
-        "ovpn_portal.web.routes.vpn.send_file", side_effect=mock_send_file
-    ), patch(
-        "ovpn_portal.core.vpn.VPNManager.generate_config"
-    ) as mock_generate:
+        monkeypatch.setattr(Config, "ADMIN_EMAILS", ["user@test.com"])
+        response = client.post("/vpn/revoke", headers=auth_headers, json={"email": "other@test.com", "serials": ["0a"]})
+        assert response.status_code == 200
+        mock_revoke.assert_called_with(["other@test.com"], serials=["0a"], disable=True)
 
-        mock_verify.return_value = {"email": "test@test.com", "hd": "test.com"}
-        mock_generate.return_value = "test config"
-        mock_unlink.side_effect = FileNotFoundError()  # Simulate file already gone
 
-        response = auth_client.get(
-            "/vpn/download-config",
-            headers={"Authorization": "Bearer valid-token"},
-        )
+def test_device_endpoints(app, client, auth_headers, config, native_pki):
+    """Test issuing, listing, downloading and revoking per-device profiles."""
+    from ovpn_portal.core.vpn import VPNManager
+
+    app.extensions["vpn_manager"] = VPNManager(config)
+
+    with patch("ovpn_portal.core.auth.AuthManager.verify_token") as mock_auth:
+        mock_auth.return_value = "a@test.com"
 
+        response = client.post("/vpn/devices", headers=auth_headers, json={"device": "Laptop"})
+        assert response.status_code == 201
+        assert response.get_json()["device"] == "laptop"
+        assert response.get_json()["download_url"] == "/vpn/download-config?device=laptop"
+
+        assert client.post("/vpn/devices", headers=auth_headers, json={"device": "no/slashes"}).status_code == 400
+
+        response = client.get("/vpn/devices", headers=auth_headers)
+        assert [device["device"] for device in response.get_json()["devices"]] == ["laptop"]
+
+        response = client.get("/vpn/download-config?device=laptop", headers=auth_headers)
         assert response.status_code == 200
-        _ = b"".join(response.response)
+        assert response.headers["Content-Disposition"] == "attachment; filename=laptop.ovpn"
+        assert response.headers["ETag"]
+
+        response = client.delete("/vpn/devices/laptop", headers=auth_headers)
+        assert response.status_code == 200
+        assert len(response.get_json()["revoked"]) == 1
+        assert client.delete("/vpn/devices/laptop", headers=auth_headers).status_code == 404
+        assert client.get("/vpn/devices", headers=auth_headers).get_json() == {"devices": []}
+
+
+def test_download_config_after_revoke_is_not_304(app, client, auth_headers, config, native_pki):
+    """Test that a revoked certificate's ETag no longer answers 304."""
+    from ovpn_portal.core.vpn import VPNManager
+
+    app.extensions["vpn_manager"] = VPNManager(config)
+
+    with patch("ovpn_portal.core.auth.AuthManager.verify_token") as mock_auth:
+        mock_auth.return_value = "a@test.com"
+
+        first = client.get("/vpn/download-config?device=laptop", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        assert client.post("/vpn/revoke", headers=auth_headers).status_code == 200
+
+        response = client.get("/vpn/download-config?device=laptop", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.data != first.data
+
+
+def test_device_limit(app, client, auth_headers, config, native_pki, monkeypatch):
+    """Test that a user cannot hold more than MAX_DEVICES device certificates."""
+    from ovpn_portal.core.config import Config
+    from ovpn_portal.core.vpn import VPNManager
+
+    app.extensions["vpn_manager"] = VPNManager(config)
+    monkeypatch.setattr(Config, "MAX_DEVICES", 1)
+
+    with patch("ovpn_portal.core.auth.AuthManager.verify_token") as mock_auth:
+        mock_auth.return_value = "a@test.com"
+
+        assert client.post("/vpn/devices", headers=auth_headers, json={"device": "laptop"}).status_code == 201
+        assert client.post("/vpn/devices", headers=auth_headers, json={"device": "laptop"}).status_code == 201
+        assert client.get("/vpn/download-config", headers=auth_headers).status_code == 200
+
+        response = client.post("/vpn/devices", headers=auth_headers, json={"device": "phone"})
+        assert response.status_code == 409
+        assert client.get("/vpn/download-config?device=phone", headers=auth_headers).status_code == 409
 
-        if cleanup_handler:
-            cleanup_handler()  # Should not raise an exception
-        mock_unlink.assert_called_once()  # Should still have tried to unlink
+        client.delete("/vpn/devices/laptop", headers=auth_headers)
+        assert client.post("/vpn/devices", headers=auth_headers, json={"device": "phone"}).status_code == 201
@@ -1,11 +1,14 @@
-def test_app_debug_mode(monkeypatch):
+def test_app_debug_mode(monkeypatch, tmp_path):
     """Test serve command in debug mode."""
     from unittest.mock import patch
 
     from flask import Flask
 
+    from ovpn_portal.core.config import Config
     from ovpn_portal.web.app import create_app
 
+    monkeypatch.setattr(Config, "OPENVPN_DIR", str(tmp_path))
+
     app = create_app()
     app.debug = True
 
@@ -14,10 +17,13 @@ def test_app_debug_mode(monkeypatch):
         mock_run.assert_called_once_with(host="localhost", port=8081)
 
 
-def test_create_app_with_config_object():
+def test_create_app_with_config_object(monkeypatch, tmp_path):
     """Test app creation with custom config object."""
+    from ovpn_portal.core.config import Config
     from ovpn_portal.web.app import create_app
 
+    monkeypatch.setattr(Config, "OPENVPN_DIR", str(tmp_path))
+
     test_config = {
         "TESTING": True,
         "CLIENT_ID": "test-id",
@@ -27,3 +33,92 @@ def test_create_app_with_config_object():
     app = create_app(config_object=test_config)
     assert app.config["TESTING"] is True
     assert app.config["CLIENT_ID"] == "test-id"
+
+
+def test_create_app_registers_managers(monkeypatch, tmp_path):
+    """Test that managers are created once per app and reused across requests."""
+    from unittest.mock import patch
+
+    from ovpn_portal.core.auth import AuthManager
+    from ovpn_portal.core.config import Config
+    from ovpn_portal.core.vpn import VPNManager
+    from ovpn_portal.web.app import create_app
+
+    monkeypatch.setattr(Config, "OPENVPN_DIR", str(tmp_path))
+
+    app = create_app()
+    auth_manager = app.extensions["auth_manager"]
+    assert isinstance(auth_manager, AuthManager)
+    assert isinstance(app.extensions["vpn_manager"], VPNManager)
+
+    with patch.object(AuthManager, "__init__") as mock_init, patch.object(
+        AuthManager, "verify_token", return_value="test@test.com"
+    ):
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["token"] = "valid-token"
+        client.get("/auth/status")
+        client.get("/auth/status")
+
+        mock_init.assert_not_called()
+
+
+def test_create_app_fills_key_pool(monkeypatch, tmp_path):
+    """Test that each worker fills the key pool on its first request, not in the master before forking."""
+    import time
+
+    from ovpn_portal.core.config import Config
+    from ovpn_portal.web.app import create_app
+
+    monkeypatch.setattr(Config, "OPENVPN_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "KEY_POOL_SIZE", 2)
+    monkeypatch.setattr(Config, "CERT_KEY_ALGORITHM", "ecdsa")
+    app = create_app()
+    pool = app.extensions["vpn_manager"].key_pool
+    time.sleep(0.1)
+    assert pool.available() == 0
+
+    app.test_client().get("/auth/status")
+
+    for _ in range(100):
+        if pool.available() == 2:
+            break
+        time.sleep(0.05)
+    assert pool.available() == 2
+
+
+def test_create_app_starts_job_workers_in_async_mode(monkeypatch, tmp_path):
+    """Test that any request starts the issuance workers, not only a new submission."""
+    from ovpn_portal.core.config import Config
+    from ovpn_portal.web.app import create_app
+
+    monkeypatch.setattr(Config, "OPENVPN_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "ISSUANCE_MODE", "async")
+    app = create_app()
+    queue = app.extensions["job_queue"]
+    try:
+        app.test_client().get("/health")
+        assert queue._threads
+    finally:
+        queue.stop()
+
+
+def test_create_app_warns_about_group_rules_with_google(monkeypatch, tmp_path, caplog):
+    """Test that group rules are flagged when tokens come from Google, which sends no groups."""
+    import json
+
+    from ovpn_portal.core.config import Config
+    from ovpn_portal.web.app import create_app
+
+    (tmp_path / "eng.ovpn").write_text("remote {{EXTERNAL_IP}}\n")
+    (tmp_path / "rules.json").write_text(json.dumps([{"template": "eng.ovpn", "groups": ["engineering"]}]))
+    monkeypatch.setattr(Config, "OPENVPN_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "PROFILE_TEMPLATES", str(tmp_path / "rules.json"))
+
+    create_app()
+    assert "Google ID tokens carry no groups claim" in caplog.text
+
+    caplog.clear()
+    monkeypatch.setattr(Config, "OIDC_ISSUER", "https://sso.example.com")
+    create_app()
+    assert "groups" not in caplog.text
@@ -18,3 +18,87 @@ def test_require_auth_exception_handling(client):
         )
         assert response.status_code == 401
         assert response.json["error"] == "Verification failed"
+
+
+def test_require_auth_session_token(client):
+    """Test that portal session tokens authenticate without Google verification."""
+    from unittest.mock import patch
+
+    auth_manager = client.application.extensions["auth_manager"]
+    token = auth_manager.issue_session_token("test@test.com")
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify, patch(
+        "ovpn_portal.core.config.Config.ALLOWED_DOMAIN", "test.com"
+    ), patch("ovpn_portal.core.vpn.VPNManager.generate_config", return_value="test config"):
+        response = client.get("/vpn/download-config", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        mock_verify.assert_not_called()
+
+
+def test_require_auth_negative_cache(client):
+    """Test that a rejected token is not verified again."""
+    from unittest.mock import patch
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.side_effect = ValueError("Invalid token")
+
+        for _ in range(3):
+            response = client.get("/vpn/download-config", headers={"Authorization": "Bearer junk-token"})
+            assert response.status_code == 401
+            assert "Invalid token" in response.json["error"]
+
+        assert mock_verify.call_count == 1
+
+
+def test_require_auth_throttles_failing_clients(client):
+    """Test that repeated failures from one address get a 429."""
+    from unittest.mock import patch
+
+    from ovpn_portal.core.config import Config
+
+    with patch("google.oauth2.id_token.verify_oauth2_token") as mock_verify:
+        mock_verify.side_effect = ValueError("Invalid token")
+
+        statuses = [
+            client.get("/vpn/download-config", headers={"Authorization": f"Bearer junk-{i}"}).status_code
+            for i in range(Config.AUTH_FAILURE_BURST + 1)
+        ]
+
+        assert statuses[:-1] == [401] * Config.AUTH_FAILURE_BURST
+        assert statuses[-1] == 429
+        assert mock_verify.call_count == Config.AUTH_FAILURE_BURST
+
+
+def test_require_auth_throttles_by_forwarded_address(config, monkeypatch, tmp_path):
+    """Test that behind a trusted proxy one failing client does not throttle the others."""
+    from unittest.mock import patch
+
+    from ovpn_portal.core.config import Config
+    from ovpn_portal.web.app import create_app
+
+    monkeypatch.setattr(Config, "PROXY_HOPS", 1)
+    monkeypatch.setattr(Config, "RATE_LIMIT_FILE", str(tmp_path / "ratelimit"))
+    client = create_app().test_client()
+
+    def status(address):
+        headers = {"Authorization": "Bearer junk", "X-Forwarded-For": address}
+        return client.get("/vpn/download-config", headers=headers).status_code
+
+    with patch("google.oauth2.id_token.verify_oauth2_token", side_effect=ValueError("Invalid token")):
+        statuses = [status("203.0.113.7") for _ in range(Config.AUTH_FAILURE_BURST + 1)]
+        assert statuses[-1] == 429
+        assert status("203.0.113.8") == 401
+
+
+def test_rate_limit_file_is_not_opened_through_symlink(tmp_path):
+    """Test that a symlink planted at the table path is refused."""
+    import pytest
+
+    from ovpn_portal.core.ratelimit import SharedRateLimiter
+
+    (tmp_path / "target").write_bytes(b"")
+    (tmp_path / "ratelimit").symlink_to(tmp_path / "target")
+
+    with pytest.raises(OSError):
+        SharedRateLimiter(str(tmp_path / "ratelimit"), rate=1, burst=1).allowed("client")